@@ -0,0 +1,116 @@
+import time
+from bench.stub_server import StubServer, StubError
+
+
+class DatabricksStub(StubServer):
+    """In-memory stand-in for the Databricks Jobs 2.1 and Repos 2.0 endpoints the CLI uses.
+
+    Runs started with run-now go PENDING -> RUNNING -> TERMINATED/SUCCESS
+    after ``run_seconds`` of wall-clock time.
+    """
+
+    def __init__(self, config=None, run_seconds=0.5, **kwargs):
+        super().__init__(config, **kwargs)
+        self.run_seconds = run_seconds
+        self.jobs = {}
+        self.workspace_repos = {}
+        self.runs = {}
+        self._next_id = 1000
+
+        for method, template, handler in (
+            ("GET", "/api/2.1/jobs/list", self.list_jobs),
+            ("GET", "/api/2.1/jobs/get", self.get_job),
+            ("POST", "/api/2.1/jobs/create", self.create_job),
+            ("POST", "/api/2.1/jobs/run-now", self.run_now),
+            ("GET", "/api/2.1/jobs/runs/get", self.get_run),
+            ("GET", "/api/2.1/jobs/runs/list", self.list_runs),
+            ("GET", "/api/2.0/repos", self.list_repos),
+            ("POST", "/api/2.0/repos", self.create_repo)
+        ):
+            self.route(method, template, handler)
+
+    def _new_id(self):
+        self._next_id += 1
+        return self._next_id
+
+    def _page(self, request, items, key, default_limit):
+        limit = int(request.arg("limit", default_limit))
+        offset = int(request.arg("page_token", 0))
+        page = {key: items[offset:offset + limit], "has_more": offset + limit < len(items)}
+        if page["has_more"]:
+            page["next_page_token"] = str(offset + limit)
+        return 200, page
+
+    def list_jobs(self, request):
+        name = request.arg("name")
+        with self.lock:
+            jobs = [
+                {"job_id": job_id, "settings": {"name": job["settings"]["name"]}, "created_time": job["created_time"]}
+                for job_id, job in sorted(self.jobs.items())
+                if name is None or job["settings"]["name"] == name
+            ]
+        return self._page(request, jobs, "jobs", 20)
+
+    def get_job(self, request):
+        job_id = int(request.arg("job_id", 0))
+        with self.lock:
+            if job_id not in self.jobs:
+                raise StubError(400, f"Job {job_id} does not exist.")
+            return 200, self.jobs[job_id]
+
+    def create_job(self, request):
+        settings = request.json()
+        with self.lock:
+            job_id = self._new_id()
+            self.jobs[job_id] = {"job_id": job_id, "settings": settings, "created_time": int(time.time() * 1000)}
+        return 200, {"job_id": job_id}
+
+    def _run_json(self, run_id):
+        run = self.runs[run_id]
+        elapsed = time.monotonic() - run["started"]
+        if elapsed >= self.run_seconds:
+            state = {"life_cycle_state": "TERMINATED", "result_state": "SUCCESS"}
+        elif elapsed >= self.run_seconds / 2:
+            state = {"life_cycle_state": "RUNNING"}
+        else:
+            state = {"life_cycle_state": "PENDING"}
+        return {"run_id": run_id, "job_id": run["job_id"], "state": state, "run_page_url": f"{self.url}/#job/{run['job_id']}/run/{run_id}"}
+
+    def run_now(self, request):
+        job_id = request.json().get("job_id")
+        with self.lock:
+            if job_id not in self.jobs:
+                raise StubError(400, f"Job {job_id} does not exist.")
+            run_id = self._new_id()
+            self.runs[run_id] = {"job_id": job_id, "started": time.monotonic()}
+        return 200, {"run_id": run_id, "number_in_job": run_id}
+
+    def get_run(self, request):
+        run_id = int(request.arg("run_id", 0))
+        with self.lock:
+            if run_id not in self.runs:
+                raise StubError(400, f"Run {run_id} does not exist.")
+            return 200, self._run_json(run_id)
+
+    def list_runs(self, request):
+        active_only = request.arg("active_only") == "true"
+        with self.lock:
+            runs = [self._run_json(run_id) for run_id in sorted(self.runs)]
+        if active_only:
+            runs = [run for run in runs if run["state"]["life_cycle_state"] != "TERMINATED"]
+        return self._page(request, runs, "runs", 25)
+
+    def list_repos(self, request):
+        prefix = request.arg("path_prefix", "")
+        with self.lock:
+            repos = [repo for repo in self.workspace_repos.values() if repo["path"].startswith(prefix)]
+        return 200, {"repos": repos}
+
+    def create_repo(self, request):
+        body = request.json()
+        with self.lock:
+            if any(repo["path"] == body["path"] for repo in self.workspace_repos.values()):
+                raise StubError(400, f"{body['path']} already exists.")
+            repo_id = self._new_id()
+            self.workspace_repos[repo_id] = {"id": repo_id, "path": body["path"], "url": body["url"], "provider": body["provider"], "branch": "main"}
+            return 200, self.workspace_repos[repo_id]
@@ -0,0 +1,452 @@
+import io
+import json
+import time
+import hashlib
+import tarfile
+import zipfile
+from base64 import b64decode, b64encode
+from datetime import datetime, timezone
+from nacl import encoding, public
+from bench.stub_server import StubServer, StubError
+
+STUB_LOGIN = "bench-user"
+CONFIG_FILE_PATH = "mlops_config/mlops_config_dev.json"
+WORKFLOW_PATH = ".github/workflows/train_pipeline.yml"
+ARCHIVE_PREFIX = "model_train_infer-main"
+
+
+def git_sha(kind, data):
+    return hashlib.sha1(f"{kind} {len(data)}\0".encode("utf-8") + data).hexdigest()
+
+
+def build_template(file_count=20, file_bytes=2048, binary_every=10):
+    """Synthetic template shaped like the real one: config file, workflow, notebooks and some binaries.
+
+    Returns ``{path: (content, mode)}`` with ``file_count`` files in total.
+    """
+    files = {
+        CONFIG_FILE_PATH: (json.dumps({"env": "dev", "train_job_id": None, "infer_job_id": None}, indent=4).encode("utf-8"), "100644"),
+        WORKFLOW_PATH: (b"name: Train Pipeline\non: [push]\njobs: {}\n", "100644")
+    }
+    for i in range(max(file_count - len(files), 0)):
+        if binary_every and i % binary_every == binary_every - 1:
+            # Non-UTF-8 content, so bulk uploads go through the blob API
+            content = bytes((i + j) % 256 for j in range(file_bytes)) + b"\xff\xfe"
+            files[f"assets/blob_{i:04d}.bin"] = (content, "100644")
+        else:
+            line = f"# cell {i}: print('training step {i}')\n"
+            content = (line * (file_bytes // len(line) + 1))[:file_bytes].encode("utf-8")
+            files[f"notebooks/notebook_{i:04d}.py"] = (content, "100755" if i % 7 == 0 else "100644")
+    return files
+
+
+def template_archives(files):
+    """``(tar_gz, zip)`` archives of the template, wrapped in one folder like GitHub's."""
+    tar_buffer = io.BytesIO()
+    with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar:
+        for path, (content, mode) in files.items():
+            info = tarfile.TarInfo(f"{ARCHIVE_PREFIX}/{path}")
+            info.size = len(content)
+            info.mode = int(mode[-3:], 8)
+            tar.addfile(info, io.BytesIO(content))
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for path, (content, _) in files.items():
+            archive.writestr(f"{ARCHIVE_PREFIX}/{path}", content)
+    return tar_buffer.getvalue(), zip_buffer.getvalue()
+
+
+def _now():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class GitHubStub(StubServer):
+    """In-memory stand-in for the GitHub REST, Git Data and GraphQL endpoints the CLI uses.
+
+    Repos live in a shared content-addressed object store (blobs, flat trees,
+    commits) with per-repo refs, so the Contents API, Git Data API and
+    GraphQL checks all see the same state. The template archive is served
+    from ``/archive/template.tar.gz`` and ``/archive/template.zip``.
+    """
+
+    def __init__(self, config=None, login=STUB_LOGIN, **kwargs):
+        super().__init__(config, **kwargs)
+        self.login = login
+        self.repos = {}
+        self.blobs = {}
+        self.trees = {}
+        self.commits = {}
+        self._secret_key = public.PrivateKey.generate()
+        self.set_template(build_template())
+
+        repo = "/repos/{owner}/{repo}"
+        for method, template, handler in (
+            ("GET", "/user", self.get_user),
+            ("GET", "/user/repos", self.list_repos),
+            ("POST", "/user/repos", self.create_repo),
+            ("GET", repo, self.get_repo),
+            ("GET", repo + "/branches/{branch}", self.get_branch),
+            ("GET", repo + "/contents/{path:.*}", self.get_contents),
+            ("PUT", repo + "/contents/{path:.+}", self.put_contents),
+            ("GET", repo + "/git/refs/heads/{branch:.+}", self.get_ref),
+            ("POST", repo + "/git/refs", self.create_ref),
+            ("PATCH", repo + "/git/refs/heads/{branch:.+}", self.update_ref),
+            ("GET", repo + "/git/commits/{sha}", self.get_commit),
+            ("POST", repo + "/git/commits", self.create_commit),
+            ("GET", repo + "/git/trees/{sha}", self.get_tree),
+            ("POST", repo + "/git/trees", self.create_tree),
+            ("POST", repo + "/git/blobs", self.create_blob),
+            ("GET", repo + "/actions/secrets/public-key", self.get_public_key),
+            ("GET", repo + "/actions/secrets", self.list_secrets),
+            ("PUT", repo + "/actions/secrets/{name}", self.put_secret),
+            ("POST", "/graphql", self.graphql),
+            ("GET", "/archive/template.tar.gz", self.get_tarball),
+            ("GET", "/archive/template.zip", self.get_zipball)
+        ):
+            self.route(method, template, handler)
+
+    # --- state helpers -------------------------------------------------
+
+    def set_template(self, files):
+        with self.lock:
+            self.template_files = files
+            self.tarball, self.zipball = template_archives(files)
+
+    def rate_limit_headers(self, remaining, reset_at):
+        return {
+            "X-RateLimit-Limit": str(self.config.rate_limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(int(reset_at))
+        }
+
+    def _repo(self, owner, name):
+        repo = self.repos.get(name) if owner == self.login else None
+        if repo is None:
+            raise StubError(404)
+        return repo
+
+    def _repo_url(self, name):
+        return f"{self.url}/repos/{self.login}/{name}"
+
+    def _store_blob(self, content):
+        sha = git_sha("blob", content)
+        self.blobs[sha] = content
+        return sha
+
+    def _store_tree(self, entries):
+        sha = git_sha("tree", json.dumps(sorted(entries.items())).encode("utf-8"))
+        self.trees[sha] = dict(entries)
+        return sha
+
+    def _store_commit(self, tree_sha, parents, message):
+        commit = {"tree": tree_sha, "parents": list(parents), "message": message}
+        sha = git_sha("commit", json.dumps(commit).encode("utf-8") + str(time.time_ns()).encode("utf-8"))
+        self.commits[sha] = commit
+        return sha
+
+    def _branch_tree(self, repo, branch):
+        sha = repo["refs"].get(branch)
+        if sha is None:
+            raise StubError(404, "No commit found for the ref")
+        return self.trees[self.commits[sha]["tree"]]
+
+    def _commit_files(self, repo, branch, changes, message):
+        """Commit ``{path: (content, mode)}`` on top of ``branch``; returns the commit SHA."""
+        parent = repo["refs"].get(branch)
+        entries = dict(self.trees[self.commits[parent]["tree"]]) if parent else {}
+        for path, (content, mode) in changes.items():
+            entries[path] = (mode, self._store_blob(content))
+        sha = self._store_commit(self._store_tree(entries), [parent] if parent else [], message)
+        repo["refs"][branch] = sha
+        repo["meta"]["pushed_at"] = repo["meta"]["updated_at"] = _now()
+        return sha
+
+    def _repo_json(self, name):
+        return dict(self.repos[name]["meta"])
+
+    def _commit_json(self, repo_name, sha):
+        commit = self.commits[sha]
+        url = self._repo_url(repo_name)
+        return {
+            "sha": sha,
+            "url": f"{url}/git/commits/{sha}",
+            "message": commit["message"],
+            "tree": {"sha": commit["tree"], "url": f"{url}/git/trees/{commit['tree']}"},
+            "parents": [{"sha": parent, "url": f"{url}/git/commits/{parent}"} for parent in commit["parents"]]
+        }
+
+    def _ref_json(self, repo_name, branch, sha):
+        url = self._repo_url(repo_name)
+        return {
+            "ref": f"refs/heads/{branch}",
+            "url": f"{url}/git/refs/heads/{branch}",
+            "object": {"sha": sha, "type": "commit", "url": f"{url}/git/commits/{sha}"}
+        }
+
+    def _content_json(self, repo_name, path, mode_sha, with_content=True):
+        _, sha = mode_sha
+        content = self.blobs[sha]
+        url = self._repo_url(repo_name)
+        item = {
+            "type": "file",
+            "name": path.rsplit("/", 1)[-1],
+            "path": path,
+            "sha": sha,
+            "size": len(content),
+            "url": f"{url}/contents/{path}"
+        }
+        if with_content:
+            item.update(content=b64encode(content).decode("utf-8"), encoding="base64")
+        return item
+
+    # --- users and repos -----------------------------------------------
+
+    def get_user(self, request):
+        return 200, {"login": self.login, "id": 1, "type": "User", "url": f"{self.url}/users/{self.login}"}
+
+    def list_repos(self, request):
+        per_page = int(request.arg("per_page", 30))
+        page = int(request.arg("page", 1))
+        with self.lock:
+            repos = sorted((self._repo_json(name) for name in self.repos), key=lambda repo: repo["updated_at"], reverse=True)
+        since = request.arg("since")
+        if since:
+            repos = [repo for repo in repos if repo["updated_at"] >= since]
+        headers = {}
+        if page * per_page < len(repos):
+            query = "&".join(f"{key}={values[0]}" for key, values in request.query.items() if key != "page")
+            headers["Link"] = f'<{self.url}/user/repos?{query}&page={page + 1}>; rel="next"'
+        return 200, repos[(page - 1) * per_page:page * per_page], headers
+
+    def create_repo(self, request):
+        body = request.json()
+        name = body["name"]
+        with self.lock:
+            if name in self.repos:
+                raise StubError(422, "name already exists on this account")
+            url = self._repo_url(name)
+            now = _now()
+            self.repos[name] = {
+                "refs": {},
+                "secrets": set(),
+                "meta": {
+                    "id": len(self.repos) + 1,
+                    "name": name,
+                    "full_name": f"{self.login}/{name}",
+                    "private": body.get("private", False),
+                    "owner": {"login": self.login, "type": "User", "url": f"{self.url}/users/{self.login}"},
+                    "url": url,
+                    "html_url": f"{self.url}/{self.login}/{name}",
+                    "clone_url": f"{self.url}/{self.login}/{name}.git",
+                    "default_branch": "main",
+                    "created_at": now,
+                    "updated_at": now,
+                    "pushed_at": now
+                }
+            }
+            if body.get("auto_init"):
+                self._commit_files(self.repos[name], "main", {"README.md": (f"# {name}\n".encode("utf-8"), "100644")}, "Initial commit")
+            return 201, self._repo_json(name)
+
+    def get_repo(self, request, owner, repo):
+        with self.lock:
+            self._repo(owner, repo)
+            return 200, self._repo_json(repo)
+
+    def get_branch(self, request, owner, repo, branch):
+        with self.lock:
+            sha = self._repo(owner, repo)["refs"].get(branch)
+            if sha is None:
+                raise StubError(404, "Branch not found")
+            return 200, {"name": branch, "commit": {"sha": sha}}
+
+    # --- contents API --------------------------------------------------
+
+    def get_contents(self, request, owner, repo, path):
+        path = path.strip("/")
+        with self.lock:
+            state = self._repo(owner, repo)
+            entries = self._branch_tree(state, request.arg("ref", "main"))
+            if path in entries:
+                return 200, self._content_json(repo, path, entries[path])
+            prefix = f"{path}/" if path else ""
+            children = {}
+            for entry_path, mode_sha in entries.items():
+                if not entry_path.startswith(prefix):
+                    continue
+                name, _, rest = entry_path[len(prefix):].partition("/")
+                if rest:
+                    children.setdefault(name, {"type": "dir", "name": name, "path": prefix + name, "sha": "", "url": f"{self._repo_url(repo)}/contents/{prefix}{name}"})
+                else:
+                    children[name] = self._content_json(repo, entry_path, mode_sha, with_content=False)
+            if not children:
+                raise StubError(404)
+            return 200, sorted(children.values(), key=lambda item: item["name"])
+
+    def put_contents(self, request, owner, repo, path):
+        body = request.json()
+        with self.lock:
+            state = self._repo(owner, repo)
+            branch = body.get("branch", "main")
+            parent = state["refs"].get(branch)
+            existing = self.trees[self.commits[parent]["tree"]].get(path) if parent else None
+            if existing and body.get("sha") != existing[1]:
+                raise StubError(409, f"{path} does not match {body.get('sha')}")
+            sha = self._commit_files(state, branch, {path: (b64decode(body["content"]), "100644")}, body.get("message", ""))
+            entry = self.trees[self.commits[sha]["tree"]][path]
+            return (200 if existing else 201), {
+                "content": self._content_json(repo, path, entry, with_content=False),
+                "commit": self._commit_json(repo, sha)
+            }
+
+    # --- Git Data API --------------------------------------------------
+
+    def get_ref(self, request, owner, repo, branch):
+        with self.lock:
+            sha = self._repo(owner, repo)["refs"].get(branch)
+            if sha is None:
+                raise StubError(404)
+            return 200, self._ref_json(repo, branch, sha)
+
+    def create_ref(self, request, owner, repo):
+        body = request.json()
+        branch = body["ref"].removeprefix("refs/heads/")
+        with self.lock:
+            state = self._repo(owner, repo)
+            if branch in state["refs"]:
+                raise StubError(422, "Reference already exists")
+            if body["sha"] not in self.commits:
+                raise StubError(422, "Object does not exist")
+            state["refs"][branch] = body["sha"]
+            return 201, self._ref_json(repo, branch, body["sha"])
+
+    def update_ref(self, request, owner, repo, branch):
+        body = request.json()
+        with self.lock:
+            state = self._repo(owner, repo)
+            if body["sha"] not in self.commits:
+                raise StubError(422, "Object does not exist")
+            state["refs"][branch] = body["sha"]
+            state["meta"]["pushed_at"] = state["meta"]["updated_at"] = _now()
+            return 200, self._ref_json(repo, branch, body["sha"])
+
+    def get_commit(self, request, owner, repo, sha):
+        with self.lock:
+            self._repo(owner, repo)
+            if sha not in self.commits:
+                raise StubError(404)
+            return 200, self._commit_json(repo, sha)
+
+    def create_commit(self, request, owner, repo):
+        body = request.json()
+        with self.lock:
+            self._repo(owner, repo)
+            if body["tree"] not in self.trees:
+                raise StubError(422, "Tree SHA does not exist")
+            sha = self._store_commit(body["tree"], body.get("parents", []), body.get("message", ""))
+            return 201, self._commit_json(repo, sha)
+
+    def get_tree(self, request, owner, repo, sha):
+        with self.lock:
+            self._repo(owner, repo)
+            # Like GitHub, accept a commit SHA for its tree
+            sha = self.commits[sha]["tree"] if sha in self.commits else sha
+            if sha not in self.trees:
+                raise StubError(404)
+            url = self._repo_url(repo)
+            tree = [
+                {"path": path, "mode": mode, "type": "blob", "sha": blob_sha, "size": len(self.blobs[blob_sha]), "url": f"{url}/git/blobs/{blob_sha}"}
+                for path, (mode, blob_sha) in sorted(self.trees[sha].items())
+            ]
+            return 200, {"sha": sha, "url": f"{url}/git/trees/{sha}", "tree": tree, "truncated": False}
+
+    def create_tree(self, request, owner, repo):
+        body = request.json()
+        with self.lock:
+            self._repo(owner, repo)
+            entries = dict(self.trees.get(body.get("base_tree"), {}))
+            for element in body["tree"]:
+                if "content" in element:
+                    blob_sha = self._store_blob(element["content"].encode("utf-8"))
+                elif element.get("sha") in self.blobs:
+                    blob_sha = element["sha"]
+                else:
+                    raise StubError(422, f"Blob for '{element['path']}' does not exist")
+                entries[element["path"]] = (element["mode"], blob_sha)
+            sha = self._store_tree(entries)
+            return 201, {"sha": sha, "url": f"{self._repo_url(repo)}/git/trees/{sha}", "tree": [], "truncated": False}
+
+    def create_blob(self, request, owner, repo):
+        body = request.json()
+        content = b64decode(body["content"]) if body.get("encoding") == "base64" else body["content"].encode("utf-8")
+        with self.lock:
+            self._repo(owner, repo)
+            sha = self._store_blob(content)
+            return 201, {"sha": sha, "url": f"{self._repo_url(repo)}/git/blobs/{sha}"}
+
+    # --- Actions secrets -----------------------------------------------
+
+    def get_public_key(self, request, owner, repo):
+        with self.lock:
+            self._repo(owner, repo)
+        key = self._secret_key.public_key.encode(encoding.Base64Encoder()).decode("utf-8")
+        return 200, {"key_id": "stub-key", "key": key}
+
+    def list_secrets(self, request, owner, repo):
+        with self.lock:
+            names = sorted(self._repo(owner, repo)["secrets"])
+        return 200, {"total_count": len(names), "secrets": [{"name": name} for name in names]}
+
+    def put_secret(self, request, owner, repo, name):
+        with self.lock:
+            secrets = self._repo(owner, repo)["secrets"]
+            existed = name in secrets
+            secrets.add(name)
+        return (204 if existed else 201), b""
+
+    # --- GraphQL (only the batched repo checks query) ------------------
+
+    def graphql(self, request):
+        variables = request.json().get("variables") or {}
+        data, errors = {}, []
+        with self.lock:
+            for key, name in variables.items():
+                if not key.startswith("name"):
+                    continue
+                alias = f"r{key[len('name'):]}"
+                if variables.get("owner") != self.login or name not in self.repos:
+                    data[alias] = None
+                    errors.append({"type": "NOT_FOUND", "path": [alias], "message": f"Could not resolve to a Repository with the name '{name}'."})
+                    continue
+                data[alias] = self._repo_checks(name)
+        body = {"data": data}
+        if errors:
+            body["errors"] = errors
+        return 200, body
+
+    def _repo_checks(self, name):
+        state = self.repos[name]
+        node = {"url": state["meta"]["html_url"], "devRef": None, "workflows": None, "config": None}
+        if "dev" in state["refs"]:
+            node["devRef"] = {"name": "dev"}
+            entries = self._branch_tree(state, "dev")
+            workflows = [path.rsplit("/", 1)[-1] for path in entries if path.startswith(".github/workflows/")]
+            if workflows:
+                node["workflows"] = {"entries": [{"name": workflow} for workflow in workflows]}
+            if CONFIG_FILE_PATH in entries:
+                node["config"] = {"text": self.blobs[entries[CONFIG_FILE_PATH][1]].decode("utf-8")}
+        return node
+
+    # --- template archive ----------------------------------------------
+
+    def _archive(self, request, data, content_type):
+        etag = f'"{hashlib.sha256(data).hexdigest()[:32]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return 304, b"", {"ETag": etag}
+        return 200, data, {"ETag": etag, "Content-Type": content_type}
+
+    def get_tarball(self, request):
+        return self._archive(request, self.tarball, "application/x-gzip")
+
+    def get_zipball(self, request):
+        return self._archive(request, self.zipball, "application/zip")
@@ -0,0 +1,136 @@
+import os
+import sys
+import argparse
+import tempfile
+from bench.stub_server import StubConfig
+from bench.github_stub import GitHubStub, build_template
+from bench.databricks_stub import DatabricksStub
+from bench.run_bench import configure_environment
+
+CASSETTE_DIR = os.path.join("test", "cassettes")
+# Stable origins the recordings are rewritten to, so replays don't depend on the stand-ins' ports
+GITHUB_ALIAS = "http://github.test"
+DATABRICKS_ALIAS = "http://databricks.test"
+# Where the stand-in serves the template, as seen in the recordings
+TEMPLATE_ALIAS = f"{GITHUB_ALIAS}/archive/template.tar.gz"
+REPO_NAME = "cassette_repo"
+PIPELINE_REPO_NAME = "cassette_pipeline"
+TEMPLATE_FILES = 20
+TEMPLATE_FILE_BYTES = 1024
+RECORD_LATENCY_MS = 20.0
+
+
+def step_check_availability(work_dir):
+    from cli.handlers.git_handler import validate_repo_availability
+    from cli.handlers.databricks_handler import validate_databricks_job_availability
+    validate_repo_availability(REPO_NAME)
+    validate_databricks_job_availability(REPO_NAME)
+
+
+def step_create_and_setup_repo(work_dir):
+    from cli.handlers.git_handler import create_and_setup_repo
+    return create_and_setup_repo(REPO_NAME, stream_template=True)
+
+
+def step_create_jobs(work_dir):
+    from cli.handlers.git_handler import expected_clone_url
+    from cli.handlers.databricks_handler import create_jobs
+    return create_jobs(REPO_NAME, expected_clone_url(REPO_NAME))
+
+
+def step_import_repo(work_dir):
+    from cli.handlers.git_handler import expected_clone_url
+    from cli.handlers.databricks_handler import import_repo_to_databricks
+    return import_repo_to_databricks(expected_clone_url(REPO_NAME), REPO_NAME)
+
+
+def step_update_config(work_dir):
+    from cli.handlers.git_handler import update_config_json
+    update_config_json(REPO_NAME, 1001, 1002)
+
+
+def step_run_e2e_validation(work_dir):
+    from e2e.e2e_validator import collect_e2e_results
+    return collect_e2e_results(REPO_NAME)
+
+
+def step_provision_repo(work_dir):
+    from cli.main import provision_repo
+    return provision_repo(PIPELINE_REPO_NAME, 0.8, 0.8, stream_template=True,
+                          journal_path=os.path.join(work_dir, "journal.jsonl"))
+
+
+# In recording order; each step builds on the state the previous ones left behind
+CASSETTE_STEPS = (
+    ("check_availability", step_check_availability),
+    ("create_and_setup_repo", step_create_and_setup_repo),
+    ("create_jobs", step_create_jobs),
+    ("import_repo", step_import_repo),
+    ("update_config", step_update_config),
+    ("run_e2e_validation", step_run_e2e_validation),
+    ("provision_repo", step_provision_repo)
+)
+
+
+def reset_clients():
+    """Forget per-run lookups (user, public keys) so every cassette is self-contained."""
+    from cli.handlers import git_handler
+    git_handler.get_github_client.cache_clear()
+    git_handler.get_github_user.cache_clear()
+    git_handler.get_repo_public_key.cache_clear()
+
+
+def replay_patches():
+    """Patches pointing the handlers at the aliased hosts the cassettes were recorded under."""
+    from unittest.mock import patch
+    from cli.handlers import git_handler, databricks_handler
+    from e2e import e2e_validator
+    secrets = ("DATABRICKS_HOST", "DATABRICKS_TOKEN", "DATABRICKS_USERNAME", "GH_TOKEN", "MLFLOW_USER_EMAIL")
+    return [
+        patch.multiple(
+            git_handler,
+            GITHUB_API_URL=GITHUB_ALIAS,
+            GITHUB_GRAPHQL_URL=f"{GITHUB_ALIAS}/graphql",
+            TEMPLATE_REPO_TARBALL_URL=TEMPLATE_ALIAS,
+            GH_TOKEN="token"
+        ),
+        patch.multiple(databricks_handler, DATABRICKS_HOST=DATABRICKS_ALIAS, DATABRICKS_USERNAME="bench@example.com"),
+        patch.multiple(e2e_validator, DATABRICKS_HOST=DATABRICKS_ALIAS, E2E_GITHUB_API="graphql"),
+        patch.dict(os.environ, {name: "value" for name in secrets})
+    ]
+
+
+def cassette_path(step, cassette_dir=CASSETTE_DIR):
+    return os.path.join(cassette_dir, f"{step}.json")
+
+
+def record(cassette_dir=CASSETTE_DIR, latency_ms=RECORD_LATENCY_MS):
+    """Record one cassette per step against fresh stand-ins."""
+    config = StubConfig(latency_ms=latency_ms)
+    with tempfile.TemporaryDirectory(prefix="cli_gh_cassettes_") as work_dir, \
+            GitHubStub(config) as github, DatabricksStub(config) as databricks:
+        github.set_template(build_template(TEMPLATE_FILES, TEMPLATE_FILE_BYTES))
+        configure_environment(github, databricks, work_dir)
+        # Imported here: the handlers read GITHUB_API_URL/DATABRICKS_HOST at import time
+        from cli.cassette import Cassette
+        from cli.http_client import use_cassette
+
+        aliases = {github.url: GITHUB_ALIAS, databricks.url: DATABRICKS_ALIAS}
+        for step, func in CASSETTE_STEPS:
+            reset_clients()
+            with use_cassette(Cassette(cassette_path(step, cassette_dir), mode="record", aliases=aliases)) as cassette:
+                func(work_dir)
+            print(f"📼 {step}: {cassette.stats()}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-record the HTTP cassettes the request budget tests replay.")
+    parser.add_argument("--output-dir", default=CASSETTE_DIR, help="Where to write the cassettes.")
+    parser.add_argument("--latency-ms", type=float, default=RECORD_LATENCY_MS, help="Stand-in latency recorded with every exchange.")
+    args = parser.parse_args(argv)
+    record(args.output_dir, args.latency_ms)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
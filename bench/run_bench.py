@@ -0,0 +1,343 @@
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import tempfile
+from itertools import count
+from bench.stub_server import StubConfig
+from bench.github_stub import GitHubStub, build_template
+from bench.databricks_stub import DatabricksStub
+
+SCENARIOS = ("create_and_setup_repo", "create_jobs", "main", "run_e2e_validation")
+BENCH_ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "5"))
+# Client-side pacing is loosened so the stand-ins' own limits decide; override via the usual env vars
+CLIENT_LIMITS = {
+    "GITHUB_MAX_RPS": "1000",
+    "GITHUB_BURST": "1000",
+    "GITHUB_WRITES_PER_MINUTE": "60000",
+    "GITHUB_WRITE_BURST": "1000",
+    "DATABRICKS_MAX_RPS": "1000",
+    "DATABRICKS_BURST": "1000",
+    "RATE_LIMIT_RESERVE": "0"
+}
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile; small sample counts make interpolation meaningless."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def configure_environment(github, databricks, work_dir):
+    """Point the CLI at the stand-ins. Must run before any cli/e2e module is imported."""
+    os.environ.update({
+        "GITHUB_API_URL": github.url,
+        "GH_TOKEN": "bench-token",
+        "DATABRICKS_HOST": databricks.url,
+        "DATABRICKS_TOKEN": "bench-token",
+        "DATABRICKS_USERNAME": "bench@example.com",
+        "MLFLOW_USER_EMAIL": "bench@example.com",
+        "TEMPLATE_REPO_ZIP_URL": f"{github.url}/archive/template.zip",
+        "TEMPLATE_REPO_TARBALL_URL": f"{github.url}/archive/template.tar.gz",
+        "TEMPLATE_CACHE_DIR": os.path.join(work_dir, "templates"),
+        # Revalidate on every run so template size changes are picked up
+        "TEMPLATE_CACHE_FRESH_SECONDS": "0",
+        "HTTP_CACHE": "0",
+        "RUN_POLL_MIN_INTERVAL": "0.1",
+        "RUN_POLL_MAX_INTERVAL": "0.5"
+    })
+    for name, value in CLIENT_LIMITS.items():
+        os.environ.setdefault(name, value)
+
+
+class Bench:
+    """Times CLI entry points against the stand-ins and records their request footprint."""
+
+    def __init__(self, github, databricks, work_dir, iterations=BENCH_ITERATIONS, upload_mode="bulk", stream_template=False):
+        # Imported here: the handlers read GITHUB_API_URL/DATABRICKS_HOST at import time
+        from cli import main as cli_main
+        from cli.handlers import git_handler, databricks_handler
+        from e2e import e2e_validator
+
+        self.cli_main = cli_main
+        self.git_handler = git_handler
+        self.databricks_handler = databricks_handler
+        self.e2e_validator = e2e_validator
+        self.github = github
+        self.databricks = databricks
+        self.work_dir = work_dir
+        self.iterations = iterations
+        self.upload_mode = upload_mode
+        self.stream_template = stream_template
+        self._names = count()
+
+    def repo_name(self, label):
+        return f"bench_{label}_{next(self._names)}"
+
+    def measure(self, scenario, params, func):
+        """Run ``func`` once per iteration; each call gets a fresh repo name from ``func`` itself."""
+        samples = []
+        for _ in range(self.iterations):
+            for stub in (self.github, self.databricks):
+                stub.reset_stats()
+            started = time.perf_counter()
+            error = None
+            try:
+                func()
+            except BaseException as e:  # click.Abort is not an Exception
+                if isinstance(e, KeyboardInterrupt):
+                    raise
+                error = str(e) or type(e).__name__
+            elapsed = time.perf_counter() - started
+            samples.append({
+                "seconds": elapsed,
+                "error": error,
+                "github": self.github.stats(),
+                "databricks": self.databricks.stats()
+            })
+        return summarize(scenario, params, samples)
+
+    def set_template(self, file_count, file_bytes):
+        self.github.set_template(build_template(file_count, file_bytes))
+
+    def bench_create_and_setup_repo(self, file_count, file_bytes):
+        self.set_template(file_count, file_bytes)
+        return self.measure(
+            "create_and_setup_repo", {"template_files": file_count, "file_bytes": file_bytes},
+            lambda: self.git_handler.create_and_setup_repo(self.repo_name("setup"), self.upload_mode, self.stream_template)
+        )
+
+    def bench_create_jobs(self):
+        return self.measure(
+            "create_jobs", {},
+            lambda: self.databricks_handler.create_jobs(self.repo_name("jobs"), f"{self.github.url}/bench-user/bench.git")
+        )
+
+    def main_args(self, repos):
+        args = [
+            "provision", "--accuracy-train", "0.8", "--accuracy-inference", "0.8",
+            "--upload-mode", self.upload_mode,
+            "--journal", os.path.join(self.work_dir, f"journal_{next(self._names)}.jsonl")
+        ]
+        if self.stream_template:
+            args.append("--stream-template")
+        if repos == 1:
+            return args + ["--repo-name", self.repo_name("main")]
+
+        manifest = os.path.join(self.work_dir, f"manifest_{next(self._names)}.csv")
+        with open(manifest, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["repo_name", "accuracy_train", "accuracy_inference"])
+            for _ in range(repos):
+                writer.writerow([self.repo_name("main"), "0.8", "0.8"])
+        return args + ["--manifest", manifest, "--workers", str(min(repos, 8))]
+
+    def bench_main(self, file_count, file_bytes, repos):
+        self.set_template(file_count, file_bytes)
+        return self.measure(
+            "main", {"template_files": file_count, "file_bytes": file_bytes, "repos": repos},
+            lambda: self.cli_main.main.main(args=self.main_args(repos), standalone_mode=False)
+        )
+
+    def bench_run_e2e_validation(self):
+        repo_name = self.repo_name("e2e")
+        self.cli_main.provision_repo(repo_name, 0.8, 0.8, upload_mode=self.upload_mode,
+                                     journal_path=os.path.join(self.work_dir, "e2e_journal.jsonl"))
+        output_path = os.path.join(self.work_dir, "e2e_report.html")
+        return self.measure(
+            "run_e2e_validation", {"github_api": self.e2e_validator.E2E_GITHUB_API},
+            lambda: self.e2e_validator.run_e2e_validation(repo_name, output_path=output_path)
+        )
+
+
+def summarize(scenario, params, samples):
+    def median(values):
+        return percentile(values, 50)
+
+    seconds = [sample["seconds"] for sample in samples]
+    ok = [sample for sample in samples if not sample["error"]] or samples
+    return {
+        "scenario": scenario,
+        "params": params,
+        "iterations": len(samples),
+        "failures": sum(1 for sample in samples if sample["error"]),
+        "errors": sorted({sample["error"] for sample in samples if sample["error"]}),
+        "p50_seconds": round(percentile(seconds, 50), 4),
+        "p95_seconds": round(percentile(seconds, 95), 4),
+        "requests": {
+            service: median([sample[service]["requests"] for sample in ok]) for service in ("github", "databricks")
+        },
+        "bytes_uploaded": median([sample["github"]["bytes_received"] + sample["databricks"]["bytes_received"] for sample in ok]),
+        "bytes_downloaded": median([sample["github"]["bytes_sent"] + sample["databricks"]["bytes_sent"] for sample in ok]),
+        "throttled": sum(sample["github"]["throttled"] + sample["databricks"]["throttled"] for sample in samples),
+        "injected_errors": sum(sample["github"]["injected_errors"] + sample["databricks"]["injected_errors"] for sample in samples),
+        "by_route": {**ok[-1]["github"]["by_route"], **ok[-1]["databricks"]["by_route"]}
+    }
+
+
+def result_key(result):
+    params = ",".join(f"{key}={value}" for key, value in sorted(result["params"].items()))
+    return f"{result['scenario']}[{params}]"
+
+
+def compare_to_baseline(results, baseline, max_regression=None, max_request_increase=0.0, max_bytes_increase=0.02):
+    """Regressions against a previous results file: more requests or bytes than allowed, or new failures.
+
+    Request and byte counts are deterministic against the stand-ins, so they
+    gate. Wall-clock time depends on the machine and only gates when
+    ``max_regression`` is given, e.g. against a baseline run in the same job.
+    """
+    previous = {result_key(result): result for result in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        base = previous.get(result_key(result))
+        if base is None:
+            continue
+        if max_regression is not None and result["p50_seconds"] > base["p50_seconds"] * (1 + max_regression):
+            regressions.append(f"{result_key(result)}: p50 {result['p50_seconds']:.3f}s vs {base['p50_seconds']:.3f}s")
+        for service, requests in result["requests"].items():
+            allowed = base["requests"].get(service, 0) * (1 + max_request_increase)
+            if requests > allowed:
+                regressions.append(f"{result_key(result)}: {requests} {service} requests vs {base['requests'].get(service, 0)}")
+        for field in ("bytes_uploaded", "bytes_downloaded"):
+            if result[field] > base.get(field, 0) * (1 + max_bytes_increase):
+                regressions.append(f"{result_key(result)}: {result[field]} {field.replace('_', ' ')} vs {base.get(field, 0)}")
+        if result["failures"] > base.get("failures", 0):
+            regressions.append(f"{result_key(result)}: {result['failures']} failed iterations vs {base.get('failures', 0)}")
+    return regressions
+
+
+def format_timing_changes(results, baseline):
+    """p50 against the baseline per scenario, for information only."""
+    previous = {result_key(result): result for result in baseline.get("results", [])}
+    lines = []
+    for result in results:
+        base = previous.get(result_key(result))
+        if base and base["p50_seconds"]:
+            change = result["p50_seconds"] / base["p50_seconds"] - 1
+            lines.append(f"{result_key(result)}: p50 {result['p50_seconds']:.3f}s vs {base['p50_seconds']:.3f}s ({change:+.0%})")
+    return "\n".join(lines)
+
+
+def format_results(results):
+    rows = [("Scenario", "p50 (s)", "p95 (s)", "GitHub req", "Databricks req", "Up (KiB)", "Down (KiB)", "429s", "5xx", "Failed")]
+    for result in results:
+        rows.append((
+            result_key(result),
+            f"{result['p50_seconds']:.3f}",
+            f"{result['p95_seconds']:.3f}",
+            str(result["requests"]["github"]),
+            str(result["requests"]["databricks"]),
+            f"{result['bytes_uploaded'] / 1024:.1f}",
+            f"{result['bytes_downloaded'] / 1024:.1f}",
+            str(result["throttled"]),
+            str(result["injected_errors"]),
+            f"{result['failures']}/{result['iterations']}"
+        ))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join("  ".join(value.ljust(width) for value, width in zip(row, widths)) for row in rows)
+
+
+def run_benchmarks(args, work_dir):
+    config = StubConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+        retry_after=args.retry_after,
+        seed=args.seed
+    )
+    with GitHubStub(config) as github, DatabricksStub(config) as databricks:
+        configure_environment(github, databricks, work_dir)
+        bench = Bench(github, databricks, work_dir, args.iterations, args.upload_mode, args.stream_template)
+
+        results = []
+        for scenario in args.scenarios:
+            if scenario == "create_and_setup_repo":
+                results.extend(bench.bench_create_and_setup_repo(files, args.file_bytes) for files in args.template_files)
+            elif scenario == "create_jobs":
+                results.append(bench.bench_create_jobs())
+            elif scenario == "main":
+                results.extend(
+                    bench.bench_main(files, args.file_bytes, repos)
+                    for files in args.template_files for repos in args.repo_counts
+                )
+            elif scenario == "run_e2e_validation":
+                results.append(bench.bench_run_e2e_validation())
+    return results
+
+
+def int_list(value):
+    return [int(item) for item in value.split(",") if item]
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmark provisioning and validation against local GitHub/Databricks stand-ins.")
+    parser.add_argument("--scenarios", type=lambda value: value.split(","), default=list(SCENARIOS), help=f"Comma-separated subset of: {', '.join(SCENARIOS)}.")
+    parser.add_argument("--iterations", type=int, default=BENCH_ITERATIONS, help="Timed runs per scenario.")
+    parser.add_argument("--template-files", type=int_list, default=[20, 200], help="Comma-separated template sizes (file counts).")
+    parser.add_argument("--file-bytes", type=int, default=2048, help="Size of each template file.")
+    parser.add_argument("--repo-counts", type=int_list, default=[1, 5], help="Comma-separated repo counts for main() (more than one uses a manifest).")
+    parser.add_argument("--upload-mode", choices=("bulk", "contents"), default="bulk", help="Template upload transport (git needs a real git server).")
+    parser.add_argument("--stream-template", action="store_true", help="Stream the template tarball instead of using the template cache.")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Server-side latency added to every request.")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="Random extra latency, up to this many milliseconds.")
+    parser.add_argument("--rate-limit", type=int, default=0, help="Requests allowed per --rate-window seconds per service (0 = unlimited).")
+    parser.add_argument("--rate-window", type=float, default=60.0, help="Rate limit window in seconds.")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of GET/HEAD requests answered with 503.")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with injected 429s.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for jitter and fault injection.")
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    parser.add_argument("--baseline", help="Results JSON from an earlier run to compare against.")
+    parser.add_argument("--max-regression", type=float, help="Fail when p50 slows down by more than this against the baseline (0.25 = 25%%); timing is only reported when unset.")
+    parser.add_argument("--max-request-increase", type=float, default=0.0, help="Allowed growth in request counts against the baseline.")
+    parser.add_argument("--max-bytes-increase", type=float, default=0.02, help="Allowed growth in bytes uploaded/downloaded against the baseline.")
+    args = parser.parse_args(argv)
+    unknown = [scenario for scenario in args.scenarios if scenario not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown scenario(s): {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="cli_gh_bench_") as work_dir:
+        results = run_benchmarks(args, work_dir)
+
+    print(format_results(results))
+    report = {
+        "settings": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+        print(f"📊 Results written to {args.output}")
+
+    failed = [result_key(result) for result in results if result["failures"]]
+    if failed:
+        print(f"❌ Failed iterations in: {', '.join(failed)}")
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print("ℹ️ Timing against the baseline:\n" + format_timing_changes(results, baseline))
+        regressions = compare_to_baseline(
+            results, baseline, args.max_regression, args.max_request_increase, args.max_bytes_increase
+        )
+        if regressions:
+            print("❌ Regressions against the baseline:\n" + "\n".join(regressions))
+            return 1
+        print("✅ No regressions against the baseline.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+import re
+import json
+import math
+import time
+import random
+import threading
+from collections import Counter
+from urllib.parse import urlsplit, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+IDEMPOTENT_METHODS = ("GET", "HEAD")
+
+
+class StubConfig:
+    """How a stand-in server misbehaves.
+
+    ``rate_limit`` requests are allowed per ``rate_window`` seconds (0 turns
+    the limit off); past it the server answers 429 with ``Retry-After``.
+    ``throttle_rate`` injects extra 429s on any request, ``error_rate``
+    injects 503s on GET/HEAD only, since the client never retries a POST
+    that may already have been applied.
+    """
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, rate_limit=0, rate_window=60.0,
+                 throttle_rate=0.0, error_rate=0.0, retry_after=1, seed=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.seed = seed
+
+
+class StubError(Exception):
+    def __init__(self, status, message="Not Found"):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def route_pattern(template):
+    """``/repos/{owner}/{repo}/contents/{path:.*}`` -> compiled regex with named groups."""
+    def group(match):
+        name, _, pattern = match.group(1).partition(":")
+        return f"(?P<{name}>{pattern or '[^/]+'})"
+    return re.compile("^" + re.sub(r"\{([^}]+)\}", group, template) + "$")
+
+
+class StubRequest:
+    def __init__(self, method, path, query, headers, body):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    def arg(self, name, default=None):
+        values = self.query.get(name)
+        return values[0] if values else default
+
+    def json(self):
+        return json.loads(self.body.decode("utf-8")) if self.body else {}
+
+
+class StubServer:
+    """Local HTTP stand-in for a remote API, served from a background thread.
+
+    Subclasses register routes with ``route(method, template, handler)``;
+    handlers take ``(request, **path_params)`` and return ``(status, body)``
+    or ``(status, body, headers)``, where a dict/list body is sent as JSON.
+    Every exchange is counted per route template with the bytes sent and
+    received, so benchmarks can report request budgets.
+    """
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or StubConfig()
+        self.routes = []
+        self.lock = threading.RLock()
+        self._random = random.Random(self.config.seed)
+        self._stats_lock = threading.Lock()
+        self._window_start = time.time()
+        self._window_count = 0
+        self.reset_stats()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self):
+                stub._dispatch(self)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://{host}:{self.server.server_address[1]}"
+        self._thread = None
+
+    def route(self, method, template, handler):
+        self.routes.append((method, route_pattern(template), template, handler))
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self.requests = Counter()
+            self.statuses = Counter()
+            self.bytes_received = 0
+            self.bytes_sent = 0
+            self.throttled = 0
+            self.injected_errors = 0
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                "requests": sum(self.requests.values()),
+                "by_route": dict(self.requests),
+                "statuses": {str(status): count for status, count in self.statuses.items()},
+                "bytes_received": self.bytes_received,
+                "bytes_sent": self.bytes_sent,
+                "throttled": self.throttled,
+                "injected_errors": self.injected_errors
+            }
+
+    def rate_limit_headers(self, remaining, reset_at):
+        """Headers advertising the remaining quota; GitHub sends them, Databricks doesn't."""
+        return {}
+
+    def _take_quota(self):
+        """Count the request against the fixed window; returns ``(allowed, remaining, reset_at)``."""
+        with self._stats_lock:
+            now = time.time()
+            if now - self._window_start >= self.config.rate_window:
+                self._window_start = now
+                self._window_count = 0
+            reset_at = self._window_start + self.config.rate_window
+            if self.config.rate_limit and self._window_count >= self.config.rate_limit:
+                return False, 0, reset_at
+            self._window_count += 1
+            return True, max(self.config.rate_limit - self._window_count, 0), reset_at
+
+    def _roll(self, probability):
+        if probability <= 0:
+            return False
+        with self._stats_lock:
+            return self._random.random() < probability
+
+    def _delay(self):
+        if self.config.latency_ms or self.config.jitter_ms:
+            with self._stats_lock:
+                jitter = self._random.uniform(0, self.config.jitter_ms)
+            time.sleep((self.config.latency_ms + jitter) / 1000)
+
+    def _match(self, method, path):
+        lookup = "GET" if method == "HEAD" else method
+        for route_method, pattern, template, handler in self.routes:
+            if route_method == lookup:
+                match = pattern.match(path)
+                if match:
+                    return template, handler, match.groupdict()
+        return None, None, {}
+
+    def _dispatch(self, http):
+        method = http.command
+        parts = urlsplit(http.path)
+        length = int(http.headers.get("Content-Length") or 0)
+        body = http.rfile.read(length) if length else b""
+        template, handler, params = self._match(method, parts.path)
+        route_name = f"{method} {template or parts.path}"
+
+        self._delay()
+        allowed, remaining, reset_at = self._take_quota()
+        headers = self.rate_limit_headers(remaining, reset_at) if self.config.rate_limit else {}
+        if not allowed or self._roll(self.config.throttle_rate):
+            retry_after = self.config.retry_after if allowed else max(math.ceil(reset_at - time.time()), 1)
+            status, payload = 429, {"message": "Too Many Requests"}
+            headers["Retry-After"] = str(retry_after)
+            with self._stats_lock:
+                self.throttled += 1
+        elif method in IDEMPOTENT_METHODS and self._roll(self.config.error_rate):
+            status, payload = 503, {"message": "Service Unavailable"}
+            with self._stats_lock:
+                self.injected_errors += 1
+        elif handler is None:
+            status, payload = 404, {"message": "Not Found"}
+        else:
+            request = StubRequest(method, parts.path, parse_qs(parts.query), http.headers, body)
+            try:
+                result = handler(request, **params)
+            except StubError as e:
+                result = (e.status, {"message": e.message})
+            status, payload = result[0], result[1]
+            if len(result) > 2:
+                headers.update(result[2])
+
+        if isinstance(payload, (dict, list)):
+            data = json.dumps(payload).encode("utf-8")
+            headers.setdefault("Content-Type", "application/json")
+        else:
+            data = payload or b""
+        if status in (204, 304):
+            data = b""
+        http.send_response(status)
+        for name, value in headers.items():
+            http.send_header(name, value)
+        http.send_header("Content-Length", str(len(data)))
+        http.end_headers()
+        if method == "HEAD":
+            data = b""
+        http.wfile.write(data)
+
+        with self._stats_lock:
+            self.requests[route_name] += 1
+            self.statuses[status] += 1
+            self.bytes_received += len(body)
+            self.bytes_sent += len(data)
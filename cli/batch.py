@@ -0,0 +1,131 @@
+import os
+import csv
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from cli.logger import setup_logger
+from cli.validator import validate_inputs
+
+logger = setup_logger()
+
+MANIFEST_FORMATS = (".yaml", ".yml", ".json", ".csv")
+
+
+def _to_float(value, default):
+    if value in (None, ""):
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value  # validate_inputs reports it as non-numeric
+
+
+def load_manifest(path, default_train=None, default_inference=None):
+    """Read repo entries from a YAML, JSON or CSV manifest.
+
+    YAML/JSON manifests are a list (or a mapping with a ``repos`` list) of
+    repo names or objects with ``repo_name``, ``accuracy_train`` and
+    ``accuracy_inference``. CSV manifests use those names as the header row.
+    Missing thresholds fall back to the defaults passed in.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if extension in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML manifests require PyYAML (pip install -r requirements.txt).")
+            data = yaml.safe_load(f)
+        elif extension == ".json":
+            data = json.load(f)
+        elif extension == ".csv":
+            data = list(csv.DictReader(f))
+        else:
+            raise ValueError(f"Unsupported manifest format '{extension}'. Expected one of: {', '.join(MANIFEST_FORMATS)}")
+
+    if isinstance(data, dict):
+        data = data.get("repos", [])
+    if not isinstance(data, list):
+        raise ValueError(f"Manifest '{path}' must contain a list of repositories.")
+
+    entries = []
+    for item in data:
+        if isinstance(item, str):
+            item = {"repo_name": item}
+        entries.append({
+            "repo_name": (item.get("repo_name") or "").strip(),
+            "accuracy_train": _to_float(item.get("accuracy_train"), default_train),
+            "accuracy_inference": _to_float(item.get("accuracy_inference"), default_inference)
+        })
+    return entries
+
+
+def validate_manifest(entries):
+    """Run validate_inputs on every entry and report all problems at once."""
+    errors = []
+    seen = set()
+    for position, entry in enumerate(entries, start=1):
+        label = f"Entry {position} ('{entry['repo_name']}')"
+        try:
+            validate_inputs(entry["repo_name"], entry["accuracy_train"], entry["accuracy_inference"])
+        except ValueError as e:
+            errors.append(f"{label}: {e}")
+        if entry["repo_name"] in seen:
+            errors.append(f"{label}: ❌ Repository name is listed more than once.")
+        seen.add(entry["repo_name"])
+
+    if not entries:
+        errors.append("❌ Manifest does not list any repositories.")
+
+    if errors:
+        error_message = "\n".join(errors)
+        raise ValueError(f"Manifest Validation Errors:\n{error_message}")
+
+
+def _run_entry(provision, entry, options):
+    started = time.monotonic()
+    result = {"repo_name": entry["repo_name"]}
+    try:
+        result["outputs"] = provision(**entry, **options)
+        result["status"] = "success"
+    except Exception as e:
+        logger.error(f"❌ Provisioning '{entry['repo_name']}' failed", exc_info=True)
+        result["status"] = "failed"
+        result["error"] = str(e)
+    result["duration_seconds"] = round(time.monotonic() - started, 2)
+    return result
+
+
+def run_batch(entries, provision, workers=4, **options):
+    """Provision every entry with at most ``workers`` running at once.
+
+    ``provision`` is called as ``provision(repo_name, accuracy_train,
+    accuracy_inference, **options)``. Results come back in manifest order;
+    one repo failing does not stop the others.
+    """
+    logger.info(f"🚀 Provisioning {len(entries)} repositories with {workers} workers...")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_run_entry, provision, entry, options) for entry in entries]
+        return [future.result() for future in futures]
+
+
+def format_summary(results):
+    rows = [("Repository", "Status", "Duration (s)", "Details")]
+    for result in results:
+        if result["status"] == "success":
+            outputs = result.get("outputs") or {}
+            details = ", ".join(f"{key}={value}" for key, value in outputs.items())
+            status = "✅ success"
+        else:
+            details = result.get("error", "")
+            status = "❌ failed"
+        rows.append((result["repo_name"], status, f"{result['duration_seconds']:.2f}", details))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(3)]
+    lines = [
+        "  ".join(value.ljust(width) for value, width in zip(row[:3], widths)) + "  " + row[3]
+        for row in rows
+    ]
+    succeeded = sum(1 for result in results if result["status"] == "success")
+    lines.append(f"{succeeded}/{len(results)} repositories provisioned successfully.")
+    return "\n".join(lines)
@@ -0,0 +1,206 @@
+import os
+import json
+import time
+import atexit
+import threading
+from io import BytesIO
+from base64 import b64decode, b64encode
+from collections import Counter, defaultdict
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+from cli.logger import setup_logger
+
+logger = setup_logger()
+
+# Record with HTTP_CASSETTE=path HTTP_CASSETTE_MODE=record, replay offline with HTTP_CASSETTE_MODE=replay
+HTTP_CASSETTE = os.getenv("HTTP_CASSETTE")
+HTTP_CASSETTE_MODE = os.getenv("HTTP_CASSETTE_MODE", "replay")
+# Replayed responses sleep this fraction of their recorded latency (0 = answer instantly)
+HTTP_CASSETTE_LATENCY_SCALE = float(os.getenv("HTTP_CASSETTE_LATENCY_SCALE", "0"))
+CASSETTE_MODES = ("record", "replay")
+
+# Per-connection and per-response headers that would be wrong when replayed
+DROPPED_HEADERS = ("date", "server", "content-encoding", "content-length", "transfer-encoding", "connection",
+                   "keep-alive", "set-cookie", "x-github-request-id", "x-ratelimit-limit", "x-ratelimit-remaining",
+                   "x-ratelimit-reset", "x-ratelimit-used", "x-ratelimit-resource")
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class CassetteMiss(Exception):
+    """Replay found no recorded exchange for a request."""
+
+
+def normalize_url(url):
+    """Drop default ports and sort the query so equivalent URLs match."""
+    parts = urlsplit(url)
+    netloc = parts.netloc
+    if parts.port and DEFAULT_PORTS.get(parts.scheme) == parts.port:
+        netloc = parts.hostname
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, netloc, parts.path, query, ""))
+
+
+class Cassette:
+    """Recorded HTTP exchanges, replayed in order per method and URL.
+
+    Only the request method, URL and body size are stored, never request
+    headers or bodies, so tokens and secret values stay out of the file.
+    Repeated requests to the same URL replay their recordings in order and
+    the last one repeats once they run out (e.g. for polling). ``aliases``
+    rewrite recorded origins (``{"http://127.0.0.1:5000": "http://github.test"}``)
+    in URLs and response bodies, so recordings from stand-in servers replay
+    against stable hosts.
+
+    Every exchange served or recorded is counted, so tests can assert
+    request, byte and latency budgets.
+    """
+
+    def __init__(self, path, mode="replay", aliases=None, latency_scale=HTTP_CASSETTE_LATENCY_SCALE):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}'. Expected one of: {', '.join(CASSETTE_MODES)}")
+        self.path = path
+        self.mode = mode
+        self.aliases = aliases or {}
+        self.latency_scale = latency_scale
+        self.interactions = []
+        self._queues = defaultdict(list)
+        self._lock = threading.Lock()
+        self.reset_stats()
+        if mode == "replay":
+            with open(path, "r", encoding="utf-8") as f:
+                self.interactions = json.load(f)["interactions"]
+            for interaction in self.interactions:
+                request = interaction["request"]
+                self._queues[(request["method"], request["url"])].append(interaction)
+
+    def reset_stats(self):
+        with self._lock:
+            self.requests = Counter()
+            self.bytes_sent = 0
+            self.bytes_received = 0
+            self.recorded_seconds = 0.0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": sum(self.requests.values()),
+                "by_host": dict(self.requests),
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "recorded_seconds": round(self.recorded_seconds, 4)
+            }
+
+    def _count(self, interaction, body_bytes):
+        self.requests[urlsplit(interaction["request"]["url"]).netloc] += 1
+        self.bytes_sent += body_bytes
+        self.bytes_received += interaction["response"]["body_bytes"]
+        self.recorded_seconds += interaction["elapsed"]
+
+    def _alias(self, text):
+        for origin, alias in self.aliases.items():
+            text = text.replace(origin, alias)
+        return text
+
+    def play(self, method, url, body_bytes=0):
+        """The recorded ``(status, reason, headers, body)`` for a request with a ``body_bytes`` body."""
+        key = (method, normalize_url(url))
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise CassetteMiss(f"No recorded response for {method} {key[1]} in {self.path}")
+            interaction = queue.pop(0) if len(queue) > 1 else queue[0]
+            self._count(interaction, body_bytes)
+        if self.latency_scale:
+            time.sleep(interaction["elapsed"] * self.latency_scale)
+        response = interaction["response"]
+        body = b64decode(response["body_base64"]) if "body_base64" in response else response.get("body", "").encode("utf-8")
+        return response["status"], response["reason"], response["headers"], body
+
+    def record(self, method, url, request_body, status, reason, headers, body, elapsed):
+        response = {
+            "status": status,
+            "reason": reason,
+            "headers": {name: self._alias(value) for name, value in headers.items() if name.lower() not in DROPPED_HEADERS},
+            "body_bytes": len(body)
+        }
+        try:
+            response["body"] = self._alias(body.decode("utf-8"))
+        except UnicodeDecodeError:
+            response["body_base64"] = b64encode(body).decode("utf-8")
+        interaction = {
+            "request": {
+                "method": method,
+                "url": normalize_url(self._alias(url)),
+                "body_bytes": len(request_body or b"")
+            },
+            "response": response,
+            "elapsed": round(elapsed, 4)
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+            self._count(interaction, interaction["request"]["body_bytes"])
+
+    def save(self):
+        if self.mode != "record":
+            return
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._lock:
+            data = {"version": 1, "interactions": list(self.interactions)}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        logger.info(f"📼 Recorded {len(data['interactions'])} HTTP exchanges to {self.path}.")
+
+
+class CassetteAdapter(HTTPAdapter):
+    """Transport adapter that records to or replays from a cassette.
+
+    It sits below the shared session, so the rate limiter and the response
+    cache behave exactly as against the real services. In replay mode
+    nothing leaves the process.
+    """
+
+    def __init__(self, cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def _response(self, request, status, reason, headers, body):
+        raw = HTTPResponse(
+            body=BytesIO(body),
+            headers={**headers, "Content-Length": str(len(body))},
+            status=status,
+            reason=reason,
+            preload_content=False,
+            decode_content=False,
+            request_method=request.method
+        )
+        return self.build_response(request, raw)
+
+    def send(self, request, **kwargs):
+        request_body = request.body.encode("utf-8") if isinstance(request.body, str) else (request.body or b"")
+        if self.cassette.mode == "replay":
+            return self._response(request, *self.cassette.play(request.method, request.url, len(request_body)))
+
+        started = time.monotonic()
+        response = super().send(request, **kwargs)
+        body = response.content
+        elapsed = time.monotonic() - started
+        self.cassette.record(request.method, request.url, request_body, response.status_code, response.reason,
+                             dict(response.headers), body, elapsed)
+        # The body was read to record it; hand the caller a fresh stream over the same bytes
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in ("content-encoding", "transfer-encoding", "content-length")}
+        return self._response(request, response.status_code, response.reason, headers, body)
+
+
+@lru_cache(maxsize=None)
+def get_cassette():
+    """The cassette named by HTTP_CASSETTE, or None. Recordings are saved at exit."""
+    if not HTTP_CASSETTE:
+        return None
+    cassette = Cassette(HTTP_CASSETTE, HTTP_CASSETTE_MODE)
+    if cassette.mode == "record":
+        atexit.register(cassette.save)
+    logger.info(f"📼 HTTP cassette '{HTTP_CASSETTE}' in {cassette.mode} mode.")
+    return cassette
@@ -1,7 +1,9 @@
 import os
-import requests
 from dotenv import load_dotenv
 from cli.logger import setup_logger
+from cli.http_client import get_session
+from cli.inventory import DATABRICKS_JOBS, get_inventory
+from cli.tracing import traced
 
 load_dotenv()
 logger = setup_logger()
@@ -15,31 +17,84 @@ headers = {
     'Content-Type': 'application/json'
 }
 
+JOBS_PAGE_SIZE = 100
+
+def iter_jobs(name=None, page_size=JOBS_PAGE_SIZE):
+    """Yield jobs one page at a time, following next_page_token.
+
+    ``name`` is passed to the server-side filter so only matching jobs are transferred.
+    """
+    params = {"limit": page_size, "expand_tasks": "false"}
+    if name:
+        params["name"] = name
+
+    while True:
+        response = get_session().get(
+            f"{DATABRICKS_HOST}/api/2.1/jobs/list",
+            headers=headers,
+            params=params
+        )
+
+        if response.status_code != 200:
+            logger.error(f"Databricks API error: {response.text}")
+            raise ValueError(f"Databricks API error: {response.text}")
+
+        page = response.json()
+        yield from page.get("jobs", [])
+
+        next_page_token = page.get("next_page_token")
+        if not page.get("has_more") or not next_page_token:
+            break
+        params["page_token"] = next_page_token
+
+@traced
+def find_jobs_by_name(job_name):
+    return [job for job in iter_jobs(name=job_name) if job.get("settings", {}).get("name") == job_name]
+
+@traced
+def refresh_job_inventory(inventory):
+    """Page through every job once and keep the ones this CLI creates (mlops_*)."""
+    jobs = []
+    for job in iter_jobs():
+        job_name = job.get("settings", {}).get("name", "")
+        if job_name.startswith("mlops_"):
+            jobs.append((job["job_id"], job_name))
+    inventory.replace_jobs(jobs)
+    inventory.mark_synced(DATABRICKS_JOBS, full=True)
+
+@traced
+def job_exists(job_name):
+    inventory = get_inventory()
+    if inventory is not None:
+        inventory.ensure_fresh(DATABRICKS_JOBS, refresh_job_inventory)
+        return inventory.has_job(job_name)
+    return any(True for _ in find_jobs_by_name(job_name))
+
+@traced
+def build_job_name_index(prefix=None):
+    """Full scan of the workspace into a set of job names, for checking many names at once."""
+    index = set()
+    for job in iter_jobs():
+        job_name = job.get("settings", {}).get("name")
+        if job_name and (prefix is None or job_name.startswith(prefix)):
+            index.add(job_name)
+    return index
+
+@traced
 def validate_databricks_job_availability(repo_name, branch="dev"):
     job_names = [
         f"mlops_{repo_name}_train_{branch}",
         f"mlops_{repo_name}_infer_{branch}"
     ]
 
-    response = requests.get(
-        f"{DATABRICKS_HOST}/api/2.1/jobs/list",
-        headers=headers
-    )
-
-    if response.status_code != 200:
-        logger.error(f"Databricks API error: {response.text}")
-        raise ValueError(f"Databricks API error: {response.text}")
-
-    existing_jobs = response.json().get("jobs", [])
-    existing_job_names = [job['settings']['name'] for job in existing_jobs]
-
-    conflicts = [job_name for job_name in job_names if job_name in existing_job_names]
+    conflicts = [job_name for job_name in job_names if job_exists(job_name)]
 
     if conflicts:
         raise ValueError(f"Databricks job(s) already exist: {', '.join(conflicts)}")
 
     logger.info("✅ Databricks job names are available.")
 
+@traced
 def import_repo_to_databricks(git_url, repo_name):
     payload = {
         "url": git_url,
@@ -47,7 +102,7 @@ def import_repo_to_databricks(git_url, repo_name):
         "path": f"/Repos/{DATABRICKS_USERNAME}/{repo_name}"
     }
 
-    response = requests.post(
+    response = get_session().post(
         f"{DATABRICKS_HOST}/api/2.0/repos",
         json=payload,
         headers=headers
@@ -62,8 +117,26 @@ def import_repo_to_databricks(git_url, repo_name):
 
     return repo_id
 
+@traced
+def find_workspace_repo(repo_name):
+    """ID of the Databricks repo imported for ``repo_name``, or None."""
+    path = f"/Repos/{DATABRICKS_USERNAME}/{repo_name}"
+    response = get_session().get(
+        f"{DATABRICKS_HOST}/api/2.0/repos",
+        params={"path_prefix": path},
+        headers=headers
+    )
+    if response.status_code != 200:
+        logger.error(f"Databricks repo lookup failed: {response.text}")
+        raise Exception(f"Databricks repo lookup failed: {response.text}")
+    for workspace_repo in response.json().get("repos", []):
+        if workspace_repo.get("path") == path:
+            return workspace_repo.get("id")
+    return None
+
+@traced
 def create_job(job_json):
-    response = requests.post(
+    response = get_session().post(
         f"{DATABRICKS_HOST}/api/2.1/jobs/create",
         json=job_json,
         headers=headers
@@ -74,12 +147,15 @@ def create_job(job_json):
         raise Exception(f"Databricks Job Creation Failed: {response.text}")
 
     job_id = response.json().get('job_id')
+    inventory = get_inventory()
+    if inventory is not None:
+        inventory.record_job(job_json['name'], job_id)
     logger.info(f"✅ Databricks job '{job_json['name']}' created successfully with Job ID {job_id}.")
 
     return job_id
 
-def create_jobs(repo_name, git_url, branch="dev"):
-    train_job_json = {
+def build_train_job_json(repo_name, git_url, branch="dev"):
+    return {
         "name": f"mlops_{repo_name}_train_{branch}",
         "git_source": {
             "git_url": git_url,
@@ -105,7 +181,8 @@ def create_jobs(repo_name, git_url, branch="dev"):
         "queue": {"enabled": True}
     }
 
-    infer_job_json = {
+def build_infer_job_json(repo_name, git_url, branch="dev"):
+    return {
         "name": f"mlops_{repo_name}_infer_{branch}",
         "git_source": {
             "git_url": git_url,
@@ -131,7 +208,60 @@ def create_jobs(repo_name, git_url, branch="dev"):
         "queue": {"enabled": True}
     }
 
-    train_job_id = create_job(train_job_json)
-    infer_job_id = create_job(infer_job_json)
+@traced
+def run_job_now(job_id):
+    response = get_session().post(
+        f"{DATABRICKS_HOST}/api/2.1/jobs/run-now",
+        json={"job_id": job_id},
+        headers=headers
+    )
+
+    if response.status_code != 200:
+        logger.error(f"Databricks run-now failed for job {job_id}: {response.text}")
+        raise Exception(f"Databricks run-now failed for job {job_id}: {response.text}")
+
+    run_id = response.json().get("run_id")
+    logger.info(f"🚀 Triggered Databricks job {job_id} (Run ID {run_id}).")
+    return run_id
+
+@traced
+def get_run(run_id):
+    response = get_session().get(
+        f"{DATABRICKS_HOST}/api/2.1/jobs/runs/get",
+        params={"run_id": run_id},
+        headers=headers
+    )
+
+    if response.status_code != 200:
+        logger.error(f"Databricks runs/get failed for run {run_id}: {response.text}")
+        raise Exception(f"Databricks runs/get failed for run {run_id}: {response.text}")
+    return response.json()
+
+def iter_active_runs(page_size=25):
+    """Yield every active run in the workspace (runs/list with active_only), following next_page_token."""
+    params = {"active_only": "true", "limit": page_size}
+    while True:
+        response = get_session().get(
+            f"{DATABRICKS_HOST}/api/2.1/jobs/runs/list",
+            headers=headers,
+            params=params
+        )
+
+        if response.status_code != 200:
+            logger.error(f"Databricks API error: {response.text}")
+            raise ValueError(f"Databricks API error: {response.text}")
+
+        page = response.json()
+        yield from page.get("runs", [])
+
+        next_page_token = page.get("next_page_token")
+        if not page.get("has_more") or not next_page_token:
+            break
+        params["page_token"] = next_page_token
+
+@traced
+def create_jobs(repo_name, git_url, branch="dev"):
+    train_job_id = create_job(build_train_job_json(repo_name, git_url, branch))
+    infer_job_id = create_job(build_infer_job_json(repo_name, git_url, branch))
 
     return train_job_id, infer_job_id
@@ -1,26 +1,201 @@
 import os
 import json
-import requests
-import zipfile
+import logging
+import tarfile
 import tempfile
-from github import Github
+import threading
+from io import BytesIO
+from urllib.parse import urlparse
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import git
+from gitdb import IStream
+from git.index.typ import BaseIndexEntry
+from github import Github, InputGitTreeElement
 from github.GithubException import GithubException
 from dotenv import load_dotenv
 from base64 import b64encode
 from nacl import encoding, public
 from cli.logger import setup_logger
+from cli.template_cache import get_template_cache
+from cli.http_client import HTTP_TIMEOUT, get_session, route_github_through_session
+from cli.inventory import GITHUB_REPOS, get_inventory
+from cli.tracing import traced, bind
 
 # Load environment variables (locally or from GitHub Actions)
 load_dotenv()
 logger = setup_logger()
 
 GH_TOKEN = os.getenv("GH_TOKEN")  # renamed from GITHUB_TOKEN
-TEMPLATE_REPO_ZIP_URL = "https://github.com/Ashoke238/model_train_infer/archive/refs/heads/main.zip"
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+GITHUB_GRAPHQL_URL = os.getenv("GITHUB_GRAPHQL_URL", f"{GITHUB_API_URL}/graphql")
+TEMPLATE_REPO_ZIP_URL = os.getenv(
+    "TEMPLATE_REPO_ZIP_URL", "https://github.com/Ashoke238/model_train_infer/archive/refs/heads/main.zip"
+)
+TEMPLATE_REPO_TARBALL_URL = os.getenv(
+    "TEMPLATE_REPO_TARBALL_URL", "https://github.com/Ashoke238/model_train_infer/archive/refs/heads/main.tar.gz"
+)
+
+CONFIG_FILE_PATH = "mlops_config/mlops_config_dev.json"
+UPLOAD_MODES = ("bulk", "contents", "git")
+UPLOAD_WORKERS = int(os.getenv("UPLOAD_WORKERS", "8"))
+SECRET_WORKERS = int(os.getenv("SECRET_WORKERS", "8"))
+TEMPLATE_COMMIT_AUTHOR = git.Actor("cli_gh", "cli_gh@users.noreply.github.com")
+# Text files up to this size are sent inline with the tree instead of as separate blobs,
+# until the inline payload of a single tree request reaches INLINE_TREE_MAX_BYTES
+INLINE_BLOB_MAX_BYTES = 512 * 1024
+INLINE_TREE_MAX_BYTES = 4 * 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def get_github_client():
+    """Single PyGithub client for the whole run, sending requests over the shared session.
+
+    PyGithub's own request spacing is disabled; the shared rate limiter paces GitHub calls instead.
+    """
+    route_github_through_session()
+    return Github(
+        GH_TOKEN,
+        base_url=GITHUB_API_URL,
+        timeout=int(HTTP_TIMEOUT),
+        per_page=100,
+        seconds_between_requests=None,
+        seconds_between_writes=None
+    )
+
+
+_github_user_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _load_github_user():
+    user = get_github_client().get_user()
+    # PyGithub loads the user lazily; complete it here so concurrent steps don't each send GET /user
+    user.login
+    return user
+
+
+def get_github_user():
+    """Authenticated user, so its login is only fetched once per run, even by concurrent steps."""
+    with _github_user_lock:
+        return _load_github_user()
+
+
+get_github_user.cache_clear = _load_github_user.cache_clear
+
+
+def github_headers():
+    return {
+        "Authorization": f"Bearer {GH_TOKEN}",
+        "Accept": "application/vnd.github+json"
+    }
 
 
+@traced
+def github_graphql(query, variables=None):
+    """Run a GraphQL query and return ``(data, errors)``.
+
+    GitHub answers 200 with partial data when some fields fail (e.g. a repo
+    that doesn't exist), so errors are returned for the caller to judge.
+    """
+    response = get_session().post(
+        GITHUB_GRAPHQL_URL,
+        headers=github_headers(),
+        json={"query": query, "variables": variables or {}},
+        # Queries are safe to resend on a gateway error; mutations are not
+        read_only=not query.lstrip().startswith("mutation")
+    )
+    if response.status_code != 200:
+        logger.error(f"GitHub GraphQL error: {response.text}")
+        raise Exception(f"GitHub GraphQL error: {response.text}")
+    body = response.json()
+    return body.get("data") or {}, body.get("errors") or []
+
+
+@traced
+def refresh_repo_inventory(inventory):
+    """Sync the repo inventory from GET /user/repos.
+
+    Incremental refreshes only ask for repos updated since the newest one we
+    know about and revalidate the first page with its ETag, so an unchanged
+    account costs a single 304. A full listing runs periodically to drop
+    deleted repos.
+    """
+    full = inventory.needs_full_refresh(GITHUB_REPOS)
+    state = inventory.sync_state(GITHUB_REPOS) or {}
+    params = {"per_page": 100, "affiliation": "owner", "sort": "updated", "direction": "desc"}
+    request_headers = github_headers()
+    if not full:
+        since = inventory.latest_repo_update()
+        if since:
+            params["since"] = since
+        if state.get("etag") and state.get("cursor") == since:
+            request_headers["If-None-Match"] = state["etag"]
+
+    url = f"{GITHUB_API_URL}/user/repos"
+    repos = []
+    etag = None
+    while url:
+        response = get_session().get(url, headers=request_headers, params=params)
+        if response.status_code == 304:
+            inventory.mark_synced(GITHUB_REPOS)
+            return
+        if response.status_code != 200:
+            logger.error(f"GitHub API error: {response.text}")
+            raise Exception(f"GitHub API error: {response.text}")
+        if etag is None:
+            etag = response.headers.get("ETag", "")
+        repos.extend(response.json())
+        # The next link already carries the query string
+        url = response.links.get("next", {}).get("url")
+        params = None
+        request_headers = github_headers()
+
+    inventory.upsert_repos(repos, replace=full)
+    inventory.mark_synced(GITHUB_REPOS, etag=etag, cursor=inventory.latest_repo_update() or "", full=full)
+
+
+def iter_user_repos():
+    """Yield every repo owned by the authenticated user, 100 per page."""
+    url = f"{GITHUB_API_URL}/user/repos"
+    params = {"per_page": 100, "affiliation": "owner"}
+    while url:
+        response = get_session().get(url, headers=github_headers(), params=params)
+        if response.status_code != 200:
+            logger.error(f"GitHub API error: {response.text}")
+            raise Exception(f"GitHub API error: {response.text}")
+        yield from response.json()
+        url = response.links.get("next", {}).get("url")
+        params = None
+
+
+@traced
+def repo_has_file(full_name, path, ref=None):
+    """Check a file exists in a repo with a single HEAD request (no content transfer)."""
+    response = get_session().head(
+        f"{GITHUB_API_URL}/repos/{full_name}/contents/{path}",
+        headers=github_headers(),
+        params={"ref": ref} if ref else None
+    )
+    if response.status_code == 200:
+        return True
+    if response.status_code == 404:
+        return False
+    logger.error(f"GitHub API error checking '{path}' in '{full_name}': {response.status_code}")
+    raise Exception(f"GitHub API error checking '{path}' in '{full_name}': {response.status_code}")
+
+
+@traced
 def validate_repo_availability(repo_name):
-    g = Github(GH_TOKEN)
-    user = g.get_user()
+    inventory = get_inventory()
+    if inventory is not None:
+        inventory.ensure_fresh(GITHUB_REPOS, refresh_repo_inventory)
+        if inventory.has_repo(repo_name):
+            raise Exception(f"Repository '{repo_name}' already exists.")
+        logger.info(f"✅ Repository '{repo_name}' is available (inventory).")
+        return
+
+    user = get_github_user()
     try:
         user.get_repo(repo_name)
         raise Exception(f"Repository '{repo_name}' already exists.")
@@ -30,64 +205,203 @@ def validate_repo_availability(repo_name):
     logger.info(f"✅ Repository '{repo_name}' is available.")
 
 
-def create_github_repo(repo_name):
-    g = Github(GH_TOKEN)
-    user = g.get_user()
-    repo = user.create_repo(repo_name, private=True, auto_init=True)
-    logger.info(f"✅ Created repository '{repo_name}' with auto-initialized 'main' branch.")
+@traced
+def create_github_repo(repo_name, auto_init=True):
+    user = get_github_user()
+    repo = user.create_repo(repo_name, private=True, auto_init=auto_init)
+    inventory = get_inventory()
+    if inventory is not None:
+        inventory.record_repo(repo_name, repo.full_name, repo.clone_url, repo.html_url)
+    if auto_init:
+        logger.info(f"✅ Created repository '{repo_name}' with auto-initialized 'main' branch.")
+    else:
+        logger.info(f"✅ Created empty repository '{repo_name}'.")
     return repo
 
 
+@traced
 def download_and_extract_template():
-    tmp_dir = tempfile.mkdtemp()
-    zip_path = os.path.join(tmp_dir, "template_repo.zip")
+    """Return the extracted template folder, reusing the local cache when upstream is unchanged."""
+    return get_template_cache().fetch(TEMPLATE_REPO_ZIP_URL)
+
+
+def iter_template_files(local_folder):
+    """Yield (repo_path, content, mode) for every file in the extracted template."""
+    for root, _, files in os.walk(local_folder):
+        for file in files:
+            local_file_path = os.path.join(root, file)
+            repo_file_path = os.path.relpath(local_file_path, local_folder).replace("\\", "/")
 
-    response = requests.get(TEMPLATE_REPO_ZIP_URL)
-    response.raise_for_status()
+            with open(local_file_path, 'rb') as f:
+                content = f.read()
+
+            mode = "100755" if os.access(local_file_path, os.X_OK) else "100644"
+            yield repo_file_path, content, mode
 
-    with open(zip_path, "wb") as f:
-        f.write(response.content)
 
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(tmp_dir)
+def stream_template_files(url=None):
+    """Yield (repo_path, content, mode) for each template file while the tarball is still downloading.
 
-    extracted_contents = os.listdir(tmp_dir)
-    for item in extracted_contents:
-        item_path = os.path.join(tmp_dir, item)
-        if os.path.isdir(item_path):
-            return item_path
-    raise Exception("No extracted folder found after downloading template.")
+    Only one file is held in memory at a time and nothing is written to disk.
+    """
+    response = get_session().get(url or TEMPLATE_REPO_TARBALL_URL, stream=True)
+    with response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        with tarfile.open(fileobj=response.raw, mode="r|gz") as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+                # Strip the '<repo>-<branch>/' folder GitHub wraps the archive in
+                repo_file_path = member.name.split("/", 1)[-1]
+                content = tar.extractfile(member).read()
+                mode = "100755" if member.mode & 0o111 else "100644"
+                yield repo_file_path, content, mode
 
 
-def push_files_to_repo(repo, local_folder, branch="main"):
-    g = Github(GH_TOKEN)
-    repo = g.get_repo(repo.full_name)
+@traced
+def push_files_to_repo(repo, files, branch="main"):
     existing_files = {content.path for content in repo.get_contents("", ref=branch)}
 
-    for root, _, files in os.walk(local_folder):
-        for file in files:
-            local_file_path = os.path.join(root, file)
-            repo_file_path = os.path.relpath(local_file_path, local_folder).replace("\\", "/")
+    for repo_file_path, content, _ in files:
+        if repo_file_path in existing_files:
+            continue  # Skip existing files like README.md
+
+        repo.create_file(
+            path=repo_file_path,
+            message=f"Add {repo_file_path}",
+            content=content,
+            branch=branch
+        )
+
+    logger.info("✅ Template files uploaded successfully.")
+
 
+@traced
+def create_blob(repo, content):
+    response = get_session().post(
+        f"{repo.url}/git/blobs",
+        headers=github_headers(),
+        json={"content": b64encode(content).decode("utf-8"), "encoding": "base64"}
+    )
+    if response.status_code != 201:
+        logger.error(f"GitHub blob creation failed: {response.text}")
+        raise Exception(f"GitHub blob creation failed: {response.text}")
+    return response.json()["sha"]
+
+
+@traced
+def push_files_to_repo_bulk(repo, files, branch="main", message="Add template files", max_workers=UPLOAD_WORKERS):
+    """Upload the whole template as a single commit through the Git Data API.
+
+    Blobs are created concurrently as files arrive, so uploading overlaps with
+    reading (or streaming) the template. At most ``2 * max_workers`` blobs are
+    buffered at once.
+    """
+    ref = repo.get_git_ref(f"heads/{branch}")
+    base_commit = repo.get_git_commit(ref.object.sha)
+    existing_files = {element.path for element in repo.get_git_tree(base_commit.sha, recursive=True).tree}
+
+    slots = threading.BoundedSemaphore(max_workers * 2)
+
+    def upload_blob(content):
+        try:
+            return create_blob(repo, content)
+        finally:
+            slots.release()
+
+    elements = []
+    blob_futures = []
+    inline_bytes = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for repo_file_path, content, mode in files:
             if repo_file_path in existing_files:
                 continue  # Skip existing files like README.md
 
-            with open(local_file_path, 'rb') as f:
-                content = f.read()
+            text = None
+            if len(content) <= INLINE_BLOB_MAX_BYTES and inline_bytes + len(content) <= INLINE_TREE_MAX_BYTES:
+                try:
+                    text = content.decode("utf-8")
+                except UnicodeDecodeError:
+                    pass
 
-            repo.create_file(
-                path=repo_file_path,
-                message=f"Add {repo_file_path}",
-                content=content,
-                branch=branch
-            )
+            if text is not None:
+                inline_bytes += len(content)
+                elements.append(InputGitTreeElement(repo_file_path, mode, "blob", content=text))
+            else:
+                slots.acquire()
+                blob_futures.append((repo_file_path, mode, executor.submit(bind(upload_blob), content)))
 
-    logger.info("✅ Template files uploaded successfully.")
+        for repo_file_path, mode, future in blob_futures:
+            elements.append(InputGitTreeElement(repo_file_path, mode, "blob", sha=future.result()))
+
+    if not elements:
+        logger.info("✅ No new template files to upload.")
+        return
+
+    tree = repo.create_git_tree(elements, base_tree=base_commit.tree)
+    commit = repo.create_git_commit(message, tree, [base_commit])
+    ref.edit(commit.sha)
+
+    logger.info(f"✅ Template files uploaded in a single commit ({len(elements)} files, {len(blob_futures)} blobs).")
+
+
+@traced
+def push_template_via_git(repo, files, branches=("main", "dev"), message="Add template files", remote_url=None):
+    """Commit the template once in a scratch git repo and push all branches in a single git push."""
+    if remote_url is None:
+        remote_url = repo.clone_url.replace("https://", f"https://x-access-token:{GH_TOKEN}@", 1)
+
+    base_branch, *other_branches = branches
+    with tempfile.TemporaryDirectory() as git_dir:
+        local_repo = git.Repo.init(git_dir)
+        local_repo.git.symbolic_ref("HEAD", f"refs/heads/{base_branch}")
+
+        # Write blobs straight into the object database; the scratch work tree stays empty
+        entries = []
+        for repo_file_path, content, mode in files:
+            istream = local_repo.odb.store(IStream("blob", len(content), BytesIO(content)))
+            entries.append(BaseIndexEntry((int(mode, 8), istream.binsha, 0, repo_file_path)))
+        local_repo.index.add(entries)
+        local_repo.index.commit(message, author=TEMPLATE_COMMIT_AUTHOR, committer=TEMPLATE_COMMIT_AUTHOR)
 
+        for branch in other_branches:
+            local_repo.create_head(branch)
 
+        remote = local_repo.create_remote("origin", remote_url)
+        push_infos = remote.push([f"refs/heads/{branch}:refs/heads/{branch}" for branch in branches])
+        failed = [info.remote_ref_string for info in push_infos if info.flags & info.ERROR]
+        if failed or len(push_infos) != len(branches):
+            raise Exception(f"git push to '{repo.full_name}' failed for: {', '.join(failed) or ', '.join(branches)}")
+
+    logger.info(f"✅ Template pushed over git in one commit ({len(entries)} files) to branches: {', '.join(branches)}.")
+
+
+@traced
+def get_existing_repo(repo_name):
+    """The user's repo called ``repo_name``, or None if it doesn't exist."""
+    try:
+        return get_github_user().get_repo(repo_name)
+    except GithubException as e:
+        if e.status == 404:
+            return None
+        raise
+
+
+@traced
+def branch_exists(repo_name, branch):
+    try:
+        get_github_user().get_repo(repo_name).get_git_ref(f"heads/{branch}")
+        return True
+    except GithubException as e:
+        if e.status == 404:
+            return False
+        raise
+
+
+@traced
 def create_dev_branch(repo_name, base_branch="main", new_branch="dev"):
-    g = Github(GH_TOKEN)
-    repo = g.get_user().get_repo(repo_name)
+    repo = get_github_user().get_repo(repo_name)
     base_sha = repo.get_git_ref(f"heads/{base_branch}").object.sha
     repo.create_git_ref(ref=f"refs/heads/{new_branch}", sha=base_sha)
     logger.info(f"✅ Branch '{new_branch}' created from '{base_branch}'.")
@@ -101,42 +415,122 @@ def encrypt_secret(public_key: str, secret_value: str) -> str:
     return b64encode(encrypted).decode("utf-8")
 
 
-def add_github_repo_secrets(repo_name, secrets_dict):
-    """Push secrets into the newly created GitHub repo."""
-    g = Github(GH_TOKEN)
-    repo = g.get_user().get_repo(repo_name)
-
-    # Get public key for secrets
-    public_key_response = repo._requester.requestJsonAndCheck(
-        "GET", repo.url + "/actions/secrets/public-key"
-    )[1]
-
-    public_key = public_key_response["key"]
-    key_id = public_key_response["key_id"]
-
-    for secret_name, secret_value in secrets_dict.items():
-        encrypted_value = encrypt_secret(public_key, secret_value)
-        repo._requester.requestJsonAndCheck(
-            "PUT",
-            repo.url + f"/actions/secrets/{secret_name}",
-            input={
-                "encrypted_value": encrypted_value,
-                "key_id": key_id
-            }
-        )
+def repo_api_url(repo_name):
+    return f"{GITHUB_API_URL}/repos/{get_github_user().login}/{repo_name}"
+
+
+@lru_cache(maxsize=None)
+@traced
+def get_repo_public_key(repo_url):
+    """Actions public key of a repo as ``(key_id, key)``, fetched once per run."""
+    response = get_session().get(f"{repo_url}/actions/secrets/public-key", headers=github_headers())
+    if response.status_code != 200:
+        logger.error(f"GitHub public key lookup failed: {response.text}")
+        raise Exception(f"GitHub public key lookup failed: {response.text}")
+    data = response.json()
+    return data["key_id"], data["key"]
+
+
+@traced
+def put_repo_secret(repo_url, key_id, public_key, secret_name, secret_value):
+    response = get_session().put(
+        f"{repo_url}/actions/secrets/{secret_name}",
+        headers=github_headers(),
+        json={"encrypted_value": encrypt_secret(public_key, secret_value), "key_id": key_id}
+    )
+    # 201 when the secret is created, 204 when an existing one is updated
+    if response.status_code not in (201, 204):
+        logger.error(f"GitHub secret '{secret_name}' update failed: {response.text}")
+        raise Exception(f"GitHub secret '{secret_name}' update failed: {response.text}")
+
+
+@traced
+def add_github_repo_secrets(repo_name, secrets_dict, repo=None, max_workers=SECRET_WORKERS):
+    """Push secrets into the newly created GitHub repo.
+
+    The secrets are encrypted and PUT concurrently over the shared session;
+    pass ``repo`` when it is already at hand to skip looking it up.
+    """
+    repo_url = repo.url if repo is not None else repo_api_url(repo_name)
+    key_id, public_key = get_repo_public_key(repo_url)
+
+    if secrets_dict:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(secrets_dict))) as executor:
+            futures = [
+                executor.submit(bind(put_repo_secret), repo_url, key_id, public_key, secret_name, secret_value)
+                for secret_name, secret_value in secrets_dict.items()
+            ]
+            for future in futures:
+                future.result()
 
     logger.info(f"✅ GitHub secrets added to '{repo_name}' successfully.")
 
 
-def create_and_setup_repo(repo_name):
-    validate_repo_availability(repo_name)
-    repo = create_github_repo(repo_name)
-    local_folder = download_and_extract_template()
-    push_files_to_repo(repo, local_folder)
-    create_dev_branch(repo_name)
+def github_web_url():
+    """Web host for GITHUB_API_URL: github.com for the public API, otherwise the API's own host (GHES, stand-ins)."""
+    api = urlparse(GITHUB_API_URL)
+    if api.netloc == "api.github.com":
+        return "https://github.com"
+    return f"{api.scheme}://{api.netloc}"
+
+
+def expected_clone_url(repo_name):
+    """Clone URL GitHub will assign to a repo created under the authenticated user."""
+    user = get_github_user()
+    # The user's profile URL is on the same host as their repos, including on GHES
+    profile_url = user.html_url or f"{github_web_url()}/{user.login}"
+    return f"{profile_url.rstrip('/')}/{repo_name}.git"
+
+
+def apply_job_ids(config_json, repo_name, train_job_id, infer_job_id):
+    config_json["train_job_id"] = train_job_id
+    config_json["infer_job_id"] = infer_job_id
+    config_json["repo_name"] = repo_name
+    return config_json
+
+
+def with_job_ids_in_config(files, repo_name, train_job_id, infer_job_id):
+    """Pass template files through, writing the job IDs into the config file on the way."""
+    found = False
+    for repo_file_path, content, mode in files:
+        if repo_file_path == CONFIG_FILE_PATH:
+            config_json = apply_job_ids(json.loads(content.decode("utf-8")), repo_name, train_job_id, infer_job_id)
+            content = json.dumps(config_json, indent=4).encode("utf-8")
+            found = True
+        yield repo_file_path, content, mode
+
+    if not found:
+        raise Exception(f"'{CONFIG_FILE_PATH}' not found in the template.")
+    logger.info(f"✅ '{CONFIG_FILE_PATH}' written with job IDs in the initial commit.")
+
+
+def template_files(stream_template=False):
+    """Template files to upload, either streamed from the tarball or read from the cached tree."""
+    if stream_template:
+        return stream_template_files()
+    return iter_template_files(download_and_extract_template())
+
+
+@traced
+def create_repo_for_upload(repo_name, upload_mode="bulk"):
+    if upload_mode not in UPLOAD_MODES:
+        raise ValueError(f"Unknown upload mode '{upload_mode}'. Expected one of: {', '.join(UPLOAD_MODES)}")
+    # The git push creates both 'main' and 'dev', so the repo must start empty
+    return create_github_repo(repo_name, auto_init=upload_mode != "git")
+
+
+@traced
+def push_template(repo, files, upload_mode="bulk"):
+    """Push the template with the chosen transport. Only the 'git' transport also creates 'dev'."""
+    if upload_mode == "git":
+        push_template_via_git(repo, files)
+    elif upload_mode == "bulk":
+        push_files_to_repo_bulk(repo, files)
+    else:
+        push_files_to_repo(repo, files)
+
 
-    # Add secrets after dev branch is created
-    username = os.getenv("DATABRICKS_USERNAME")
+def repo_secrets_from_env():
     secrets_dict = {
         "DATABRICKS_HOST": os.getenv("DATABRICKS_HOST"),
         "DATABRICKS_TOKEN": os.getenv("DATABRICKS_TOKEN"),
@@ -146,24 +540,47 @@ def create_and_setup_repo(repo_name):
     }
     for key, value in secrets_dict.items():
         logger.info(f"🔍 Secret {key}: {'✅ SET' if value else '❌ MISSING'}")
-    add_github_repo_secrets(repo_name, secrets_dict)
+    return secrets_dict
+
+
+@traced
+def create_and_setup_repo(repo_name, upload_mode="bulk", stream_template=False):
+    validate_repo_availability(repo_name)
+    files = template_files(stream_template)
+    repo = create_repo_for_upload(repo_name, upload_mode)
+    # Secrets only need the repo to exist
+    add_github_repo_secrets(repo_name, repo_secrets_from_env(), repo=repo)
+    push_template(repo, files, upload_mode)
+    if upload_mode != "git":
+        create_dev_branch(repo_name)
 
     return repo.clone_url
 
 
+@traced
+def config_has_job_ids(repo_name, train_job_id, infer_job_id, branch="dev"):
+    """Whether the config file on ``branch`` already holds these job IDs (e.g. from an interrupted run)."""
+    try:
+        contents = get_github_user().get_repo(repo_name).get_contents(CONFIG_FILE_PATH, ref=branch)
+    except GithubException as e:
+        if e.status == 404:
+            return False
+        raise
+    config_json = json.loads(contents.decoded_content.decode("utf-8"))
+    return config_json.get("train_job_id") == train_job_id and config_json.get("infer_job_id") == infer_job_id
+
+
+@traced
 def update_config_json(repo_name, train_job_id, infer_job_id, branch="dev"):
-    g = Github(GH_TOKEN)
-    repo = g.get_user().get_repo(repo_name)
-    file_path = "mlops_config/mlops_config_dev.json"
+    repo = get_github_user().get_repo(repo_name)
+    file_path = CONFIG_FILE_PATH
     logger.info(f"Updating '{file_path}' with new job IDs...")
 
     contents = repo.get_contents(file_path, ref=branch)
-    logger.info(f"Contents of the file: {contents.decoded_content.decode('utf-8')}")
-    config_json = json.loads(contents.decoded_content.decode('utf-8'))
-
-    config_json["train_job_id"] = train_job_id
-    config_json["infer_job_id"] = infer_job_id
-    config_json["repo_name"] = repo_name
+    # The whole file only at DEBUG, and only decoded for the log when DEBUG is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Contents of the file: {contents.decoded_content.decode('utf-8')}")
+    config_json = apply_job_ids(json.loads(contents.decoded_content.decode('utf-8')), repo_name, train_job_id, infer_job_id)
 
     repo.update_file(
         path=file_path,
@@ -0,0 +1,166 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from functools import lru_cache
+import requests
+from requests.structures import CaseInsensitiveDict
+from cli.logger import setup_logger
+
+logger = setup_logger()
+
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE", "1").lower() not in ("0", "false", "no")
+HTTP_CACHE_DIR = os.getenv(
+    "HTTP_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "cli_gh", "http")
+)
+HTTP_CACHE_MAX_BYTES = int(os.getenv("HTTP_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+VALIDATOR_HEADERS = ("If-None-Match", "If-Modified-Since")
+# Per-response headers that must not be replayed from the cache
+UNCACHED_HEADERS = ("date", "x-ratelimit-limit", "x-ratelimit-remaining", "x-ratelimit-reset",
+                    "x-ratelimit-used", "x-github-request-id", "content-encoding", "transfer-encoding")
+
+
+class HttpCache:
+    """On-disk cache of GET responses that carry an ETag or Last-Modified.
+
+    Entries are keyed by the full URL, the Accept header and a hash of the
+    Authorization header, so two tokens never share an entry and the token
+    itself is never written to disk. A cached entry turns the next request
+    into a conditional one; on 304 the stored body is replayed. GitHub does
+    not count 304s against the primary rate limit. Least recently used
+    entries (by file mtime) are evicted past ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir=HTTP_CACHE_DIR, max_bytes=HTTP_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes = None
+
+    def key(self, url, headers):
+        headers = CaseInsensitiveDict(headers or {})
+        scope = hashlib.sha256((headers.get("Authorization") or "").encode("utf-8")).hexdigest()
+        material = f"{url}\n{headers.get('Accept', '')}\n{scope}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def load(self, key):
+        """Return ``(meta, body)`` for ``key`` or None, marking the entry as recently used."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline().decode("utf-8"))
+                body = f.read()
+            os.utime(path)
+        except (FileNotFoundError, ValueError):
+            return None
+        return meta, body
+
+    def validators(self, entry):
+        meta, _ = entry
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def store(self, key, response):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified) or "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        body = response.content
+        if len(body) > self.max_bytes // 8:
+            return
+        meta = {
+            "url": response.url,
+            "status": response.status_code,
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": {name: value for name, value in response.headers.items() if name.lower() not in UNCACHED_HEADERS}
+        }
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(json.dumps(meta).encode("utf-8") + b"\n")
+            f.write(body)
+        os.replace(tmp_path, path)
+        self._account(os.path.getsize(path))
+
+    def replay(self, entry, response):
+        """Build the response a 304 stands for from the cached entry."""
+        meta, body = entry
+        cached = requests.Response()
+        cached.status_code = meta["status"]
+        cached._content = body
+        cached.headers = CaseInsensitiveDict(meta["headers"])
+        # Fresh rate-limit headers come from the 304 itself
+        cached.headers.update({name: value for name, value in response.headers.items() if name.lower() in UNCACHED_HEADERS})
+        cached.url = meta["url"]
+        cached.request = response.request
+        cached.reason = "OK (cached)"
+        cached.encoding = response.encoding
+        cached.elapsed = response.elapsed
+        cached.from_cache = True
+        return cached
+
+    def _entries(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.startswith(".tmp-"):
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    yield path, stat.st_size, stat.st_mtime
+
+    def _account(self, added):
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_bytes += added
+            if self._total_bytes <= self.max_bytes:
+                return
+            entries = sorted(self._entries(), key=lambda entry: entry[2])
+            total = sum(size for _, size, _ in entries)
+            evicted = 0
+            # Evict down to 90% so the scan isn't repeated on every write
+            for path, size, _ in entries:
+                if total <= self.max_bytes * 0.9:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                evicted += 1
+            self._total_bytes = total
+            logger.info(f"🧹 Evicted {evicted} cached HTTP responses.")
+
+    def count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+@lru_cache(maxsize=None)
+def get_http_cache():
+    """The shared response cache, or None when disabled with HTTP_CACHE=0."""
+    return HttpCache() if HTTP_CACHE_ENABLED else None
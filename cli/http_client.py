@@ -0,0 +1,267 @@
+import os
+import time
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from github.Requester import Requester, RequestsResponse
+from cli.rate_limiter import get_rate_limiter
+from cli.http_cache import VALIDATOR_HEADERS, get_http_cache
+from cli.cassette import CassetteAdapter, get_cassette
+from cli.metrics import get_metrics, endpoint_template, host_of
+from cli.tracing import get_tracer, SPAN_KIND_CLIENT
+
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "30"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "5"))
+HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5"))
+HTTP_BACKOFF_JITTER = float(os.getenv("HTTP_BACKOFF_JITTER", "0.5"))
+HTTP_BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "60"))
+# Connections kept open per host; raise it when running many workers against one host
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "32"))
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Gateway errors a read-only POST (e.g. a GraphQL query) is retried on
+READ_ONLY_POST_RETRY_STATUSES = (502, 503, 504)
+
+# Set for the duration of a request sent with read_only=True; read by RetryPolicy on the same thread
+_read_only_request = ContextVar("read_only_request", default=False)
+
+
+class RetryPolicy(Retry):
+    """Exponential backoff with jitter that honours ``Retry-After``.
+
+    Idempotent methods are retried on 429 and 5xx. POST/PATCH are only retried
+    when the server rejected the request outright (429, or GitHub's secondary
+    rate limit 403 with ``Retry-After``), so a slow 5xx never creates a
+    duplicate job or commit. POSTs sent with ``read_only=True`` (GraphQL
+    queries) are also retried on 502/503/504.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if self.total and (status_code == 429 or (status_code == 403 and has_retry_after)):
+            return True
+        if self.total and _read_only_request.get() and status_code in READ_ONLY_POST_RETRY_STATUSES:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def build_retry_policy():
+    return RetryPolicy(
+        total=HTTP_MAX_RETRIES,
+        status_forcelist=RETRY_STATUSES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        backoff_jitter=HTTP_BACKOFF_JITTER,
+        backoff_max=HTTP_BACKOFF_MAX,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+
+
+class SharedSession(requests.Session):
+    """requests.Session that applies a default timeout and the shared rate limiter to every call.
+
+    With a ``cache``, plain GETs to GitHub and Databricks are revalidated
+    with the stored ETag/Last-Modified and 304s are answered from the cache.
+    Streaming downloads and requests that carry their own validators are
+    left alone.
+    """
+
+    def __init__(self, timeout=HTTP_TIMEOUT, cache=None):
+        super().__init__()
+        self.timeout = timeout
+        self.cache = cache
+
+    def _cache_key(self, method, url, kwargs):
+        if self.cache is None or method.upper() != "GET" or kwargs.get("stream"):
+            return None
+        if get_rate_limiter().service_for_url(url) is None:
+            return None
+        headers = kwargs.get("headers") or {}
+        if any(name.lower() == validator.lower() for name in headers for validator in VALIDATOR_HEADERS):
+            return None
+        full_url = requests.Request("GET", url, params=kwargs.get("params")).prepare().url
+        return self.cache.key(full_url, headers)
+
+    def request(self, method, url, read_only=False, **kwargs):
+        """``read_only=True`` marks a POST that changes nothing, so gateway errors are retried like a GET."""
+        token = _read_only_request.set(read_only)
+        try:
+            return self._send(method, url, **kwargs)
+        finally:
+            _read_only_request.reset(token)
+
+    def _send(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        cache_key = self._cache_key(method, url, kwargs)
+        entry = self.cache.load(cache_key) if cache_key else None
+        if entry:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **self.cache.validators(entry)}
+
+        limiter = get_rate_limiter()
+        limiter.acquire(url, method)
+        span = start_http_span(method, url)
+        started = time.perf_counter()
+        try:
+            response = super().request(method, url, **kwargs)
+        except Exception as e:
+            get_metrics().record_request(method, url, "error", time.perf_counter() - started)
+            if span is not None:
+                span.end(error=e)
+            raise
+        limiter.observe(url, response.status_code, response.headers)
+        record_response_metrics(response, started, streamed=kwargs.get("stream", False), span=span)
+
+        if cache_key:
+            if response.status_code == 304 and entry:
+                self.cache.count(hit=True)
+                return self.cache.replay(entry, response)
+            self.cache.count(hit=False)
+            if response.status_code == 200:
+                self.cache.store(cache_key, response)
+        return response
+
+
+def start_http_span(method, url):
+    """Client span for one call, named like ``GET /repos/{owner}/{repo}``; None when tracing is off."""
+    tracer = get_tracer()
+    if tracer is None:
+        return None
+    template = endpoint_template(url)
+    return tracer.start_span(f"{method.upper()} {template}", kind=SPAN_KIND_CLIENT, attributes={
+        "http.request.method": method.upper(),
+        "server.address": host_of(url),
+        "url.template": template
+    })
+
+
+def record_response_metrics(response, started, streamed=False, span=None):
+    """Record a call in the run metrics and end its span.
+
+    Streamed responses are recorded once closed, when their body has been read.
+    """
+    body = response.request.body
+    bytes_sent = len(body) if isinstance(body, (bytes, str)) else 0
+    retries = getattr(response.raw, "retries", None)
+    retry_count = len(retries.history) if retries is not None else 0
+
+    def record(bytes_received):
+        get_metrics().record_request(response.request.method, response.url, response.status_code,
+                                     time.perf_counter() - started, bytes_sent, bytes_received, retry_count)
+        if span is not None:
+            span.set_attribute("http.response.status_code", response.status_code)
+            span.set_attribute("http.request.body.size", bytes_sent)
+            span.set_attribute("http.response.body.size", bytes_received)
+            if retry_count:
+                span.set_attribute("http.request.resend_count", retry_count)
+            span.end(error=str(response.status_code) if response.status_code >= 400 else None)
+
+    if not streamed:
+        record(len(response.content))
+        return
+
+    close = response.close
+    recorded = []
+
+    def close_and_record():
+        close()
+        if not recorded:
+            recorded.append(True)
+            record(response.raw.tell() if hasattr(response.raw, "tell") else 0)
+
+    response.close = close_and_record
+
+
+@lru_cache(maxsize=None)
+def get_session():
+    """Process-wide session with one keep-alive connection pool per host."""
+    session = SharedSession(cache=get_http_cache())
+    adapter = build_adapter(get_cassette())
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def build_adapter(cassette=None):
+    options = {"pool_connections": HTTP_POOL_SIZE, "pool_maxsize": HTTP_POOL_SIZE, "max_retries": build_retry_policy()}
+    if cassette is not None:
+        return CassetteAdapter(cassette, **options)
+    return HTTPAdapter(**options)
+
+
+@contextmanager
+def use_cassette(cassette):
+    """Record to or replay from ``cassette`` on the shared session for the duration of the block."""
+    session = get_session()
+    previous = {prefix: session.adapters[prefix] for prefix in ("https://", "http://")}
+    adapter = build_adapter(cassette)
+    for prefix in previous:
+        session.mount(prefix, adapter)
+    try:
+        yield cassette
+    finally:
+        for prefix, original in previous.items():
+            session.mount(prefix, original)
+        cassette.save()
+
+
+class SessionConnection:
+    """PyGithub connection class that sends requests through the shared session.
+
+    PyGithub keeps a single connection object per client and stores the pending
+    request on it, which is not safe across threads. Once injected, PyGithub
+    builds a fresh instance of this class per request, while the pooled
+    connections underneath are shared.
+    """
+    protocol = "https"
+    default_port = 443
+
+    def __init__(self, host, port=None, strict=False, timeout=None, retry=None, pool_size=None, **kwargs):
+        self.host = host
+        self.port = port if port else self.default_port
+        self.timeout = timeout
+        self.verify = kwargs.get("verify", True)
+
+    def request(self, verb, url, input, headers, stream=False):
+        self.verb = verb
+        self.url = url
+        self.input = input
+        self.headers = headers
+        self.stream = stream
+
+    def getresponse(self):
+        response = get_session().request(
+            self.verb,
+            f"{self.protocol}://{self.host}:{self.port}{self.url}",
+            headers=self.headers,
+            data=self.input,
+            timeout=self.timeout or HTTP_TIMEOUT,
+            verify=self.verify,
+            stream=self.stream,
+            allow_redirects=False,
+            auth=Requester.noopAuth
+        )
+        return RequestsResponse(response)
+
+    def close(self):
+        pass  # The shared session owns the connections
+
+
+class SessionHTTPConnection(SessionConnection):
+    protocol = "http"
+    default_port = 80
+
+
+_github_injection_lock = threading.Lock()
+_github_injected = False
+
+
+def route_github_through_session():
+    """Make every PyGithub client use the shared session (idempotent)."""
+    global _github_injected
+    with _github_injection_lock:
+        if not _github_injected:
+            Requester.injectConnectionClasses(SessionHTTPConnection, SessionConnection)
+            _github_injected = True
@@ -0,0 +1,178 @@
+import os
+import time
+import sqlite3
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from cli.logger import setup_logger
+
+logger = setup_logger()
+
+INVENTORY_DB = os.getenv(
+    "INVENTORY_DB",
+    os.path.join(os.path.expanduser("~"), ".cache", "cli_gh", "inventory.sqlite3")
+)
+# Answers older than this trigger an incremental refresh before they are used
+INVENTORY_MAX_AGE_SECONDS = float(os.getenv("INVENTORY_MAX_AGE_SECONDS", "300"))
+# Incremental refreshes can't see deletions, so a full listing is forced this often
+INVENTORY_FULL_REFRESH_SECONDS = float(os.getenv("INVENTORY_FULL_REFRESH_SECONDS", "86400"))
+
+GITHUB_REPOS = "github_repos"
+DATABRICKS_JOBS = "databricks_jobs"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS repos (
+    name TEXT PRIMARY KEY,
+    full_name TEXT,
+    clone_url TEXT,
+    html_url TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_name ON jobs (name);
+CREATE TABLE IF NOT EXISTS sync_state (
+    source TEXT PRIMARY KEY,
+    synced_at REAL,
+    full_synced_at REAL,
+    etag TEXT,
+    cursor TEXT
+);
+"""
+
+_enabled = os.getenv("USE_INVENTORY", "").lower() in ("1", "true", "yes")
+
+
+class Inventory:
+    """Local SQLite copy of our GitHub repos and Databricks ``mlops_*`` jobs.
+
+    The handlers own the refresh logic (they know the APIs); this class only
+    stores rows, tracks when each source was last synced, and makes sure
+    concurrent callers share a single refresh.
+    """
+
+    def __init__(self, path=INVENTORY_DB, max_age=INVENTORY_MAX_AGE_SECONDS):
+        self.path = path
+        self.max_age = max_age
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._refresh_locks = defaultdict(threading.Lock)
+        with self._lock, self._conn:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def sync_state(self, source):
+        rows = self._query("SELECT * FROM sync_state WHERE source = ?", (source,))
+        return dict(rows[0]) if rows else None
+
+    def is_fresh(self, source):
+        state = self.sync_state(source)
+        return bool(state) and time.time() - state["synced_at"] < self.max_age
+
+    def needs_full_refresh(self, source):
+        state = self.sync_state(source)
+        return not state or not state["full_synced_at"] or time.time() - state["full_synced_at"] > INVENTORY_FULL_REFRESH_SECONDS
+
+    def ensure_fresh(self, source, refresh):
+        """Call ``refresh(self)`` if ``source`` is stale; concurrent callers wait for one refresh."""
+        with self._refresh_locks[source]:
+            if not self.is_fresh(source):
+                started = time.perf_counter()
+                refresh(self)
+                logger.info(f"🗃️ Inventory '{source}' refreshed in {time.perf_counter() - started:.2f}s.")
+
+    def mark_synced(self, source, etag=None, cursor=None, full=False):
+        now = time.time()
+        state = self.sync_state(source) or {}
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (source, synced_at, full_synced_at, etag, cursor) VALUES (?, ?, ?, ?, ?)",
+                (
+                    source,
+                    now,
+                    now if full else state.get("full_synced_at"),
+                    etag if etag is not None else state.get("etag"),
+                    cursor if cursor is not None else state.get("cursor")
+                )
+            )
+
+    # --- GitHub repos -------------------------------------------------------
+
+    def upsert_repos(self, repos, replace=False):
+        """Store repos given as dicts with name, full_name, clone_url, html_url and updated_at."""
+        rows = [(r["name"], r.get("full_name"), r.get("clone_url"), r.get("html_url"), r.get("updated_at")) for r in repos]
+        with self._lock, self._conn:
+            if replace:
+                self._conn.execute("DELETE FROM repos")
+            self._conn.executemany("INSERT OR REPLACE INTO repos VALUES (?, ?, ?, ?, ?)", rows)
+
+    def record_repo(self, name, full_name=None, clone_url=None, html_url=None, updated_at=None):
+        self.upsert_repos([{
+            "name": name, "full_name": full_name, "clone_url": clone_url,
+            "html_url": html_url, "updated_at": updated_at
+        }])
+
+    def forget_repo(self, name):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM repos WHERE name = ?", (name,))
+
+    def has_repo(self, name):
+        return bool(self._query("SELECT 1 FROM repos WHERE name = ?", (name,)))
+
+    def get_repo(self, name):
+        rows = self._query("SELECT * FROM repos WHERE name = ?", (name,))
+        return dict(rows[0]) if rows else None
+
+    def repo_names(self):
+        return [row["name"] for row in self._query("SELECT name FROM repos ORDER BY name")]
+
+    def latest_repo_update(self):
+        rows = self._query("SELECT MAX(updated_at) AS latest FROM repos")
+        return rows[0]["latest"] if rows else None
+
+    # --- Databricks jobs ----------------------------------------------------
+
+    def replace_jobs(self, jobs):
+        """Replace the stored jobs with ``(job_id, name)`` pairs from a full listing."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM jobs")
+            self._conn.executemany("INSERT OR REPLACE INTO jobs VALUES (?, ?)", jobs)
+
+    def record_job(self, name, job_id):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO jobs VALUES (?, ?)", (job_id, name))
+
+    def has_job(self, name):
+        return bool(self._query("SELECT 1 FROM jobs WHERE name = ?", (name,)))
+
+    def job_ids(self, name):
+        return [row["job_id"] for row in self._query("SELECT job_id FROM jobs WHERE name = ? ORDER BY job_id", (name,))]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def enable_inventory(enabled=True):
+    global _enabled
+    _enabled = enabled
+
+
+@lru_cache(maxsize=None)
+def _open_inventory():
+    return Inventory()
+
+
+def get_inventory():
+    """The shared inventory, or None when it hasn't been enabled (USE_INVENTORY / --use-inventory)."""
+    return _open_inventory() if _enabled else None
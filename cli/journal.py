@@ -0,0 +1,69 @@
+import os
+import json
+import time
+import threading
+from functools import lru_cache
+from cli.logger import setup_logger
+
+logger = setup_logger()
+
+
+class Journal:
+    """Append-only JSON-lines progress journal.
+
+    Every record carries a ``key`` and a ``status``; the latest record for a
+    key wins when the journal is read back, so a rerun can pick up where an
+    interrupted one stopped. Records are flushed and fsynced as they are
+    written, so a crash loses at most the record in flight.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._state = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, start=1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash; everything before it is intact
+                        logger.warning(f"⚠️ Ignoring unreadable journal line {line_number} in {path}.")
+                        continue
+                    self._state.setdefault(record["key"], {}).update(record)
+        elif os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def append(self, key, status, **fields):
+        record = {"key": key, "status": status, "time": time.time(), **fields}
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._state.setdefault(key, {}).update(record)
+        return record
+
+    def get(self, key):
+        """Latest merged record for ``key``, or None."""
+        with self._lock:
+            record = self._state.get(key)
+            return dict(record) if record else None
+
+    def is_done(self, key):
+        record = self.get(key)
+        return bool(record) and record["status"] == "done"
+
+    def records(self):
+        with self._lock:
+            return {key: dict(record) for key, record in self._state.items()}
+
+
+@lru_cache(maxsize=None)
+def get_journal(path):
+    """One Journal per path, shared by every thread of the run."""
+    return Journal(path)
@@ -1,45 +1,142 @@
 import os
+import json
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
-from datetime import datetime
+from logging.handlers import TimedRotatingFileHandler, RotatingFileHandler, QueueHandler, QueueListener
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from queue import SimpleQueue
 
 LOG_DIR = os.path.join(os.getcwd(), "logs")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# "sync" writes on the calling thread; "queue" only enqueues and a background listener does the I/O
+LOG_MODE = os.getenv("LOG_MODE", "sync").lower()
+# "text" or "json" (one JSON object per line) for logs/cli.log; the console always gets text
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+# Rotate logs/cli.log by size instead of daily when set (bytes)
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", "0"))
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "30"))
 
-def setup_logger():
-    logger = logging.getLogger("cli_logger")
+# Fields added to every record logged inside log_context()
+CONTEXT_FIELDS = ("repo", "step", "correlation_id")
+
+_log_context = ContextVar("log_context", default={})
+_listener = None
+
+
+@contextmanager
+def log_context(**fields):
+    """Tag every record logged inside the block (on this thread, or handed off with tracing.bind) with ``fields``."""
+    token = _log_context.set({**_log_context.get(), **{name: value for name, value in fields.items() if value is not None}})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Copies the current log_context() onto the record, on the thread that logged it."""
+
+    def filter(self, record):
+        context = _log_context.get()
+        for field in CONTEXT_FIELDS:
+            setattr(record, field, context.get(field))
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with the context fields, for log shippers and jq."""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "thread": record.threadName
+        }
+        for field in CONTEXT_FIELDS:
+            if getattr(record, field, None) is not None:
+                entry[field] = getattr(record, field)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class LogQueueHandler(QueueHandler):
+    """QueueHandler that keeps the traceback apart from the message, so the JSON formatter can still split them."""
+
+    def prepare(self, record):
+        # Same as QueueHandler.prepare, minus folding the traceback into the message
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _text_formatter():
+    return logging.Formatter(fmt="%(asctime)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+
+
+def _file_handler(log_filename):
+    if LOG_MAX_BYTES > 0:
+        handler = RotatingFileHandler(log_filename, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8")
+    else:
+        handler = TimedRotatingFileHandler(
+            filename=log_filename,
+            when="midnight",
+            interval=1,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding="utf-8"
+        )
+        handler.suffix = "%Y-%m-%d"
+    handler.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else _text_formatter())
+    return handler
+
+
+def setup_logger(name="cli_logger"):
+    global _listener
+    logger = logging.getLogger(name)
 
     if logger.handlers:
         return logger  # Prevent duplicate handlers
 
-    logger.setLevel(logging.INFO)
+    logger.setLevel(LOG_LEVEL)
 
     os.makedirs(LOG_DIR, exist_ok=True)
     log_filename = os.path.join(LOG_DIR, "cli.log")
 
     # File handler with rotation
-    file_handler = TimedRotatingFileHandler(
-        filename=log_filename,
-        when="midnight",
-        interval=1,
-        backupCount=30,
-        encoding="utf-8"
-    )
-    file_handler.suffix = "%Y-%m-%d"
-    file_handler.setFormatter(logging.Formatter(
-        fmt="%(asctime)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    ))
+    file_handler = _file_handler(log_filename)
 
     # Console stream handler
     stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(logging.Formatter(
-        fmt="%(asctime)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    ))
+    stream_handler.setFormatter(_text_formatter())
 
-    # Add handlers just once
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
+    logger.addFilter(ContextFilter())
+    if LOG_MODE == "queue":
+        # Callers only enqueue; the listener thread formats and writes
+        _listener = QueueListener(SimpleQueue(), file_handler, stream_handler, respect_handler_level=True)
+        logger.addHandler(LogQueueHandler(_listener.queue))
+        _listener.start()
+        atexit.register(stop_logging)
+    else:
+        # Add handlers just once
+        logger.addHandler(file_handler)
+        logger.addHandler(stream_handler)
 
     logger.propagate = False
     return logger
+
+
+def stop_logging():
+    """Write out everything still queued (queue mode). Safe to call more than once."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,18 +1,55 @@
 import os
+import json
+import uuid
 import click
 from dotenv import load_dotenv
-from logger import setup_logger
-from validator import validate_inputs
+from cli.logger import setup_logger, log_context
+from cli.validator import validate_inputs
+from cli.rate_limiter import get_rate_limiter
+from cli.http_cache import get_http_cache
+from cli.metrics import get_metrics, METRICS_JSON, METRICS_TEXTFILE
+from cli.tracing import traced, enable_tracing, get_tracer, current_span, TRACE_FILE
+from cli.batch import load_manifest, validate_manifest, run_batch, format_summary
 
-from handlers.git_handler import (
+from cli.pipeline import Pipeline, Step
+from cli.journal import get_journal
+from cli.run_watcher import trigger_jobs_and_wait, format_run_report, RUN_TIMEOUT_MINUTES
+from cli.inventory import enable_inventory
+from cli.rotation import (
+    discover_fleet,
+    rotate_fleet,
+    format_rotation_report,
+    DISCOVERY_METHODS,
+    ROTATION_JOURNAL,
+    ROTATION_WORKERS
+)
+
+from cli.handlers.git_handler import (
     validate_repo_availability,
-    create_and_setup_repo,
-    update_config_json
+    create_repo_for_upload,
+    template_files,
+    push_template,
+    create_dev_branch,
+    add_github_repo_secrets,
+    repo_secrets_from_env,
+    update_config_json,
+    config_has_job_ids,
+    expected_clone_url,
+    with_job_ids_in_config,
+    get_existing_repo,
+    branch_exists,
+    repo_has_file,
+    CONFIG_FILE_PATH,
+    UPLOAD_MODES
 )
-from handlers.databricks_handler import (
+from cli.handlers.databricks_handler import (
     validate_databricks_job_availability,
     import_repo_to_databricks,
-    create_jobs
+    build_train_job_json,
+    build_infer_job_json,
+    create_job,
+    find_jobs_by_name,
+    find_workspace_repo
 )
 
 # Load environment variables
@@ -23,50 +60,330 @@ logger = setup_logger()
 # Databricks Username from environment
 #DATABRICKS_USERNAME = os.getenv("DATABRICKS_USERNAME")
 
-@click.command()
-@click.option('--repo-name', prompt='Repository Name', envvar='REPO_NAME', help='Enter your new repository name.')
-@click.option('--accuracy-train', prompt='Accuracy Threshold (Training)', type=float, envvar='ACCURACY_TRAIN', help='Enter the accuracy threshold for training (0 to 1).')
-@click.option('--accuracy-inference', prompt='Accuracy Threshold (Inference)', type=float, envvar='ACCURACY_INFERENCE', help='Enter the accuracy threshold for inference (0 to 1).')
-def main(repo_name, accuracy_train, accuracy_inference):
-    try:
+# Step checkpoints, so a failed run can be resumed with --resume
+PROVISION_JOURNAL = os.getenv(
+    "PROVISION_JOURNAL",
+    os.path.join(os.path.expanduser("~"), ".cache", "cli_gh", "provision_journal.jsonl")
+)
+
+
+@traced
+def provision_repo(repo_name, accuracy_train, accuracy_inference, upload_mode="bulk", stream_template=False,
+                   inline_config=False, resume=False, journal_path=PROVISION_JOURNAL, trigger_and_wait=False,
+                   run_timeout_minutes=RUN_TIMEOUT_MINUTES):
+    """Provision one repo. Steps run as a dependency graph so independent ones overlap.
+
+    With ``inline_config`` the Databricks jobs are created against the
+    predictable clone URL before the repo exists, and their IDs are written
+    into the config file of the initial commit instead of a follow-up commit.
+
+    Every step is checkpointed in the journal at ``journal_path``. With
+    ``resume`` finished steps are restored from it, and steps that were
+    interrupted are checked against GitHub/Databricks before being redone.
+
+    With ``trigger_and_wait`` both jobs are run once everything else is in
+    place and provisioning only succeeds if both runs succeed.
+    """
+    git_mode = upload_mode == "git"
+    journal = get_journal(journal_path)
+    run_key = f"provision:{repo_name}"
+    # Once a repo or job may exist, the availability checks would only trip over our own earlier run
+    previously_attempted = resume and any(
+        journal.get(f"{run_key}:{step}") for step in ("create_repo", "create_train_job", "create_infer_job")
+    )
+    train_job_name = build_train_job_json(repo_name, "")["name"]
+    infer_job_name = build_infer_job_json(repo_name, "")["name"]
+
+    def availability_check(check):
+        def run(results):
+            if previously_attempted:
+                logger.info(f"⏭️ Skipping availability check for '{repo_name}' (resuming an earlier run).")
+                return
+            check(repo_name)
+        return run
+
+    def existing_repo(output, results):
+        repo = get_existing_repo(repo_name)
+        if repo is None:
+            raise Exception(f"Repository '{repo_name}' is recorded as created but no longer exists.")
+        return repo
+
+    def existing_job(job_name):
+        jobs = find_jobs_by_name(job_name)
+        return jobs[0]["job_id"] if jobs else None
+
+    def template_pushed(results):
+        # bulk and git pushes are a single commit, so the config file means the whole template landed
+        return True if repo_has_file(results["create_repo"].full_name, CONFIG_FILE_PATH) else None
+
+    def validate(results):
         # Step 1: Common Input Validation
-        logger.info("✅ Validating input parameters...")
+        logger.info(f"✅ Validating input parameters for '{repo_name}'...")
         validate_inputs(repo_name, accuracy_train, accuracy_inference)
         logger.info("✅ Input parameters validated successfully.")
 
-        # Step 2: Platform-specific validation
-        logger.info("✅ Checking GitHub repo and Databricks job availability...")
-        validate_repo_availability(repo_name)
-        validate_databricks_job_availability(repo_name)
-        logger.info("✅ GitHub and Databricks validations passed.")
-
-        # Step 3: GitHub Repository Creation, Clone Template, Setup Dev branch
-        logger.info("✅ Creating and setting up GitHub repository...")
-        git_url = create_and_setup_repo(repo_name)
-        logger.info(f"✅ GitHub repository '{repo_name}' set up successfully at {git_url}.")
-
-        # Step 4: Import repository into Databricks
-        logger.info("✅ Importing repository into Databricks...")
-        import_repo_to_databricks(git_url, repo_name)
-        logger.info("✅ GitHub repository imported into Databricks successfully.")
-
-        # Step 5: Create Databricks Jobs (Train & Infer)
-        logger.info("✅ Creating Databricks jobs (training & inference)...")
-        train_job_id, infer_job_id = create_jobs(repo_name, git_url)
-        logger.info(f"✅ Databricks jobs created successfully (Train Job ID: {train_job_id}, Infer Job ID: {infer_job_id}).")
+    def create_repo(results):
+        # Step 3: GitHub Repository Creation
+        logger.info("✅ Creating GitHub repository...")
+        repo = create_repo_for_upload(repo_name, upload_mode)
+        logger.info(f"✅ GitHub repository '{repo_name}' created at {repo.clone_url}.")
+        return repo
+
+    def clone_url(results):
+        return expected_clone_url(repo_name) if inline_config else results["create_repo"].clone_url
+
+    def upload_template(results):
+        # Step 3b: Clone Template into the new repo
+        files = results["fetch_template"]
+        if inline_config:
+            files = with_job_ids_in_config(files, repo_name, results["create_train_job"], results["create_infer_job"])
+        push_template(results["create_repo"], files, upload_mode)
 
+    def update_config(results):
         # Step 6: Update Job IDs in JSON configuration file in GitHub repo
         logger.info("✅ Updating configuration JSON file with Databricks Job IDs...")
-        update_config_json(repo_name, train_job_id, infer_job_id)
+        update_config_json(repo_name, results["create_train_job"], results["create_infer_job"])
         logger.info("✅ Configuration JSON file updated and committed successfully.")
 
+    availability_checks = ["check_repo_available", "check_jobs_available"]
+    jobs_depend_on = availability_checks if inline_config else ["create_repo"]
+    push_depends_on = ["create_repo", "fetch_template"]
+    if inline_config:
+        push_depends_on += ["create_train_job", "create_infer_job"]
+
+    steps = [
+        Step("validate_inputs", validate),
+        # Step 2: Platform-specific validation
+        Step("check_repo_available", availability_check(validate_repo_availability), ["validate_inputs"]),
+        Step("check_jobs_available", availability_check(validate_databricks_job_availability), ["validate_inputs"]),
+        Step("fetch_template", lambda results: template_files(stream_template), ["validate_inputs"], ephemeral=True),
+        Step(
+            "create_repo", create_repo, availability_checks,
+            save=lambda repo: {"full_name": repo.full_name, "clone_url": repo.clone_url},
+            restore=existing_repo,
+            recover=lambda results: get_existing_repo(repo_name)
+        ),
+        # The Contents API pushes file by file, so a partial push can't be detected and is redone
+        Step("push_template", upload_template, push_depends_on, recover=None if upload_mode == "contents" else template_pushed),
+        Step("add_secrets", lambda results: add_github_repo_secrets(repo_name, repo_secrets_from_env(), repo=results["create_repo"]), ["create_repo"]),
+        # Step 4: Import repository into Databricks once 'main' has the template
+        Step(
+            "import_repo", lambda results: import_repo_to_databricks(results["create_repo"].clone_url, repo_name), ["push_template"],
+            recover=lambda results: find_workspace_repo(repo_name)
+        ),
+        # Step 5: Create Databricks Jobs (Train & Infer); they only need the clone URL
+        Step(
+            "create_train_job", lambda results: create_job(build_train_job_json(repo_name, clone_url(results))), jobs_depend_on,
+            recover=lambda results: existing_job(train_job_name)
+        ),
+        Step(
+            "create_infer_job", lambda results: create_job(build_infer_job_json(repo_name, clone_url(results))), jobs_depend_on,
+            recover=lambda results: existing_job(infer_job_name)
+        )
+    ]
+    if not git_mode:
+        # The git transport pushes 'dev' itself
+        steps.append(Step(
+            "create_dev_branch", lambda results: create_dev_branch(repo_name), ["push_template"],
+            recover=lambda results: True if branch_exists(repo_name, "dev") else None
+        ))
+    if not inline_config:
+        dev_branch_step = "push_template" if git_mode else "create_dev_branch"
+        steps.append(Step(
+            "update_config", update_config, [dev_branch_step, "create_train_job", "create_infer_job"],
+            # A second commit would start another CI run on 'dev'
+            recover=lambda results: True if config_has_job_ids(
+                repo_name, results["create_train_job"], results["create_infer_job"]
+            ) else None
+        ))
+
+    if trigger_and_wait:
+        def smoke_run(results):
+            # Step 7: Run both jobs once as an end-to-end smoke test
+            runs = trigger_jobs_and_wait(
+                {"train": results["create_train_job"], "infer": results["create_infer_job"]},
+                timeout_seconds=run_timeout_minutes * 60
+            )
+            report = format_run_report(runs)
+            logger.info(f"🏁 First runs for '{repo_name}':\n{report}")
+            failed = [label for label, run in runs.items() if run["result_state"] != "SUCCESS"]
+            if failed:
+                raise Exception(f"First run of the {' and '.join(failed)} job(s) did not succeed:\n{report}")
+            return {label: {"run_id": run["run_id"], "seconds_to_result": run["seconds_to_result"]} for label, run in runs.items()}
+
+        steps.append(Step("smoke_run", smoke_run, [step.name for step in steps]))
+
+    pipeline = Pipeline(steps, journal=journal, run_key=run_key, resume=resume)
+    # Every log line of this repo carries its name and one ID; with tracing on, the ID is the trace ID
+    correlation_id = current_span().trace_id if current_span() else uuid.uuid4().hex
+    with log_context(repo=repo_name, correlation_id=correlation_id):
+        try:
+            results = pipeline.run()
+        finally:
+            logger.info(f"⏱️ Step timings for '{repo_name}':\n{pipeline.format_timings()}")
+
+        git_url = results["create_repo"].clone_url
+        train_job_id, infer_job_id = results["create_train_job"], results["create_infer_job"]
+        logger.info(f"✅ Databricks jobs created successfully (Train Job ID: {train_job_id}, Infer Job ID: {infer_job_id}).")
+    outputs = {"git_url": git_url, "train_job_id": train_job_id, "infer_job_id": infer_job_id}
+    if trigger_and_wait:
+        outputs["first_run_seconds"] = {label: run["seconds_to_result"] for label, run in results["smoke_run"].items()}
+    return outputs
+
+
+def provision_manifest(manifest, accuracy_train, accuracy_inference, workers, summary_file, **options):
+    entries = load_manifest(manifest, default_train=accuracy_train, default_inference=accuracy_inference)
+    logger.info(f"✅ Validating {len(entries)} manifest entries...")
+    validate_manifest(entries)
+    logger.info("✅ Manifest validated successfully.")
+
+    results = run_batch(entries, provision_repo, workers=workers, **options)
+    summary = format_summary(results)
+    logger.info(f"📋 Batch summary:\n{summary}")
+    click.echo(summary)
+
+    if summary_file:
+        with open(summary_file, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+        logger.info(f"✅ Batch summary written to {summary_file}.")
+
+    return results
+
+
+def log_run_stats(command, metrics_json=None, metrics_textfile=None):
+    """Log the API budget, cache hits and run metrics, and export the metrics if asked to."""
+    logger.info(f"📊 API budget: {get_rate_limiter().budget()}")
+    if get_http_cache() is not None:
+        logger.info(f"📦 HTTP cache: {get_http_cache().stats()}")
+    try:
+        get_metrics().export(metrics_json, metrics_textfile, command)
+        if get_tracer() is not None:
+            get_tracer().flush()
+    except OSError:
+        # Never let a metrics or trace export hide the outcome of the run itself
+        logger.warning("⚠️ Could not write the run metrics.", exc_info=True)
+
+
+class DefaultCommandGroup(click.Group):
+    """Runs the ``provision`` command when no subcommand is named, so ``python cli/main.py --repo-name ...`` keeps working."""
+
+    default_command = "provision"
+
+    def parse_args(self, ctx, args):
+        if not args or (args[0] not in self.commands and args[0] not in ctx.help_option_names):
+            args = [self.default_command] + list(args)
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultCommandGroup)
+def main():
+    """Provision MLOps repositories and manage the provisioned fleet."""
+
+
+@main.command()
+@click.option('--repo-name', envvar='REPO_NAME', help='Enter your new repository name.')
+@click.option('--accuracy-train', type=float, envvar='ACCURACY_TRAIN', help='Enter the accuracy threshold for training (0 to 1).')
+@click.option('--accuracy-inference', type=float, envvar='ACCURACY_INFERENCE', help='Enter the accuracy threshold for inference (0 to 1).')
+@click.option('--manifest', type=click.Path(exists=True, dir_okay=False), envvar='MANIFEST', help='YAML/JSON/CSV file of repositories to provision in one run (repo_name, accuracy_train, accuracy_inference).')
+@click.option('--workers', type=click.IntRange(1, 64), default=4, show_default=True, envvar='WORKERS', help='Repositories provisioned concurrently in manifest mode.')
+@click.option('--summary-file', type=click.Path(dir_okay=False, writable=True), envvar='SUMMARY_FILE', help='Write the per-repo manifest results to this JSON file.')
+@click.option('--upload-mode', type=click.Choice(UPLOAD_MODES), default='bulk', show_default=True, envvar='UPLOAD_MODE', help='How template files are pushed: one Git Data API commit (bulk), one Contents API commit per file (contents), or a single git push of main and dev (git).')
+@click.option('--stream-template/--no-stream-template', default=False, envvar='STREAM_TEMPLATE', help='Stream the template tarball straight into the upload instead of using the on-disk template cache.')
+@click.option('--inline-config/--no-inline-config', default=False, envvar='INLINE_CONFIG', help='Create the Databricks jobs first and write their IDs into the config file of the initial commit, skipping the follow-up config commit.')
+@click.option('--use-inventory/--no-use-inventory', default=False, envvar='USE_INVENTORY', help='Answer availability checks from the local SQLite inventory of repos and jobs, refreshing it incrementally when stale.')
+@click.option('--resume/--no-resume', default=False, envvar='RESUME', help='Continue an earlier failed run from the step journal, redoing only the steps that did not finish.')
+@click.option('--journal', 'journal_path', type=click.Path(dir_okay=False, writable=True), default=PROVISION_JOURNAL, show_default=True, envvar='PROVISION_JOURNAL', help='Step checkpoint journal used by --resume.')
+@click.option('--trigger-and-wait/--no-trigger-and-wait', default=False, envvar='TRIGGER_AND_WAIT', help='Run the train and inference jobs once after provisioning and fail unless both succeed.')
+@click.option('--run-timeout-minutes', type=float, default=RUN_TIMEOUT_MINUTES, show_default=True, envvar='RUN_TIMEOUT_MINUTES', help='How long --trigger-and-wait waits for the runs.')
+@click.option('--metrics-json', type=click.Path(dir_okay=False, writable=True), default=METRICS_JSON, envvar='METRICS_JSON', help='Write per-step timings and per-endpoint HTTP metrics of the run to this JSON file.')
+@click.option('--metrics-textfile', type=click.Path(dir_okay=False, writable=True), default=METRICS_TEXTFILE, envvar='METRICS_TEXTFILE', help='Write the run metrics in Prometheus text format, e.g. into the node exporter textfile directory.')
+@click.option('--trace-file', type=click.Path(dir_okay=False, writable=True), default=TRACE_FILE, envvar='TRACE_FILE', help='Append OTLP/JSON traces (one root span per repo, spans per step, handler call and HTTP request) to this file.')
+def provision(repo_name, accuracy_train, accuracy_inference, manifest, workers, summary_file, upload_mode, stream_template, inline_config, use_inventory, resume, journal_path, trigger_and_wait, run_timeout_minutes, metrics_json, metrics_textfile, trace_file):
+    """Create a repository and its Databricks jobs (the default command)."""
+    enable_inventory(use_inventory)
+    enable_tracing(trace_file)
+    try:
+        if manifest:
+            results = provision_manifest(
+                manifest, accuracy_train, accuracy_inference, workers, summary_file,
+                upload_mode=upload_mode, stream_template=stream_template, inline_config=inline_config,
+                resume=resume, journal_path=journal_path, trigger_and_wait=trigger_and_wait,
+                run_timeout_minutes=run_timeout_minutes
+            )
+            if any(result["status"] != "success" for result in results):
+                raise click.ClickException("One or more repositories failed to provision.")
+            logger.info("🎉 All tasks executed successfully!")
+            click.echo("🎉 All tasks executed successfully!")
+            return
+
+        # Thresholds are only prompted for when a single repo is provisioned
+        if repo_name is None:
+            repo_name = click.prompt('Repository Name')
+        if accuracy_train is None:
+            accuracy_train = click.prompt('Accuracy Threshold (Training)', type=float)
+        if accuracy_inference is None:
+            accuracy_inference = click.prompt('Accuracy Threshold (Inference)', type=float)
+
+        provision_repo(
+            repo_name, accuracy_train, accuracy_inference,
+            upload_mode=upload_mode, stream_template=stream_template, inline_config=inline_config,
+            resume=resume, journal_path=journal_path, trigger_and_wait=trigger_and_wait,
+            run_timeout_minutes=run_timeout_minutes
+        )
+
         logger.info("🎉 All tasks executed successfully!")
         click.echo("🎉 All tasks executed successfully!")
 
+    except click.ClickException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ An error occurred", exc_info=True)
+        click.echo(f"❌ An error occurred: {str(e)}", err=True)
+        raise click.Abort()
+    finally:
+        log_run_stats("provision", metrics_json, metrics_textfile)
+
+
+@main.command('rotate-secrets')
+@click.option('--secret', 'secret_names', multiple=True, default=['DATABRICKS_TOKEN'], show_default=True, help='Secret to update (repeatable). Values are read from the environment variable of the same name.')
+@click.option('--repo', 'repos', multiple=True, help='Rotate only these repositories instead of discovering the fleet (repeatable).')
+@click.option('--discover', type=click.Choice(DISCOVERY_METHODS), default='both', show_default=True, help='Find provisioned repos by the config marker file, by mlops_<repo>_* job names, or both.')
+@click.option('--workers', type=click.IntRange(1, 128), default=ROTATION_WORKERS, show_default=True, envvar='ROTATION_WORKERS', help='Repositories updated concurrently.')
+@click.option('--journal', type=click.Path(dir_okay=False, writable=True), default=ROTATION_JOURNAL, show_default=True, envvar='ROTATION_JOURNAL', help='Progress journal; rerunning with the same secret values skips repos already done.')
+@click.option('--dry-run', is_flag=True, help='List the repositories that would be updated and exit.')
+@click.option('--metrics-json', type=click.Path(dir_okay=False, writable=True), default=METRICS_JSON, envvar='METRICS_JSON', help='Write per-step timings and per-endpoint HTTP metrics of the run to this JSON file.')
+@click.option('--metrics-textfile', type=click.Path(dir_okay=False, writable=True), default=METRICS_TEXTFILE, envvar='METRICS_TEXTFILE', help='Write the run metrics in Prometheus text format, e.g. into the node exporter textfile directory.')
+def rotate_secrets(secret_names, repos, discover, workers, journal, dry_run, metrics_json, metrics_textfile):
+    """Update GitHub Actions secrets in every provisioned repository."""
+    try:
+        missing = [name for name in secret_names if not os.getenv(name)]
+        if missing:
+            raise click.ClickException(f"Environment variable(s) not set: {', '.join(missing)}")
+        secrets_dict = {name: os.getenv(name) for name in secret_names}
+
+        repos = sorted(set(repos)) if repos else discover_fleet(discover, workers)
+        logger.info(f"✅ {len(repos)} repositories selected for rotation.")
+        if dry_run:
+            click.echo("\n".join(repos))
+            return
+
+        results, stats = rotate_fleet(repos, secrets_dict, journal_path=journal, workers=workers)
+        report = format_rotation_report(results, stats)
+        logger.info(f"📋 Rotation report:\n{report}")
+        click.echo(report)
+        if stats["failed"]:
+            raise click.ClickException(f"{stats['failed']} repositories failed; rerun to retry them.")
+        click.echo("🎉 Secrets rotated successfully!")
+
+    except click.ClickException:
+        raise
     except Exception as e:
         logger.error(f"❌ An error occurred", exc_info=True)
         click.echo(f"❌ An error occurred: {str(e)}", err=True)
         raise click.Abort()
+    finally:
+        log_run_stats("rotate-secrets", metrics_json, metrics_textfile)
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,227 @@
+import os
+import re
+import json
+import time
+import tempfile
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from urllib.parse import urlsplit
+from cli.logger import setup_logger
+
+logger = setup_logger()
+
+# Where to export the metrics of a run (unset = only the summary table is logged)
+METRICS_JSON = os.getenv("METRICS_JSON")
+# Prometheus textfile, e.g. into node_exporter's --collector.textfile.directory
+METRICS_TEXTFILE = os.getenv("METRICS_TEXTFILE")
+METRICS_PREFIX = "cli_gh"
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Path segments that vary per repo/job/commit, replaced so endpoints group into templates
+ENDPOINT_RULES = (
+    (re.compile(r"^/repos/[^/]+/[^/]+"), "/repos/{owner}/{repo}"),
+    (re.compile(r"^/users/[^/]+"), "/users/{user}"),
+    (re.compile(r"/git/(refs?)/.+$"), r"/git/\1/{ref}"),
+    (re.compile(r"/contents/.+$"), "/contents/{path}"),
+    (re.compile(r"/branches/.+$"), "/branches/{branch}"),
+    (re.compile(r"/actions/secrets/(?!public-key$)[^/]+$"), "/actions/secrets/{name}"),
+    (re.compile(r"/[0-9a-f]{40}(?=/|$)"), "/{sha}"),
+    (re.compile(r"/\d+(?=/|$)"), "/{id}")
+)
+
+
+def host_of(url):
+    """``host[:port]`` of ``url``, without the scheme's default port."""
+    parts = urlsplit(url)
+    if parts.port and parts.port != DEFAULT_PORTS.get(parts.scheme):
+        return f"{parts.hostname}:{parts.port}"
+    return parts.hostname or ""
+
+
+def endpoint_template(url):
+    """Path of ``url`` with repo names, refs, SHAs and IDs replaced by placeholders."""
+    path = urlsplit(url).path or "/"
+    for pattern, replacement in ENDPOINT_RULES:
+        path = pattern.sub(replacement, path)
+    return path
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _labels(**labels):
+    escaped = {name: str(value).replace("\\", "\\\\").replace('"', '\\"') for name, value in labels.items()}
+    return ",".join(f'{name}="{value}"' for name, value in escaped.items())
+
+
+class Metrics:
+    """Step spans and outbound HTTP calls of one CLI run.
+
+    Pipeline steps are recorded per run key (e.g. ``provision:<repo>``);
+    HTTP calls are grouped by method, host, endpoint template and status.
+    Latency is measured around the request including retries and their
+    backoff, but not the rate limiter's pacing wait. For streamed downloads
+    it runs until the body has been read and the response closed.
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self.steps = []
+        self.requests = defaultdict(lambda: {"count": 0, "seconds": [], "bytes_sent": 0, "bytes_received": 0, "retries": 0})
+
+    def record_step(self, run_key, step, seconds, status="ok"):
+        with self._lock:
+            self.steps.append({"run": run_key, "step": step, "seconds": round(seconds, 4), "status": status})
+
+    def record_request(self, method, url, status, seconds, bytes_sent=0, bytes_received=0, retries=0):
+        key = (method.upper(), host_of(url), endpoint_template(url), str(status))
+        with self._lock:
+            entry = self.requests[key]
+            entry["count"] += 1
+            entry["seconds"].append(seconds)
+            entry["bytes_sent"] += bytes_sent
+            entry["bytes_received"] += bytes_received
+            entry["retries"] += retries
+
+    def summary(self):
+        """Everything recorded so far, as plain data (what METRICS_JSON contains)."""
+        with self._lock:
+            steps = list(self.steps)
+            requests = [(key, dict(entry, seconds=list(entry["seconds"]))) for key, entry in self.requests.items()]
+        step_totals = defaultdict(list)
+        for span in steps:
+            step_totals[span["step"]].append(span)
+        return {
+            "started": self.started,
+            "duration_seconds": round(time.time() - self.started, 4),
+            "spans": steps,
+            "steps": [
+                {
+                    "step": step,
+                    "count": len(spans),
+                    "failures": sum(1 for span in spans if span["status"] != "ok"),
+                    "total_seconds": round(sum(span["seconds"] for span in spans), 4),
+                    "max_seconds": max(span["seconds"] for span in spans)
+                }
+                for step, spans in step_totals.items()
+            ],
+            "requests": sorted(
+                (
+                    {
+                        "method": method,
+                        "host": host,
+                        "endpoint": endpoint,
+                        "status": status,
+                        "count": entry["count"],
+                        "total_seconds": round(sum(entry["seconds"]), 4),
+                        "p50_seconds": round(percentile(entry["seconds"], 50), 4),
+                        "p95_seconds": round(percentile(entry["seconds"], 95), 4),
+                        "bytes_sent": entry["bytes_sent"],
+                        "bytes_received": entry["bytes_received"],
+                        "retries": entry["retries"]
+                    }
+                    for (method, host, endpoint, status), entry in requests
+                ),
+                key=lambda row: -row["total_seconds"]
+            )
+        }
+
+    def format_summary(self):
+        summary = self.summary()
+        lines = []
+        if summary["steps"]:
+            rows = [("Step", "Runs", "Failed", "Total (s)", "Max (s)")]
+            rows += [(row["step"], str(row["count"]), str(row["failures"]), f"{row['total_seconds']:.2f}", f"{row['max_seconds']:.2f}")
+                     for row in summary["steps"]]
+            lines += _table(rows) + [""]
+        rows = [("Host", "Method", "Endpoint", "Status", "Calls", "Total (s)", "p95 (s)", "Sent", "Received", "Retries")]
+        rows += [
+            (row["host"], row["method"], row["endpoint"], row["status"], str(row["count"]), f"{row['total_seconds']:.2f}",
+             f"{row['p95_seconds']:.2f}", str(row["bytes_sent"]), str(row["bytes_received"]), str(row["retries"]))
+            for row in summary["requests"]
+        ]
+        lines += _table(rows)
+        calls = sum(row["count"] for row in summary["requests"])
+        lines.append(f"{calls} HTTP calls in {summary['duration_seconds']:.2f}s.")
+        return "\n".join(lines)
+
+    def write_json(self, path):
+        _write_atomic(path, json.dumps(self.summary(), indent=4))
+        logger.info(f"✅ Run metrics written to {path}.")
+
+    def prometheus(self, command="provision"):
+        """The run in Prometheus text exposition format."""
+        summary = self.summary()
+        prefix = METRICS_PREFIX
+        lines = [
+            f"# HELP {prefix}_run_duration_seconds Wall-clock duration of the last CLI run.",
+            f"# TYPE {prefix}_run_duration_seconds gauge",
+            f"{prefix}_run_duration_seconds{{{_labels(command=command)}}} {summary['duration_seconds']}",
+            f"# HELP {prefix}_run_timestamp_seconds When the last CLI run finished.",
+            f"# TYPE {prefix}_run_timestamp_seconds gauge",
+            f"{prefix}_run_timestamp_seconds{{{_labels(command=command)}}} {round(time.time(), 3)}",
+            f"# HELP {prefix}_step_duration_seconds Time spent in each provisioning step.",
+            f"# TYPE {prefix}_step_duration_seconds summary"
+        ]
+        for row in summary["steps"]:
+            labels = _labels(step=row["step"])
+            lines.append(f"{prefix}_step_duration_seconds_sum{{{labels}}} {row['total_seconds']}")
+            lines.append(f"{prefix}_step_duration_seconds_count{{{labels}}} {row['count']}")
+        lines += [f"# HELP {prefix}_step_failures_total Failed provisioning steps.", f"# TYPE {prefix}_step_failures_total counter"]
+        lines += [f"{prefix}_step_failures_total{{{_labels(step=row['step'])}}} {row['failures']}" for row in summary["steps"]]
+
+        metrics = (
+            ("http_requests_total", "counter", "Outbound HTTP calls.", "count"),
+            ("http_request_duration_seconds_total", "counter", "Time spent in outbound HTTP calls, including retries.", "total_seconds"),
+            ("http_request_bytes_sent_total", "counter", "Request body bytes sent.", "bytes_sent"),
+            ("http_response_bytes_received_total", "counter", "Response body bytes received.", "bytes_received"),
+            ("http_retries_total", "counter", "Retries of outbound HTTP calls.", "retries")
+        )
+        for name, kind, help_text, field in metrics:
+            lines += [f"# HELP {prefix}_{name} {help_text}", f"# TYPE {prefix}_{name} {kind}"]
+            for row in summary["requests"]:
+                labels = _labels(method=row["method"], host=row["host"], endpoint=row["endpoint"], status=row["status"])
+                lines.append(f"{prefix}_{name}{{{labels}}} {row[field]}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path, command="provision"):
+        # Written to a temp file and renamed, so the node exporter never reads a partial file
+        _write_atomic(path, self.prometheus(command))
+        logger.info(f"✅ Prometheus metrics written to {path}.")
+
+    def export(self, json_path=None, textfile_path=None, command="provision"):
+        """Log the summary table and write the requested exports."""
+        logger.info(f"📈 Run metrics:\n{self.format_summary()}")
+        if json_path:
+            self.write_json(json_path)
+        if textfile_path:
+            self.write_prometheus(textfile_path, command)
+
+
+def _table(rows):
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return ["  ".join(value.ljust(width) for value, width in zip(row, widths)).rstrip() for row in rows]
+
+
+def _write_atomic(path, text):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+
+@lru_cache(maxsize=None)
+def get_metrics():
+    return Metrics()
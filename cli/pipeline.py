@@ -0,0 +1,177 @@
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from cli.logger import setup_logger, log_context
+from cli.metrics import get_metrics
+from cli.tracing import span, bind
+
+logger = setup_logger()
+
+PIPELINE_WORKERS = int(os.getenv("PIPELINE_WORKERS", "4"))
+
+
+class Step:
+    """One unit of the provisioning pipeline.
+
+    ``func`` receives a dict of the results of every step finished so far
+    (keyed by step name) and its return value becomes this step's result.
+
+    For checkpointing, ``save`` turns the result into something JSON can
+    store and ``restore(output, results)`` rebuilds it on resume. A step that
+    was started but never recorded as done is handed to ``recover(results)``,
+    which returns the result if the work actually happened or None to run
+    ``func`` again. ``ephemeral`` steps (e.g. a lazy file stream) are never
+    checkpointed and only run on resume if a step that still has to run needs them.
+    """
+
+    def __init__(self, name, func, depends_on=(), save=None, restore=None, recover=None, ephemeral=False):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.save = save or (lambda result: result)
+        self.restore = restore or (lambda output, results: output)
+        self.recover = recover
+        self.ephemeral = ephemeral
+
+
+class Pipeline:
+    """Runs steps as a dependency graph, overlapping steps that don't depend on each other.
+
+    With a ``journal`` every step records ``started``/``done``/``failed``
+    under ``<run_key>:<step>``; with ``resume`` steps already done are
+    restored from their recorded output instead of being run again.
+    """
+
+    def __init__(self, steps, max_workers=PIPELINE_WORKERS, journal=None, run_key="pipeline", resume=False):
+        self.steps = {}
+        for step in steps:
+            if step.name in self.steps:
+                raise ValueError(f"Duplicate pipeline step '{step.name}'.")
+            self.steps[step.name] = step
+        for step in steps:
+            unknown = [dep for dep in step.depends_on if dep not in self.steps]
+            if unknown:
+                raise ValueError(f"Step '{step.name}' depends on unknown step(s): {', '.join(unknown)}")
+        self.max_workers = max_workers
+        self.journal = journal
+        self.run_key = run_key
+        self.resume = resume and journal is not None
+        self.resumed = []
+        self.timings = {}
+        self.wall_clock = 0.0
+        self._timings_lock = threading.Lock()
+
+    def journal_key(self, name):
+        return f"{self.run_key}:{name}"
+
+    def record(self, name):
+        """Latest journal record of a step, or None."""
+        return self.journal.get(self.journal_key(name)) if self.journal is not None else None
+
+    def _completed(self):
+        if not self.resume:
+            return set()
+        return {
+            name for name, step in self.steps.items()
+            if not step.ephemeral and (self.record(name) or {}).get("status") == "done"
+        }
+
+    def _skipped(self, completed):
+        """Ephemeral steps that only feed completed steps don't need to run on resume."""
+        needed = set()
+        changed = True
+        while changed:
+            changed = False
+            for name, step in self.steps.items():
+                if name in needed or name in completed:
+                    continue
+                if not step.ephemeral or any(name in self.steps[other].depends_on for other in needed):
+                    needed.add(name)
+                    changed = True
+        return set(self.steps) - needed - completed
+
+    def _execute(self, step, results, completed):
+        if step.name in completed:
+            return step.restore(self.record(step.name).get("output"), results)
+        if self.journal is None or step.ephemeral:
+            return step.func(results)
+
+        key = self.journal_key(step.name)
+        result = None
+        previous = self.record(step.name) if self.resume else None
+        if previous and previous["status"] in ("started", "failed") and step.recover:
+            result = step.recover(results)
+            if result is not None:
+                logger.info(f"♻️ Step '{step.name}' had already taken effect; reusing it.")
+        if result is None:
+            self.journal.append(key, "started")
+            try:
+                result = step.func(results)
+            except Exception as e:
+                self.journal.append(key, "failed", error=str(e))
+                raise
+        self.journal.append(key, "done", output=step.save(result))
+        return result
+
+    def _run_step(self, step, results, completed=frozenset()):
+        started = time.perf_counter()
+        status = "error"
+        try:
+            with log_context(step=step.name), span(f"step {step.name}", {"pipeline.run": self.run_key, "pipeline.step": step.name}):
+                result = self._execute(step, results, completed)
+            status = "ok"
+            return result
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._timings_lock:
+                self.timings[step.name] = elapsed
+            get_metrics().record_step(self.run_key, step.name, elapsed, status)
+
+    def run(self):
+        """Run every step and return their results. The first failure is re-raised once running steps finish."""
+        results = {}
+        completed = self._completed()
+        skipped = self._skipped(completed)
+        self.resumed = [name for name in self.steps if name in completed]
+        if self.resumed:
+            logger.info(f"⏭️ Resuming '{self.run_key}': {', '.join(self.resumed)} already done.")
+        pending = {name: step for name, step in self.steps.items() if name not in skipped}
+        running = {}
+        error = None
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                if error is None:
+                    for name, step in list(pending.items()):
+                        if all(dep in results or dep in skipped for dep in step.depends_on):
+                            del pending[name]
+                            running[executor.submit(bind(self._run_step), step, dict(results), completed)] = step
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    try:
+                        results[step.name] = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ Step '{step.name}' failed: {e}")
+                        error = error or e
+
+        self.wall_clock = time.perf_counter() - started
+        if error is not None:
+            raise error
+        if pending:
+            raise ValueError(f"Pipeline steps could not be scheduled (circular dependencies): {', '.join(pending)}")
+        return results
+
+    def format_timings(self):
+        width = max([len(name) for name in self.timings] + [len("Total (wall clock)")])
+        lines = [f"{'Step'.ljust(width)}  Duration (s)"]
+        for name in self.steps:
+            if name in self.timings:
+                lines.append(f"{name.ljust(width)}  {self.timings[name]:.2f}")
+        lines.append(f"{'Total (wall clock)'.ljust(width)}  {self.wall_clock:.2f}")
+        return "\n".join(lines)
@@ -0,0 +1,182 @@
+import os
+import time
+import threading
+from functools import lru_cache
+from urllib.parse import urlparse
+from cli.logger import setup_logger
+
+logger = setup_logger()
+
+GITHUB_MAX_RPS = float(os.getenv("GITHUB_MAX_RPS", "10"))
+GITHUB_BURST = int(os.getenv("GITHUB_BURST", "20"))
+# GitHub's secondary limit allows roughly 80 content-creating requests per minute
+GITHUB_WRITES_PER_MINUTE = float(os.getenv("GITHUB_WRITES_PER_MINUTE", "80"))
+GITHUB_WRITE_BURST = int(os.getenv("GITHUB_WRITE_BURST", "10"))
+DATABRICKS_MAX_RPS = float(os.getenv("DATABRICKS_MAX_RPS", "10"))
+DATABRICKS_BURST = int(os.getenv("DATABRICKS_BURST", "20"))
+# Requests held back from the primary quota so a nearly exhausted budget pauses instead of failing
+RATE_LIMIT_RESERVE = int(os.getenv("RATE_LIMIT_RESERVE", "20"))
+DEFAULT_RETRY_AFTER = 1.0
+# X-RateLimit-Resource of the quota the budget follows (responses without the header count as core)
+QUOTA_RESOURCE = "core"
+
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers reserve a token and sleep off any debt."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    @property
+    def tokens(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class ServiceBudget:
+    """Request budget for one API: local pacing plus the quota the server reports."""
+
+    def __init__(self, name, rate, burst, write_rate=None, write_burst=None):
+        self.name = name
+        self.bucket = TokenBucket(rate, burst)
+        self.write_bucket = TokenBucket(write_rate, write_burst) if write_rate else None
+        self.limit = None
+        self.remaining = None
+        self.reset_at = None
+        self.blocked_until = 0.0
+        self.throttled_seconds = 0.0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def _quota_wait(self):
+        with self._lock:
+            now = time.time()
+            wait = max(self.blocked_until - now, 0.0)
+            if self.remaining is not None and self.remaining <= RATE_LIMIT_RESERVE and self.reset_at and self.reset_at > now:
+                wait = max(wait, self.reset_at - now)
+                # Hold every caller until the reset, not just this one; the next response reports the refilled quota
+                self.blocked_until = max(self.blocked_until, self.reset_at)
+                self.remaining = None
+            elif self.remaining is not None:
+                self.remaining -= 1
+            self.requests += 1
+        if wait:
+            logger.warning(f"⏳ {self.name} budget exhausted, pausing {wait:.1f}s.")
+            time.sleep(wait)
+        return wait
+
+    def acquire(self, write=False):
+        waited = self._quota_wait()
+        waited += self.bucket.acquire()
+        if write and self.write_bucket:
+            waited += self.write_bucket.acquire()
+        with self._lock:
+            self.throttled_seconds += waited
+        return waited
+
+    def observe(self, status_code, headers):
+        with self._lock:
+            # GraphQL, search etc. report their own quotas; only the core REST quota is tracked here
+            if headers.get("X-RateLimit-Resource", QUOTA_RESOURCE) == QUOTA_RESOURCE:
+                if "X-RateLimit-Remaining" in headers:
+                    self.remaining = int(headers["X-RateLimit-Remaining"])
+                if "X-RateLimit-Limit" in headers:
+                    self.limit = int(headers["X-RateLimit-Limit"])
+                if "X-RateLimit-Reset" in headers:
+                    self.reset_at = float(headers["X-RateLimit-Reset"])
+
+            retry_after = headers.get("Retry-After")
+            if status_code == 429 or (status_code == 403 and retry_after):
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = DEFAULT_RETRY_AFTER
+                self.blocked_until = max(self.blocked_until, time.time() + delay)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "remaining": self.remaining,
+                "reset_at": self.reset_at,
+                "tokens": round(self.bucket.tokens, 2),
+                "write_tokens": round(self.write_bucket.tokens, 2) if self.write_bucket else None,
+                "blocked_for": round(max(self.blocked_until - time.time(), 0.0), 2),
+                "requests": self.requests,
+                "throttled_seconds": round(self.throttled_seconds, 2)
+            }
+
+
+class RateLimiter:
+    """Shared request scheduler for GitHub and Databricks.
+
+    Every request made through the shared HTTP session reserves a token from
+    its service's bucket (and from the write bucket for GitHub mutations), and
+    every response feeds the rate-limit headers back in, so all handlers pace
+    themselves against the same budget.
+    """
+
+    def __init__(self):
+        self.services = {
+            "github": ServiceBudget(
+                "GitHub", GITHUB_MAX_RPS, GITHUB_BURST,
+                write_rate=GITHUB_WRITES_PER_MINUTE / 60, write_burst=GITHUB_WRITE_BURST
+            ),
+            "databricks": ServiceBudget("Databricks", DATABRICKS_MAX_RPS, DATABRICKS_BURST)
+        }
+        # Keyed by host or host:port, so stand-in servers on one interface stay apart
+        self.hosts = {}
+        github_host = urlparse(os.getenv("GITHUB_API_URL") or "https://api.github.com").netloc
+        self.hosts[github_host] = "github"
+        databricks_host = urlparse(os.getenv("DATABRICKS_HOST") or "").netloc
+        if databricks_host:
+            self.hosts[databricks_host] = "databricks"
+
+    def register_host(self, host, service):
+        self.hosts[host] = service
+
+    def service_for_url(self, url):
+        parsed = urlparse(url)
+        return self.hosts.get(parsed.netloc) or self.hosts.get(parsed.hostname)
+
+    def acquire(self, url, method="GET"):
+        service = self.service_for_url(url)
+        if service is None:
+            return 0.0
+        # GraphQL queries are POSTs but don't create content
+        write = method.upper() not in READ_METHODS and not urlparse(url).path.endswith("/graphql")
+        return self.services[service].acquire(write=write)
+
+    def observe(self, url, status_code, headers):
+        service = self.service_for_url(url)
+        if service is not None:
+            self.services[service].observe(status_code, headers)
+
+    def budget(self):
+        """Current budget per service, e.g. for logging at the end of a run."""
+        return {name: service.snapshot() for name, service in self.services.items()}
+
+
+@lru_cache(maxsize=None)
+def get_rate_limiter():
+    return RateLimiter()
@@ -0,0 +1,130 @@
+import os
+import re
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from cli.logger import setup_logger
+from cli.journal import Journal
+from cli.handlers.git_handler import (
+    CONFIG_FILE_PATH,
+    iter_user_repos,
+    repo_has_file,
+    add_github_repo_secrets
+)
+from cli.handlers.databricks_handler import build_job_name_index
+
+logger = setup_logger()
+
+ROTATION_WORKERS = int(os.getenv("ROTATION_WORKERS", "16"))
+ROTATION_JOURNAL = os.getenv(
+    "ROTATION_JOURNAL",
+    os.path.join(os.path.expanduser("~"), ".cache", "cli_gh", "rotate_secrets_journal.jsonl")
+)
+DISCOVERY_METHODS = ("marker", "jobs", "both")
+
+# Job names follow mlops_<repo>_<train|infer>_<branch>; repo names may contain underscores
+JOB_NAME_PATTERN = re.compile(r"^mlops_(?P<repo>.+)_(?:train|infer)_[^_]+$")
+
+
+def repos_from_job_names(job_names):
+    repos = set()
+    for job_name in job_names:
+        match = JOB_NAME_PATTERN.match(job_name)
+        if match:
+            repos.add(match.group("repo"))
+    return repos
+
+
+def repos_with_marker(workers=ROTATION_WORKERS):
+    """Repos of the authenticated user that contain the template's config file."""
+    repos = list(iter_user_repos())
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        flags = executor.map(lambda repo: repo_has_file(repo["full_name"], CONFIG_FILE_PATH), repos)
+        return {repo["name"] for repo, has_marker in zip(repos, flags) if has_marker}
+
+
+def discover_fleet(method="both", workers=ROTATION_WORKERS):
+    """Names of every provisioned repo, found by config marker, job naming convention, or both."""
+    if method not in DISCOVERY_METHODS:
+        raise ValueError(f"Unknown discovery method '{method}'. Expected one of: {', '.join(DISCOVERY_METHODS)}")
+
+    repos = set()
+    if method in ("marker", "both"):
+        marker_repos = repos_with_marker(workers)
+        logger.info(f"🔍 {len(marker_repos)} repositories contain '{CONFIG_FILE_PATH}'.")
+        repos |= marker_repos
+    if method in ("jobs", "both"):
+        job_repos = repos_from_job_names(build_job_name_index(prefix="mlops_"))
+        logger.info(f"🔍 {len(job_repos)} repositories found from Databricks job names.")
+        repos |= job_repos
+    return sorted(repos)
+
+
+def secrets_fingerprint(secrets_dict):
+    """Short hash of the secret names and values, so each rotation gets its own journal entries."""
+    digest = hashlib.sha256()
+    for name in sorted(secrets_dict):
+        digest.update(f"{name}\0{secrets_dict[name]}\0".encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def _rotate_repo(repo_name, secrets_dict, journal, key):
+    started = time.monotonic()
+    result = {"repo_name": repo_name}
+    try:
+        add_github_repo_secrets(repo_name, secrets_dict)
+        result["status"] = "success"
+        journal.append(key, "done", repo_name=repo_name)
+    except Exception as e:
+        logger.error(f"❌ Rotating secrets for '{repo_name}' failed: {e}")
+        result["status"] = "failed"
+        result["error"] = str(e)
+        journal.append(key, "failed", repo_name=repo_name, error=str(e))
+    result["duration_seconds"] = round(time.monotonic() - started, 2)
+    return result
+
+
+def rotate_fleet(repos, secrets_dict, journal_path=ROTATION_JOURNAL, workers=ROTATION_WORKERS):
+    """Update ``secrets_dict`` in every repo, skipping repos the journal already has done for these values.
+
+    Returns ``(results, stats)``. Requests go through the shared session, so
+    the GitHub write budget paces the whole fleet rather than each worker.
+    """
+    journal = Journal(journal_path)
+    fingerprint = secrets_fingerprint(secrets_dict)
+    keys = {repo_name: f"rotate:{fingerprint}:{repo_name}" for repo_name in repos}
+    todo = [repo_name for repo_name in repos if not journal.is_done(keys[repo_name])]
+    skipped = len(repos) - len(todo)
+    if skipped:
+        logger.info(f"⏭️ {skipped} repositories already rotated according to {journal_path}.")
+
+    logger.info(f"🔑 Rotating {', '.join(sorted(secrets_dict))} in {len(todo)} repositories with {workers} workers...")
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_rotate_repo, repo_name, secrets_dict, journal, keys[repo_name]) for repo_name in todo]
+        results = [future.result() for future in futures]
+    elapsed = time.monotonic() - started
+
+    succeeded = sum(1 for result in results if result["status"] == "success")
+    stats = {
+        "repos": len(repos),
+        "skipped": skipped,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "elapsed_seconds": round(elapsed, 2),
+        "repos_per_second": round(succeeded / elapsed, 2) if elapsed else 0.0,
+        "secrets_per_second": round(succeeded * len(secrets_dict) / elapsed, 2) if elapsed else 0.0
+    }
+    return results, stats
+
+
+def format_rotation_report(results, stats):
+    lines = [
+        f"Repositories: {stats['repos']} ({stats['skipped']} already rotated, {stats['succeeded']} rotated, {stats['failed']} failed)",
+        f"Elapsed: {stats['elapsed_seconds']:.2f}s, {stats['repos_per_second']:.2f} repos/s, {stats['secrets_per_second']:.2f} secrets/s"
+    ]
+    failures = [result for result in results if result["status"] != "success"]
+    if failures:
+        lines.append("Failures:")
+        lines.extend(f"  ❌ {result['repo_name']}: {result['error']}" for result in failures)
+    return "\n".join(lines)
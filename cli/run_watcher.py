@@ -0,0 +1,115 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from cli.logger import setup_logger
+from cli.handlers.databricks_handler import run_job_now, get_run, iter_active_runs
+from cli.tracing import bind
+
+logger = setup_logger()
+
+RUN_POLL_MIN_INTERVAL = float(os.getenv("RUN_POLL_MIN_INTERVAL", "5"))
+RUN_POLL_MAX_INTERVAL = float(os.getenv("RUN_POLL_MAX_INTERVAL", "60"))
+# With more runs than this, one runs/list?active_only=true call per tick replaces per-run runs/get
+RUNS_LIST_THRESHOLD = int(os.getenv("RUNS_LIST_THRESHOLD", "4"))
+RUN_TIMEOUT_MINUTES = float(os.getenv("RUN_TIMEOUT_MINUTES", "60"))
+BACKOFF_MULTIPLIER = 1.5
+
+TERMINAL_STATES = ("TERMINATED", "SKIPPED", "INTERNAL_ERROR")
+
+
+def _state(run):
+    state = run.get("state", {})
+    return state.get("life_cycle_state"), state.get("result_state")
+
+
+class RunWatcher:
+    """Triggers jobs and follows all of their runs from one polling loop.
+
+    Each tick either calls runs/get for every open run or, when many are
+    watched, lists the active runs once and only calls runs/get for runs
+    that dropped out of the list. The interval grows while nothing changes
+    and resets on any state change.
+    """
+
+    def __init__(self, sleep=time.sleep, clock=time.monotonic):
+        self.sleep = sleep
+        self.clock = clock
+        self.runs = {}
+
+    def trigger(self, jobs):
+        """Call run-now on every ``{label: job_id}`` concurrently."""
+        with ThreadPoolExecutor(max_workers=max(len(jobs), 1)) as executor:
+            run_ids = dict(zip(jobs, executor.map(bind(run_job_now), jobs.values())))
+        started = self.clock()
+        for label, job_id in jobs.items():
+            self.runs[label] = {
+                "job_id": job_id,
+                "run_id": run_ids[label],
+                "life_cycle_state": "PENDING",
+                "result_state": None,
+                "run_page_url": None,
+                "triggered_at": started,
+                "seconds_to_result": None
+            }
+        return run_ids
+
+    def _open(self):
+        return [label for label, run in self.runs.items() if run["life_cycle_state"] not in TERMINAL_STATES]
+
+    def _update(self, label, run):
+        record = self.runs[label]
+        life_cycle_state, result_state = _state(run)
+        changed = (life_cycle_state, result_state) != (record["life_cycle_state"], record["result_state"])
+        record.update(life_cycle_state=life_cycle_state, result_state=result_state, run_page_url=run.get("run_page_url"))
+        if life_cycle_state in TERMINAL_STATES and record["seconds_to_result"] is None:
+            record["seconds_to_result"] = round(self.clock() - record["triggered_at"], 1)
+            logger.info(f"🏁 Run {record['run_id']} ({label}) finished: {result_state or life_cycle_state} after {record['seconds_to_result']}s.")
+        return changed
+
+    def poll_once(self):
+        """One polling tick; returns True if any run changed state."""
+        open_labels = self._open()
+        if len(open_labels) > RUNS_LIST_THRESHOLD:
+            active = {run["run_id"]: run for run in iter_active_runs()}
+            changed = False
+            for label in open_labels:
+                run = active.get(self.runs[label]["run_id"])
+                # Runs missing from the active list have finished; fetch their final state
+                changed |= self._update(label, run if run is not None else get_run(self.runs[label]["run_id"]))
+            return changed
+
+        with ThreadPoolExecutor(max_workers=max(len(open_labels), 1)) as executor:
+            runs = list(executor.map(bind(lambda label: get_run(self.runs[label]["run_id"])), open_labels))
+        return any([self._update(label, run) for label, run in zip(open_labels, runs)])
+
+    def wait(self, timeout_seconds=RUN_TIMEOUT_MINUTES * 60):
+        deadline = self.clock() + timeout_seconds
+        interval = RUN_POLL_MIN_INTERVAL
+        while self._open():
+            changed = self.poll_once()
+            if not self._open():
+                break
+            interval = RUN_POLL_MIN_INTERVAL if changed else min(interval * BACKOFF_MULTIPLIER, RUN_POLL_MAX_INTERVAL)
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                logger.warning(f"⚠️ Timed out waiting for runs: {', '.join(self._open())}")
+                break
+            self.sleep(min(interval, remaining))
+        return self.runs
+
+
+def trigger_jobs_and_wait(jobs, timeout_seconds=RUN_TIMEOUT_MINUTES * 60, sleep=time.sleep, clock=time.monotonic):
+    """Run every ``{label: job_id}`` now and wait for the first result of each."""
+    watcher = RunWatcher(sleep=sleep, clock=clock)
+    watcher.trigger(jobs)
+    return watcher.wait(timeout_seconds)
+
+
+def format_run_report(runs):
+    lines = []
+    for label, run in runs.items():
+        outcome = run["result_state"] or run["life_cycle_state"]
+        took = f"{run['seconds_to_result']:.1f}s" if run["seconds_to_result"] is not None else "still running"
+        icon = "✅" if run["result_state"] == "SUCCESS" else "❌"
+        lines.append(f"{icon} {label}: job {run['job_id']} run {run['run_id']} {outcome} ({took}) {run['run_page_url'] or ''}".rstrip())
+    return "\n".join(lines)
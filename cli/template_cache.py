@@ -0,0 +1,178 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import zipfile
+import tempfile
+import threading
+from functools import lru_cache
+import requests
+from cli.logger import setup_logger
+from cli.http_client import get_session
+
+logger = setup_logger()
+
+TEMPLATE_CACHE_DIR = os.getenv(
+    "TEMPLATE_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "cli_gh", "templates")
+)
+TEMPLATE_CACHE_MAX_BYTES = int(os.getenv("TEMPLATE_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+# Within one process (e.g. a batch run) a template revalidated this recently is reused without a request
+TEMPLATE_CACHE_FRESH_SECONDS = float(os.getenv("TEMPLATE_CACHE_FRESH_SECONDS", "300"))
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _dir_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            total += os.path.getsize(os.path.join(root, file))
+    return total
+
+
+def _template_root(extracted_dir):
+    """Archives from GitHub wrap everything in a single '<repo>-<branch>' folder."""
+    for item in sorted(os.listdir(extracted_dir)):
+        item_path = os.path.join(extracted_dir, item)
+        if os.path.isdir(item_path):
+            return item_path
+    raise Exception("No extracted folder found after downloading template.")
+
+
+class TemplateCache:
+    """On-disk cache of extracted template archives.
+
+    Extracted trees are stored under the upstream commit SHA (GitHub writes it
+    into the zip comment) or, failing that, the SHA-256 of the archive. The
+    index remembers the last ETag per URL so repeat runs can revalidate with a
+    conditional GET and reuse the tree on 304. Least recently used trees are
+    evicted once the cache grows past ``max_bytes``. Concurrent callers in the
+    same process share one revalidation per ``fresh_seconds``.
+    """
+
+    def __init__(self, cache_dir=TEMPLATE_CACHE_DIR, max_bytes=TEMPLATE_CACHE_MAX_BYTES,
+                 fresh_seconds=TEMPLATE_CACHE_FRESH_SECONDS):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.fresh_seconds = fresh_seconds
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self._lock = threading.Lock()
+        self._fresh = {}
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"urls": {}, "entries": {}}
+
+    def _save_index(self, index):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def _touch(self, index, key):
+        index["entries"][key]["last_used"] = time.time()
+
+    def _evict(self, index, keep):
+        entries = index["entries"]
+        total = sum(entry["size"] for entry in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(self._entry_path(key), ignore_errors=True)
+            total -= entries.pop(key)["size"]
+            for url, meta in list(index["urls"].items()):
+                if meta["key"] == key:
+                    del index["urls"][url]
+            logger.info(f"🧹 Evicted cached template '{key}'.")
+
+    def _download(self, url, response):
+        """Stream the archive to disk, extract it and return its cache key."""
+        digest = hashlib.sha256()
+        fd, zip_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".zip")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+                    f.write(chunk)
+
+            with zipfile.ZipFile(zip_path, "r") as zip_ref:
+                commit_sha = zip_ref.comment.decode("utf-8", errors="ignore").strip()
+                key = commit_sha if len(commit_sha) == 40 else digest.hexdigest()
+                if os.path.isdir(self._entry_path(key)):
+                    return key
+
+                extract_dir = tempfile.mkdtemp(dir=self.cache_dir, prefix=".extract-")
+                try:
+                    zip_ref.extractall(extract_dir)
+                    os.replace(extract_dir, self._entry_path(key))
+                except Exception:
+                    shutil.rmtree(extract_dir, ignore_errors=True)
+                    raise
+            return key
+        finally:
+            os.remove(zip_path)
+
+    def fetch(self, url):
+        """Return the extracted template folder for ``url``, downloading only when it changed."""
+        with self._lock:
+            fresh = self._fresh.get(url)
+            if fresh and time.monotonic() - fresh[0] < self.fresh_seconds and os.path.isdir(fresh[1]):
+                return fresh[1]
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            index = self._load_index()
+            cached = index["urls"].get(url)
+            if cached and not os.path.isdir(self._entry_path(cached["key"])):
+                cached = None
+
+            request_headers = {}
+            if cached and cached.get("etag"):
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached and cached.get("last_modified"):
+                request_headers["If-Modified-Since"] = cached["last_modified"]
+
+            try:
+                response = get_session().get(url, headers=request_headers, stream=True)
+            except requests.RequestException:
+                if not cached:
+                    raise
+                logger.warning(f"⚠️ Template download failed, using cached copy '{cached['key']}'.", exc_info=True)
+                response = None
+
+            if response is None or response.status_code == 304:
+                key = cached["key"]
+                if response is not None:
+                    logger.info(f"✅ Template unchanged (304), reusing cached copy '{key}'.")
+            else:
+                with response:
+                    response.raise_for_status()
+                    key = self._download(url, response)
+                index["urls"][url] = {
+                    "key": key,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified")
+                }
+                if key not in index["entries"]:
+                    index["entries"][key] = {"size": _dir_size(self._entry_path(key))}
+                logger.info(f"✅ Template downloaded and cached as '{key}'.")
+
+            self._touch(index, key)
+            self._evict(index, keep=key)
+            self._save_index(index)
+            template_root = _template_root(self._entry_path(key))
+            self._fresh[url] = (time.monotonic(), template_root)
+            return template_root
+
+
+@lru_cache(maxsize=None)
+def get_template_cache():
+    return TemplateCache()
@@ -0,0 +1,196 @@
+import os
+import json
+import time
+import atexit
+import inspect
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import wraps, lru_cache
+from cli.logger import setup_logger
+
+logger = setup_logger()
+
+# OTLP/JSON trace file (one ExportTraceServiceRequest per line); unset = tracing off
+TRACE_FILE = os.getenv("TRACE_FILE")
+TRACE_SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME", "cli_gh")
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_CODE_OK = 1
+STATUS_CODE_ERROR = 2
+
+_current_span = ContextVar("current_span", default=None)
+_trace_file = TRACE_FILE
+
+
+class Span:
+    """One timed operation. Spans without a parent start a new trace."""
+
+    def __init__(self, tracer, name, parent=None, kind=SPAN_KIND_INTERNAL, attributes=None):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.kind = kind
+        self.attributes = dict(attributes or {})
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.status = (STATUS_CODE_OK, None)
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def end(self, error=None):
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.status = (STATUS_CODE_ERROR, error if isinstance(error, str) else f"{type(error).__name__}: {error}")
+        self.tracer.finish(self)
+
+    def to_otlp(self):
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in self.attributes.items()],
+            "status": {"code": self.status[0]}
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.status[1]:
+            span["status"]["message"] = self.status[1]
+        return span
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Tracer:
+    """Collects finished spans and appends them to ``path`` in OTLP/JSON.
+
+    Spans are buffered and written whenever a root span ends (so every
+    repo's trace lands as soon as it is done) and once more at exit. Each
+    line is a complete ExportTraceServiceRequest, the format the
+    OpenTelemetry Collector's ``otlpjsonfile`` receiver and most local
+    trace viewers import.
+    """
+
+    def __init__(self, path, service_name=TRACE_SERVICE_NAME):
+        self.path = path
+        self.service_name = service_name
+        self._finished = []
+        self._lock = threading.Lock()
+
+    def start_span(self, name, parent=None, kind=SPAN_KIND_INTERNAL, attributes=None):
+        return Span(self, name, parent or _current_span.get(), kind, attributes)
+
+    def finish(self, span):
+        with self._lock:
+            self._finished.append(span)
+        if span.parent_id is None:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            spans, self._finished = self._finished, []
+            if not spans:
+                return
+            request = {
+                "resourceSpans": [{
+                    "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self.service_name}}]},
+                    "scopeSpans": [{"scope": {"name": "cli_gh"}, "spans": [span.to_otlp() for span in spans]}]
+                }]
+            }
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(request) + "\n")
+
+
+def enable_tracing(path):
+    """Write traces to ``path`` (TRACE_FILE / --trace-file); None turns tracing off."""
+    global _trace_file
+    _trace_file = path
+
+
+@lru_cache(maxsize=None)
+def _open_tracer(path):
+    tracer = Tracer(path)
+    atexit.register(tracer.flush)
+    logger.info(f"🔭 Writing traces to {path}.")
+    return tracer
+
+
+def get_tracer():
+    """The shared tracer, or None when tracing is off."""
+    return _open_tracer(_trace_file) if _trace_file else None
+
+
+def current_span():
+    return _current_span.get()
+
+
+@contextmanager
+def span(name, attributes=None, kind=SPAN_KIND_INTERNAL):
+    """Run the block in a child span of the current one (or a new trace). Yields None when tracing is off."""
+    tracer = get_tracer()
+    if tracer is None:
+        yield None
+        return
+    current = tracer.start_span(name, kind=kind, attributes=attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.end(error=e)
+        raise
+    else:
+        current.end()
+    finally:
+        _current_span.reset(token)
+
+
+def traced(func):
+    """Trace every call of ``func`` as ``<module>.<function>``, tagged with its ``repo_name`` argument if it has one."""
+    name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+    signature = inspect.signature(func)
+    takes_repo = "repo_name" in signature.parameters
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _trace_file:
+            return func(*args, **kwargs)
+        attributes = {"code.function": func.__name__, "code.namespace": func.__module__}
+        if takes_repo:
+            repo_name = signature.bind_partial(*args, **kwargs).arguments.get("repo_name")
+            if repo_name is not None:
+                attributes["repo.name"] = repo_name
+        with span(name, attributes):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def bind(func):
+    """``func`` running under the current span and log context, for handing work to a thread pool."""
+    context = copy_context()
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        # A fresh copy per call, since one context can't be entered by two threads at once
+        return context.copy().run(func, *args, **kwargs)
+
+    return wrapper
@@ -1,9 +1,20 @@
 import os
 import json
-import requests
+from base64 import b64decode
 from datetime import datetime
-from github import Github
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from cli.http_client import get_session
+from cli.handlers.git_handler import (
+    CONFIG_FILE_PATH,
+    get_github_user,
+    github_graphql,
+    github_headers,
+    repo_api_url,
+    refresh_repo_inventory
+)
+from cli.inventory import GITHUB_REPOS, get_inventory
+from cli.tracing import traced, bind
 
 # Load environment variables
 load_dotenv()
@@ -11,59 +22,133 @@ GH_TOKEN = os.getenv("GH_TOKEN")
 DATABRICKS_TOKEN = os.getenv("DATABRICKS_TOKEN")
 DATABRICKS_HOST = os.getenv("DATABRICKS_HOST")
 USERNAME = os.getenv("DATABRICKS_USERNAME")
+# Threads per validated repo; the checks are independent round-trips
+E2E_WORKERS = int(os.getenv("E2E_WORKERS", "8"))
+# "graphql" fetches repo, dev branch, workflows and config in one query; "rest" uses four calls
+E2E_GITHUB_API = os.getenv("E2E_GITHUB_API", "graphql")
+# Repos per GraphQL query when validating several at once
+GRAPHQL_BATCH_SIZE = int(os.getenv("GRAPHQL_BATCH_SIZE", "25"))
 
 HEADERS = {
     "Authorization": f"Bearer {DATABRICKS_TOKEN}",
     "Content-Type": "application/json"
 }
 
+EXPECTED_SECRETS = ["GH_TOKEN", "DATABRICKS_HOST", "DATABRICKS_USERNAME", "MLFLOW_USER_EMAIL"]
+
+
+def github_get(repo_name, path="", **kwargs):
+    return get_session().get(f"{repo_api_url(repo_name)}{path}", headers=github_headers(), **kwargs)
+
+@traced
 def check_repo_exists(repo_name):
-    g = Github(GH_TOKEN)
-    user = g.get_user()
-    try:
-        repo = user.get_repo(repo_name)
-        return True, repo
-    except Exception:
-        return False, None
+    inventory = get_inventory()
+    if inventory is not None:
+        inventory.ensure_fresh(GITHUB_REPOS, refresh_repo_inventory)
+        if not inventory.has_repo(repo_name):
+            return False, None
+    response = github_get(repo_name)
+    if response.status_code == 200:
+        return True, response.json()
+    return False, None
 
-def check_dev_branch(repo):
-    try:
-        branch = repo.get_branch("dev")
-        return True
-    except Exception:
-        return False
+@traced
+def check_dev_branch(repo_name):
+    return github_get(repo_name, "/branches/dev").status_code == 200
 
-def check_config_file(repo):
+@traced
+def check_config_file(repo_name):
+    response = github_get(repo_name, f"/contents/{CONFIG_FILE_PATH}", params={"ref": "dev"})
+    if response.status_code != 200:
+        return False, {}
     try:
-        contents = repo.get_contents("mlops_config/mlops_config_dev.json", ref="dev")
-        config = json.loads(contents.decoded_content.decode())
-        return "train_job_id" in config and "infer_job_id" in config, config
-    except Exception:
+        config = parse_config(response.json())
+    except (ValueError, KeyError):
         return False, {}
+    return "train_job_id" in config and "infer_job_id" in config, config
 
-def check_workflow_exists(repo):
-    try:
-        contents = repo.get_contents(".github/workflows", ref="dev")
-        return any("train" in file.name.lower() or "pipeline" in file.name.lower() for file in contents)
-    except Exception:
+def parse_config(contents):
+    return json.loads(b64decode(contents["content"]).decode("utf-8"))
+
+@traced
+def check_workflow_exists(repo_name):
+    response = github_get(repo_name, "/contents/.github/workflows", params={"ref": "dev"})
+    if response.status_code != 200:
         return False
+    return any("train" in entry["name"].lower() or "pipeline" in entry["name"].lower() for entry in response.json())
 
+@traced
 def check_repo_secrets(repo_name):
-    url = f"https://api.github.com/repos/{USERNAME}/{repo_name}/actions/secrets"
-    response = requests.get(url, headers={"Authorization": f"Bearer {GH_TOKEN}"})
+    response = github_get(repo_name, "/actions/secrets")
     if response.status_code == 200:
         secrets = [s["name"] for s in response.json().get("secrets", [])]
-        expected = ["GH_TOKEN", "DATABRICKS_HOST", "DATABRICKS_USERNAME", "MLFLOW_USER_EMAIL"]
-        return all(secret in secrets for secret in expected)
+        return all(secret in secrets for secret in EXPECTED_SECRETS)
     return False
 
+REPO_CHECKS_FRAGMENT = """
+fragment RepoChecks on Repository {
+  url
+  devRef: ref(qualifiedName: "refs/heads/dev") { name }
+  workflows: object(expression: "dev:.github/workflows") { ... on Tree { entries { name } } }
+  config: object(expression: "dev:%s") { ... on Blob { text } }
+}
+""" % CONFIG_FILE_PATH
+
+def build_repo_checks_query(repo_names, owner):
+    """One query with an aliased ``repository`` field per repo (r0, r1, ...)."""
+    declarations = ["$owner: String!"] + [f"$name{i}: String!" for i in range(len(repo_names))]
+    fields = [f"r{i}: repository(owner: $owner, name: $name{i}) {{ ...RepoChecks }}" for i in range(len(repo_names))]
+    query = f"query RepoChecks({', '.join(declarations)}) {{\n  " + "\n  ".join(fields) + "\n}\n" + REPO_CHECKS_FRAGMENT
+    variables = {"owner": owner}
+    variables.update({f"name{i}": repo_name for i, repo_name in enumerate(repo_names)})
+    return query, variables
+
+def parse_repo_checks(node):
+    """Turn one ``RepoChecks`` result into the shape the REST checks return."""
+    if not node:
+        return {"repo": (False, None), "dev_branch": False, "workflow": False, "config": (False, {})}
+    entries = (node.get("workflows") or {}).get("entries") or []
+    config_ok, config = False, {}
+    config_text = (node.get("config") or {}).get("text")
+    if config_text:
+        try:
+            config = json.loads(config_text)
+            config_ok = "train_job_id" in config and "infer_job_id" in config
+        except ValueError:
+            config = {}
+    return {
+        "repo": (True, {"html_url": node["url"]}),
+        "dev_branch": node.get("devRef") is not None,
+        "workflow": any("train" in entry["name"].lower() or "pipeline" in entry["name"].lower() for entry in entries),
+        "config": (config_ok, config)
+    }
+
+@traced
+def fetch_github_checks(repo_names, owner=None, batch_size=GRAPHQL_BATCH_SIZE):
+    """GitHub-side checks for many repos, ``batch_size`` repos per GraphQL request."""
+    owner = owner or get_github_user().login
+    results = {}
+    for start in range(0, len(repo_names), batch_size):
+        batch = repo_names[start:start + batch_size]
+        query, variables = build_repo_checks_query(batch, owner)
+        data, errors = github_graphql(query, variables)
+        # A missing repo comes back as null data with a NOT_FOUND error; anything else is a real failure
+        unexpected = [error for error in errors if error.get("type") != "NOT_FOUND"]
+        if unexpected:
+            raise Exception(f"GitHub GraphQL error: {unexpected}")
+        for i, repo_name in enumerate(batch):
+            results[repo_name] = parse_repo_checks(data.get(f"r{i}"))
+    return results
+
+@traced
 def get_job_details(job_id):
     url = f"{DATABRICKS_HOST}/api/2.1/jobs/get?job_id={job_id}"
-    response = requests.get(url, headers=HEADERS)
+    response = get_session().get(url, headers=HEADERS)
     if response.status_code == 200:
         return response.json()
     return {}
 
+@traced
 def generate_html_report(repo_name, repo_url, config, train_job, infer_job, checks, output_path="e2e_report.html"):
     now = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
 
@@ -170,44 +255,74 @@ def generate_html_report(repo_name, repo_url, config, train_job, infer_job, chec
     return os.path.abspath(output_path)
 
 
-def run_e2e_validation(repo_name):
-    checks = {
-        "repo": False,
-        "dev_branch": False,
-        "workflow": False,
-        "secrets": False,
-        "config": False,
-        "train_job": False,
-        "infer_job": False
-    }
+@traced
+def collect_e2e_results(repo_name, github_checks=None, max_workers=E2E_WORKERS, github_api=None):
+    """Run every check for one repo concurrently.
+
+    The GitHub-side checks come from ``github_checks`` when a caller has
+    already fetched them (see fetch_github_checks), otherwise from one
+    GraphQL query or, with ``github_api`` (default E2E_GITHUB_API) set to
+    "rest", four concurrent REST calls. The two job lookups start as soon
+    as the config file has been read.
+    """
+    github_api = github_api or E2E_GITHUB_API
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        secrets_future = executor.submit(bind(check_repo_secrets), repo_name)
+        if github_checks is not None:
+            github = {field: (lambda value=value: value) for field, value in github_checks.items()}
+        elif github_api == "graphql":
+            query_future = executor.submit(bind(lambda: fetch_github_checks([repo_name])[repo_name]))
+            github = {field: (lambda field=field: query_future.result()[field]) for field in ("repo", "config", "dev_branch", "workflow")}
+        else:
+            futures = {
+                "repo": executor.submit(bind(check_repo_exists), repo_name),
+                "config": executor.submit(bind(check_config_file), repo_name),
+                "dev_branch": executor.submit(bind(check_dev_branch), repo_name),
+                "workflow": executor.submit(bind(check_workflow_exists), repo_name)
+            }
+            github = {field: future.result for field, future in futures.items()}
 
-    config = {}
-    train_job = {}
-    infer_job = {}
-    repo_url = ""
+        config_ok, config = github["config"]()
+        job_futures = {}
+        if config_ok:
+            for check, key in (("train_job", "train_job_id"), ("infer_job", "infer_job_id")):
+                if config.get(key):
+                    job_futures[check] = executor.submit(bind(get_job_details), config[key])
 
-    repo_exists, repo = check_repo_exists(repo_name)
-    checks["repo"] = repo_exists
+        repo_exists, repo = github["repo"]()
+        checks = {
+            "repo": repo_exists,
+            "config": config_ok,
+            "dev_branch": github["dev_branch"](),
+            "workflow": github["workflow"](),
+            "secrets": secrets_future.result()
+        }
+        jobs = {check: future.result() for check, future in job_futures.items()}
 
-    if repo_exists:
-        repo_url = repo.html_url
-        checks["dev_branch"] = check_dev_branch(repo)
-        checks["workflow"] = check_workflow_exists(repo)
-        checks["secrets"] = check_repo_secrets(repo_name)
-        config_ok, config = check_config_file(repo)
-        checks["config"] = config_ok
+    if not repo_exists:
+        # Same outcome as before: nothing else counts without the repo
+        checks.update(dev_branch=False, workflow=False, secrets=False, config=False)
+        config, jobs = {}, {}
+    checks["train_job"] = bool(jobs.get("train_job"))
+    checks["infer_job"] = bool(jobs.get("infer_job"))
 
-        if config_ok:
-            train_job_id = config.get("train_job_id")
-            infer_job_id = config.get("infer_job_id")
-            if train_job_id:
-                train_job = get_job_details(train_job_id)
-                checks["train_job"] = bool(train_job)
-            if infer_job_id:
-                infer_job = get_job_details(infer_job_id)
-                checks["infer_job"] = bool(infer_job)
-
-    report_path = generate_html_report(repo_name, repo_url, config, train_job, infer_job, checks)
+    return {
+        "repo_name": repo_name,
+        "repo_url": repo["html_url"] if repo_exists else "",
+        "config": config,
+        "train_job": jobs.get("train_job", {}),
+        "infer_job": jobs.get("infer_job", {}),
+        "checks": checks
+    }
+
+
+@traced
+def run_e2e_validation(repo_name, output_path="e2e_report.html"):
+    results = collect_e2e_results(repo_name)
+    report_path = generate_html_report(
+        repo_name, results["repo_url"], results["config"], results["train_job"], results["infer_job"],
+        results["checks"], output_path=output_path
+    )
     return report_path
 
 
@@ -0,0 +1,144 @@
+import os
+import json
+import time
+from html import escape
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from e2e import e2e_validator
+from e2e.e2e_validator import (
+    GRAPHQL_BATCH_SIZE,
+    collect_e2e_results,
+    fetch_github_checks,
+    generate_html_report
+)
+
+# Repos validated at once; each uses a few threads of its own for its checks
+FLEET_WORKERS = int(os.getenv("FLEET_WORKERS", "8"))
+FLEET_REPORT_DIR = os.getenv("FLEET_REPORT_DIR", "e2e/reports/fleet")
+
+CHECK_LABELS = {
+    "repo": "Repo",
+    "dev_branch": "Dev Branch",
+    "workflow": "Workflow",
+    "secrets": "Secrets",
+    "config": "Config",
+    "train_job": "Train Job",
+    "infer_job": "Infer Job"
+}
+
+
+def _fetch_batch(batch):
+    try:
+        return fetch_github_checks(batch)
+    except Exception as e:
+        return {repo_name: e for repo_name in batch}
+
+
+def prefetch_github_checks(repo_names, executor, batch_size=GRAPHQL_BATCH_SIZE):
+    """GraphQL checks for the whole fleet, one query per batch, batches in parallel.
+
+    Repos in a batch whose query failed map to the exception, so one bad
+    batch only sends its own repos back to the REST checks.
+    """
+    batches = [repo_names[start:start + batch_size] for start in range(0, len(repo_names), batch_size)]
+    results = {}
+    for batch_results in executor.map(_fetch_batch, batches):
+        results.update(batch_results)
+    return results
+
+
+def _validate_repo(repo_name, github_checks, output_dir):
+    started = time.monotonic()
+    result = {"repo_name": repo_name}
+    github_api = None
+    if isinstance(github_checks, Exception):
+        result["github_checks_error"] = str(github_checks)
+        github_checks, github_api = None, "rest"
+    try:
+        details = collect_e2e_results(repo_name, github_checks=github_checks, max_workers=3, github_api=github_api)
+        page = f"repos/{repo_name}.html"
+        generate_html_report(
+            repo_name, details["repo_url"], details["config"], details["train_job"], details["infer_job"],
+            details["checks"], output_path=os.path.join(output_dir, page)
+        )
+        result.update(
+            status="pass" if all(details["checks"].values()) else "fail",
+            checks=details["checks"],
+            page=page
+        )
+    except Exception as e:
+        result.update(status="error", error=str(e))
+    result["duration_seconds"] = round(time.monotonic() - started, 2)
+    return result
+
+
+def validate_fleet(repo_names, workers=FLEET_WORKERS, output_dir=FLEET_REPORT_DIR, batch_size=GRAPHQL_BATCH_SIZE):
+    """Validate every repo with at most ``workers`` in flight and write per-repo pages plus a summary.
+
+    Returns ``(results, summary_path)`` with results in input order. All
+    requests share the HTTP session and rate-limit budget of the process.
+    """
+    os.makedirs(os.path.join(output_dir, "repos"), exist_ok=True)
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        prefetched = prefetch_github_checks(repo_names, executor, batch_size) if e2e_validator.E2E_GITHUB_API == "graphql" else {}
+        futures = [
+            executor.submit(_validate_repo, repo_name, prefetched.get(repo_name), output_dir)
+            for repo_name in repo_names
+        ]
+        results = [future.result() for future in futures]
+    elapsed = time.monotonic() - started
+
+    summary_path = generate_fleet_report(results, elapsed, os.path.join(output_dir, "index.html"))
+    with open(os.path.join(output_dir, "summary.json"), "w", encoding="utf-8") as f:
+        json.dump({"elapsed_seconds": round(elapsed, 2), "results": results}, f, indent=4)
+    return results, summary_path
+
+
+def generate_fleet_report(results, elapsed, output_path):
+    now = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+    passed = sum(1 for result in results if result["status"] == "pass")
+
+    def cell(ok):
+        return "<td style='color:green'>✅</td>" if ok else "<td style='color:red'>❌</td>"
+
+    rows = []
+    for result in results:
+        name = escape(result["repo_name"])
+        if result["status"] == "error":
+            rows.append(
+                f"<tr><td>{name}</td><td colspan='{len(CHECK_LABELS)}' style='color:red'>⚠️ {escape(result['error'])}</td>"
+                f"<td>{result['duration_seconds']:.2f}</td></tr>"
+            )
+            continue
+        checks = "".join(cell(result["checks"][check]) for check in CHECK_LABELS)
+        rows.append(
+            f"<tr><td><a href=\"{escape(result['page'])}\">{name}</a></td>{checks}"
+            f"<td>{result['duration_seconds']:.2f}</td></tr>"
+        )
+    header = "".join(f"<th>{label}</th>" for label in CHECK_LABELS.values())
+
+    html = f"""
+    <html><head><title>E2E Fleet Validation Report</title>
+    <style>
+    body {{ font-family: Arial; padding: 20px; color: #333; }}
+    h2 {{ color: #2E86C1; }}
+    table {{ border-collapse: collapse; width: 100%; margin-top: 20px; }}
+    th, td {{ border: 1px solid #ccc; padding: 8px; }}
+    th {{ background: #f2f2f2; text-align: left; }}
+    </style></head><body>
+
+    <h2>📘 End-to-End Fleet Validation Report</h2>
+    <p><strong>Validation Timestamp:</strong> {now}</p>
+    <p><strong>Repositories:</strong> {passed}/{len(results)} passed all checks in {elapsed:.1f}s</p>
+
+    <table>
+    <tr><th>Repository</th>{header}<th>Duration (s)</th></tr>
+    {"".join(rows)}
+    </table>
+
+    </body></html>
+    """
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(html)
+    return os.path.abspath(output_path)
@@ -0,0 +1,166 @@
+import os
+import time
+import heapq
+import requests
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from cli.http_client import get_session
+from cli.handlers.git_handler import github_headers, repo_api_url
+
+WAIT_MIN_INTERVAL = float(os.getenv("WAIT_MIN_INTERVAL", "5"))
+WAIT_MAX_INTERVAL = float(os.getenv("WAIT_MAX_INTERVAL", "60"))
+# How far back a run may have been created and still count as "the" run we wait for;
+# with nothing in the window the latest run of any age is used instead
+WAIT_CREATED_SLACK_SECONDS = float(os.getenv("WAIT_CREATED_SLACK_SECONDS", "900"))
+WAIT_WORKERS = int(os.getenv("WAIT_WORKERS", "8"))
+BACKOFF_MULTIPLIER = 1.5
+
+
+def _parse_time(value):
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+
+
+class RepoRunWatch:
+    """Polling state for the latest workflow run of one repo."""
+
+    def __init__(self, repo_name, params, expected_seconds=None, clock=time.monotonic):
+        self.repo_name = repo_name
+        self.clock = clock
+        self.params = params
+        self.expected_seconds = expected_seconds
+        self.etag = None
+        self.run = None
+        self.run_seen_at = None
+        self.interval = WAIT_MIN_INTERVAL
+        self.polls = 0
+        self.not_modified = 0
+
+    @property
+    def done(self):
+        return bool(self.run) and self.run.get("status") == "completed"
+
+    def poll(self):
+        """Fetch the newest matching run; returns True when something changed."""
+        headers = github_headers()
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        self.polls += 1
+        try:
+            response = get_session().get(f"{repo_api_url(self.repo_name)}/actions/runs", headers=headers, params=self.params)
+        except requests.RequestException:
+            # Retries are exhausted; try again on the next tick instead of abandoning every watch
+            return False
+        if response.status_code == 304:
+            self.not_modified += 1
+            return False
+        if response.status_code != 200:
+            return False
+        runs = response.json().get("workflow_runs", [])
+        if not runs and "created" in self.params:
+            # Nothing recent: fall back to the latest run of any age, so an old finished run is validated at once
+            self.params = {name: value for name, value in self.params.items() if name != "created"}
+            return self.poll()
+        self.etag = response.headers.get("ETag")
+        if runs:
+            if not self.run or self.run.get("id") != runs[0].get("id"):
+                self.run_seen_at = self.clock()
+            self.run = runs[0]
+        return True
+
+    def next_interval(self, changed, now):
+        """Fast while waiting for the run to appear and near its expected end, backing off in between."""
+        if not self.run:
+            self.interval = WAIT_MIN_INTERVAL
+        elif self.expected_seconds and self.run_seen_at is not None:
+            remaining = self.expected_seconds - (now - self.run_seen_at)
+            if remaining > 0:
+                self.interval = remaining / 2
+            else:
+                # Overdue: back off from the minimum again
+                self.interval = self.interval * BACKOFF_MULTIPLIER if not changed else WAIT_MIN_INTERVAL
+        else:
+            self.interval = WAIT_MIN_INTERVAL if changed else self.interval * BACKOFF_MULTIPLIER
+        self.interval = min(max(self.interval, WAIT_MIN_INTERVAL), WAIT_MAX_INTERVAL)
+        return self.interval
+
+    def result(self):
+        run = self.run or {}
+        return {
+            "repo_name": self.repo_name,
+            "status": "completed" if self.done else "timeout",
+            "conclusion": run.get("conclusion"),
+            "run_id": run.get("id"),
+            "html_url": run.get("html_url"),
+            "polls": self.polls,
+            "not_modified": self.not_modified
+        }
+
+
+def run_filters(branch=None, event=None, since=None):
+    """Server-side filters so each poll returns at most the one run we care about."""
+    params = {"per_page": 1}
+    if branch:
+        params["branch"] = branch
+    if event:
+        params["event"] = event
+    if since:
+        params["created"] = f">={since.strftime('%Y-%m-%dT%H:%M:%SZ')}"
+    return params
+
+
+def typical_run_seconds(repo_name, branch=None, event=None):
+    """Duration of the last successful run, used to time polls around the expected finish."""
+    params = run_filters(branch, event)
+    params["status"] = "success"
+    response = get_session().get(f"{repo_api_url(repo_name)}/actions/runs", headers=github_headers(), params=params)
+    if response.status_code != 200:
+        return None
+    runs = response.json().get("workflow_runs", [])
+    if not runs or not runs[0].get("run_started_at"):
+        return None
+    run = runs[0]
+    return (_parse_time(run["updated_at"]) - _parse_time(run["run_started_at"])).total_seconds()
+
+
+def wait_for_runs(repo_names, timeout_seconds=900, branch=None, event=None, since=None,
+                  expected_seconds=None, workers=WAIT_WORKERS, sleep=time.sleep, clock=time.monotonic):
+    """Wait for the latest workflow run of every repo from one scheduling loop.
+
+    Each repo keeps its own next-poll time; whichever are due are polled
+    together, with ETag conditional requests so unchanged runs cost a 304.
+    Returns ``{repo_name: result}``.
+    """
+    if since is None:
+        since = datetime.now(timezone.utc) - timedelta(seconds=WAIT_CREATED_SLACK_SECONDS)
+    params = run_filters(branch, event, since)
+    watches = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        if expected_seconds is None:
+            expected = dict(zip(repo_names, executor.map(lambda name: typical_run_seconds(name, branch, event), repo_names)))
+        else:
+            expected = {repo_name: expected_seconds for repo_name in repo_names}
+        for repo_name in repo_names:
+            watches[repo_name] = RepoRunWatch(repo_name, dict(params), expected[repo_name], clock=clock)
+
+        deadline = clock() + timeout_seconds
+        schedule = [(clock(), repo_name) for repo_name in repo_names]
+        heapq.heapify(schedule)
+        while schedule:
+            now = clock()
+            if now >= deadline:
+                break
+            next_at = schedule[0][0]
+            if next_at > now:
+                sleep(min(next_at, deadline) - now)
+                continue
+
+            due = []
+            while schedule and schedule[0][0] <= now:
+                due.append(heapq.heappop(schedule)[1])
+            for repo_name, changed in zip(due, executor.map(lambda name: watches[name].poll(), due)):
+                watch = watches[repo_name]
+                if watch.done:
+                    continue
+                heapq.heappush(schedule, (clock() + watch.next_interval(changed, clock()), repo_name))
+
+    return {repo_name: watch.result() for repo_name, watch in watches.items()}
@@ -3,40 +3,23 @@
 import os
 import json
 import sys
+import argparse
 from datetime import datetime
 from pathlib import Path
-import time
-import requests
+from e2e.pipeline_waiter import wait_for_runs
 from e2e.e2e_validator import run_e2e_validation
-
-def wait_for_repo_pipeline(repo_name, timeout_minutes=15):
-    print(f"⏳ Waiting for the pipeline in '{repo_name}' to complete...")
-
-    headers = {
-        "Authorization": f"Bearer {os.getenv('GH_TOKEN')}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-
-    url = f"https://api.github.com/repos/Ashoke238/{repo_name}/actions/runs"
-    timeout = time.time() + timeout_minutes * 60
-
-    print("⏳ Waiting for latest workflow in repo to complete...", flush=True)
-
-    while time.time() < timeout:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            workflows = response.json().get("workflow_runs", [])
-            if workflows:
-                latest_run = workflows[0]
-                status = latest_run.get("status")
-                conclusion = latest_run.get("conclusion")
-                print(f"🌀 Status: {status}, Conclusion: {conclusion}",flush=True)
-                if status == "completed":
-                    return conclusion == "success"
-        time.sleep(60)
-
-    print("⚠️ Timed out waiting for pipeline to complete.")
-    return False
+from e2e.fleet_validator import validate_fleet, FLEET_WORKERS, FLEET_REPORT_DIR
+from cli.tracing import enable_tracing, TRACE_FILE
+
+def wait_for_repo_pipeline(repo_name, timeout_minutes=15, branch=None, event=None):
+    """Wait for the latest workflow run of ``repo_name``; True when it concluded successfully."""
+    print(f"⏳ Waiting for the pipeline in '{repo_name}' to complete...", flush=True)
+    result = wait_for_runs([repo_name], timeout_seconds=timeout_minutes * 60, branch=branch, event=event)[repo_name]
+    if result["status"] != "completed":
+        print("⚠️ Timed out waiting for pipeline to complete.")
+        return False
+    print(f"🌀 Status: completed, Conclusion: {result['conclusion']} ({result['polls']} polls, {result['not_modified']} unchanged)", flush=True)
+    return result["conclusion"] == "success"
 
 # def run_e2e_validation(repo_name):
 #     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -116,19 +99,70 @@ def wait_for_repo_pipeline(repo_name, timeout_minutes=15):
 
 #     return report_path
 
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Validate provisioned repositories end to end.")
+    parser.add_argument("repo_names", nargs="*", help="Repository to validate (several with --fleet).")
+    parser.add_argument("--fleet", action="store_true", help="Validate many repositories and write one summary report plus per-repo pages.")
+    parser.add_argument("--repos-file", help="File with one repository name per line (fleet mode).")
+    parser.add_argument("--discover", choices=("marker", "jobs", "both"), help="Discover every provisioned repository instead of listing them (fleet mode).")
+    parser.add_argument("--workers", type=int, default=FLEET_WORKERS, help="Repositories validated concurrently (fleet mode).")
+    parser.add_argument("--output-dir", default=FLEET_REPORT_DIR, help="Where the fleet reports are written.")
+    parser.add_argument("--wait", action="store_true", help="Wait for the latest workflow run of every repository to finish before validating.")
+    parser.add_argument("--wait-minutes", type=float, default=15, help="How long --wait waits in total.")
+    parser.add_argument("--branch", help="Only wait for workflow runs on this branch.")
+    parser.add_argument("--trace-file", default=TRACE_FILE, help="Append OTLP/JSON traces (a root span per repo) to this file.")
+    return parser.parse_args(argv)
+
+
+def fleet_repo_names(args):
+    repo_names = list(args.repo_names)
+    if args.repos_file:
+        with open(args.repos_file, "r", encoding="utf-8") as f:
+            repo_names += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    if args.discover:
+        from cli.rotation import discover_fleet
+        repo_names += discover_fleet(args.discover)
+    # Keep the first occurrence of each name
+    return list(dict.fromkeys(repo_names))
+
+
+def run_fleet(args):
+    repo_names = fleet_repo_names(args)
+    if not repo_names:
+        print("❌ No repositories to validate; pass names, --repos-file or --discover.", file=sys.stderr)
+        sys.exit(1)
+
+    if args.wait:
+        runs = wait_for_runs(repo_names, timeout_seconds=args.wait_minutes * 60, branch=args.branch)
+        finished = sum(1 for result in runs.values() if result["status"] == "completed")
+        print(f"🌀 {finished}/{len(runs)} pipelines finished before validation.", file=sys.stderr)
+
+    print(f"🚀 Validating {len(repo_names)} repositories with {args.workers} workers...", file=sys.stderr)
+    results, summary_path = validate_fleet(repo_names, workers=args.workers, output_dir=args.output_dir)
+    passed = sum(1 for result in results if result["status"] == "pass")
+    print(f"📋 {passed}/{len(results)} repositories passed. Summary: {summary_path}", file=sys.stderr)
+
+    with open("report_path.txt", "w") as f:
+        f.write(summary_path)
+    print(summary_path)
+
+
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
+    args = parse_args(sys.argv[1:])
+    enable_tracing(args.trace_file)
+    if args.fleet:
+        run_fleet(args)
+        sys.exit(0)
+
+    if len(args.repo_names) != 1:
         print("❌ Please provide the GitHub repo name.")
         sys.exit(1)
 
-    repo_name = sys.argv[1]
-    
-    # print(f"⏳ Waiting for the pipeline in '{repo_name}' to complete...", file=sys.stderr)
-    # success = wait_for_repo_pipeline(repo_name)
+    repo_name = args.repo_names[0]
 
-    # if not success:
-    #     print("❌ Pipeline did not complete successfully.", file=sys.stderr)
-    #     sys.exit(1)
+    if args.wait and not wait_for_repo_pipeline(repo_name, timeout_minutes=args.wait_minutes, branch=args.branch):
+        print("❌ Pipeline did not complete successfully.", file=sys.stderr)
+        sys.exit(1)
 
     report_path = run_e2e_validation(repo_name)
 
@@ -0,0 +1,97 @@
+import os
+import json
+import tempfile
+import unittest
+from cli.batch import load_manifest, validate_manifest, run_batch, format_summary
+import logging
+
+log_file_path = "test/test_batch_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+
+class TestBatch(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    def write_manifest(self, name, content):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_load_manifest_formats(self):
+        test_name = "Load Manifest Formats"
+        expected = [
+            {"repo_name": "team_a", "accuracy_train": 0.9, "accuracy_inference": 0.8},
+            {"repo_name": "team_b", "accuracy_train": 0.85, "accuracy_inference": 0.75}
+        ]
+        paths = [
+            self.write_manifest("repos.csv", "repo_name,accuracy_train,accuracy_inference\nteam_a,0.9,\nteam_b,,0.75\n"),
+            self.write_manifest("repos.json", json.dumps({"repos": [{"repo_name": "team_a", "accuracy_train": 0.9}, {"repo_name": "team_b", "accuracy_inference": 0.75}]})),
+            self.write_manifest("repos.yaml", "- repo_name: team_a\n  accuracy_train: 0.9\n- repo_name: team_b\n  accuracy_inference: 0.75\n")
+        ]
+
+        for path in paths:
+            entries = load_manifest(path, default_train=0.85, default_inference=0.8)
+            self.assertEqual(entries, expected)
+        self.log_result(test_name, paths, expected, "All formats parsed")
+
+    def test_validate_manifest_reports_every_error(self):
+        test_name = "Validate Manifest Errors"
+        entries = [
+            {"repo_name": "team_a", "accuracy_train": 0.9, "accuracy_inference": 0.8},
+            {"repo_name": "mlops_team", "accuracy_train": 0.9, "accuracy_inference": 0.8},
+            {"repo_name": "team_a", "accuracy_train": "high", "accuracy_inference": 0.8}
+        ]
+
+        with self.assertRaises(ValueError) as context:
+            validate_manifest(entries)
+
+        message = str(context.exception)
+        self.assertIn("Entry 2 ('mlops_team')", message)
+        self.assertIn("must be numeric", message)
+        self.assertIn("listed more than once", message)
+        self.log_result(test_name, entries, "Raise ValueError listing all errors", message)
+
+    def test_run_batch_isolates_failures(self):
+        test_name = "Run Batch"
+        entries = [
+            {"repo_name": "team_a", "accuracy_train": 0.9, "accuracy_inference": 0.8},
+            {"repo_name": "team_b", "accuracy_train": 0.9, "accuracy_inference": 0.8}
+        ]
+
+        def provision(repo_name, accuracy_train, accuracy_inference, upload_mode):
+            if repo_name == "team_b":
+                raise Exception("Databricks Job Creation Failed")
+            return {"git_url": f"https://github.com/user/{repo_name}.git", "upload_mode": upload_mode}
+
+        results = run_batch(entries, provision, workers=2, upload_mode="git")
+
+        self.assertEqual([result["status"] for result in results], ["success", "failed"])
+        self.assertEqual(results[0]["outputs"]["upload_mode"], "git")
+        self.assertEqual(results[1]["error"], "Databricks Job Creation Failed")
+        self.assertIn("1/2 repositories provisioned successfully.", format_summary(results))
+        self.log_result(test_name, entries, "One success, one failure", results)
+
+
+if __name__ == "__main__":
+    print(f"📜 Running batch tests... Logs saved to {log_file_path}")
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+from unittest.mock import patch
+import requests
+from bench import run_bench
+from bench.stub_server import StubConfig
+from bench.github_stub import GitHubStub, build_template, CONFIG_FILE_PATH
+from bench.databricks_stub import DatabricksStub
+from cli.handlers import git_handler, databricks_handler
+import logging
+
+log_file_path = "test/test_bench_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+
+class TestBench(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    def setUp(self):
+        git_handler.get_github_client.cache_clear()
+        git_handler.get_github_user.cache_clear()
+
+    def tearDown(self):
+        git_handler.get_github_client.cache_clear()
+        git_handler.get_github_user.cache_clear()
+
+    def test_percentile(self):
+        values = [5, 1, 4, 2, 3]
+        self.assertEqual(run_bench.percentile(values, 50), 3)
+        self.assertEqual(run_bench.percentile(values, 95), 5)
+        self.assertIsNone(run_bench.percentile([], 50))
+
+    def test_compare_to_baseline(self):
+        test_name = "Compare To Baseline"
+        base = {"scenario": "main", "params": {"repos": 1}, "p50_seconds": 1.0, "failures": 0,
+                "requests": {"github": 20, "databricks": 5}, "bytes_uploaded": 1000, "bytes_downloaded": 500}
+        slower = dict(base, p50_seconds=1.5, requests={"github": 21, "databricks": 5}, bytes_uploaded=1100)
+
+        regressions = run_bench.compare_to_baseline([slower], {"results": [base]}, max_regression=0.25)
+        # Without max_regression only the deterministic counts gate
+        count_regressions = run_bench.compare_to_baseline([slower], {"results": [base]})
+
+        self.assertEqual(len(regressions), 3)
+        self.assertIn("p50", regressions[0])
+        self.assertIn("21 github requests", regressions[1])
+        self.assertIn("1100 bytes uploaded", regressions[2])
+        self.assertEqual(count_regressions, regressions[1:])
+        self.assertEqual(run_bench.compare_to_baseline([base], {"results": [base]}), [])
+        self.log_result(test_name, slower, "Slowdown, extra request and bytes flagged", regressions)
+
+    def test_stub_rate_limit(self):
+        test_name = "Stub Rate Limit"
+        with GitHubStub(StubConfig(rate_limit=2, rate_window=60)) as github:
+            statuses = [requests.get(f"{github.url}/user").status_code for _ in range(3)]
+            throttled = requests.get(f"{github.url}/user")
+
+        self.assertEqual(statuses, [200, 200, 429])
+        self.assertEqual(throttled.headers["X-RateLimit-Remaining"], "0")
+        self.assertGreaterEqual(int(throttled.headers["Retry-After"]), 1)
+        self.log_result(test_name, "rate_limit=2", "Third request throttled", statuses)
+
+    def test_create_jobs_request_budget(self):
+        test_name = "Create Jobs Request Budget"
+        with DatabricksStub() as databricks, patch.object(databricks_handler, "DATABRICKS_HOST", databricks.url):
+            train_job_id, infer_job_id = databricks_handler.create_jobs("bench_repo", "https://github.com/u/bench_repo.git")
+            stats = databricks.stats()
+            job = requests.get(f"{databricks.url}/api/2.1/jobs/get", params={"job_id": train_job_id}).json()
+
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["by_route"], {"POST /api/2.1/jobs/create": 2})
+        self.assertEqual(job["settings"]["name"], "mlops_bench_repo_train_dev")
+        self.assertNotEqual(train_job_id, infer_job_id)
+        self.log_result(test_name, "bench_repo", "2 requests", stats["by_route"])
+
+    def test_bulk_push_against_github_stub(self):
+        test_name = "Bulk Push Against GitHub Stub"
+        template = build_template(file_count=20, file_bytes=512)
+        files = [(path, content, mode) for path, (content, mode) in template.items()]
+
+        with GitHubStub() as github, patch.multiple(git_handler, GITHUB_API_URL=github.url, GH_TOKEN="token"):
+            repo = git_handler.create_github_repo("bench_repo")
+            github.reset_stats()
+            git_handler.push_files_to_repo_bulk(repo, files)
+            stats = github.stats()
+            tree = github.trees[github.commits[github.repos["bench_repo"]["refs"]["main"]]["tree"]]
+
+        blobs = sum(1 for path in template if path.endswith(".bin"))
+        # ref, base commit, base tree, one blob per binary file, new tree, commit, ref update
+        self.assertEqual(stats["requests"], 6 + blobs)
+        self.assertEqual(stats["by_route"]["POST /repos/{owner}/{repo}/git/blobs"], blobs)
+        self.assertEqual(set(tree), set(template) | {"README.md"})
+        self.assertIn(CONFIG_FILE_PATH, tree)
+        self.log_result(test_name, f"{len(files)} files", f"{6 + blobs} requests", stats["by_route"])
+
+
+if __name__ == "__main__":
+    unittest.main()
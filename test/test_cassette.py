@@ -0,0 +1,112 @@
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from bench import record_cassettes
+from bench.github_stub import GitHubStub
+from cli.cassette import Cassette, CassetteMiss
+from cli.http_client import get_session, use_cassette
+import logging
+
+log_file_path = "test/test_cassette_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+GITHUB = "github.test"
+DATABRICKS = "databricks.test"
+
+# Requests per host are exact: a step that needs more (or fewer) calls fails until the
+# budget and its cassette are updated (python -m bench.record_cassettes).
+# Bytes and recorded latency are ceilings.
+STEP_BUDGETS = {
+    "check_availability": {"requests": {GITHUB: 2, DATABRICKS: 2}, "bytes_sent": 0, "bytes_received": 250, "seconds": 0.3},
+    "create_and_setup_repo": {"requests": {GITHUB: 20}, "bytes_sent": 24000, "bytes_received": 6000, "seconds": 1.5},
+    "create_jobs": {"requests": {GITHUB: 1, DATABRICKS: 2}, "bytes_sent": 1100, "bytes_received": 200, "seconds": 0.2},
+    "import_repo": {"requests": {GITHUB: 1, DATABRICKS: 1}, "bytes_sent": 200, "bytes_received": 300, "seconds": 0.1},
+    "update_config": {"requests": {GITHUB: 4}, "bytes_sent": 400, "bytes_received": 2100, "seconds": 0.3},
+    "run_e2e_validation": {"requests": {GITHUB: 3, DATABRICKS: 2}, "bytes_sent": 600, "bytes_received": 1850, "seconds": 0.25},
+    "provision_repo": {"requests": {GITHUB: 23, DATABRICKS: 5}, "bytes_sent": 26000, "bytes_received": 8500, "seconds": 2.0}
+}
+
+
+class TestCassette(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        record_cassettes.reset_clients()
+        self.patches = record_cassettes.replay_patches()
+        for patcher in self.patches:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in reversed(self.patches):
+            patcher.stop()
+        record_cassettes.reset_clients()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def replay(self, step, latency_scale=0):
+        cassette = Cassette(record_cassettes.cassette_path(step), mode="replay", latency_scale=latency_scale)
+        func = dict(record_cassettes.CASSETTE_STEPS)[step]
+        record_cassettes.reset_clients()
+        with use_cassette(cassette):
+            result = func(self.work_dir)
+        return result, cassette.stats()
+
+    def test_record_and_replay(self):
+        test_name = "Record And Replay"
+        path = os.path.join(self.work_dir, "user.json")
+        with GitHubStub() as github:
+            with use_cassette(Cassette(path, mode="record", aliases={github.url: "http://github.test"})):
+                recorded = get_session().get(f"{github.url}/user", headers={"Authorization": "Bearer secret"}).json()
+
+        with open(path, "r", encoding="utf-8") as f:
+            stored = f.read()
+        with use_cassette(Cassette(path)) as cassette:
+            replayed = get_session().get("http://github.test:80/user").json()
+            with self.assertRaises(CassetteMiss):
+                get_session().get("http://github.test/user/repos")
+
+        self.assertEqual(replayed["login"], recorded["login"])
+        self.assertEqual(replayed["url"], "http://github.test/users/bench-user")
+        self.assertNotIn("secret", stored)
+        self.assertEqual(cassette.stats()["requests"], 1)
+        self.log_result(test_name, path, "Same body offline, no token on disk", replayed)
+
+    def test_step_budgets(self):
+        for step, budget in STEP_BUDGETS.items():
+            with self.subTest(step=step):
+                _, stats = self.replay(step)
+                self.assertEqual(stats["by_host"], budget["requests"])
+                self.assertLessEqual(stats["bytes_sent"], budget["bytes_sent"])
+                self.assertLessEqual(stats["bytes_received"], budget["bytes_received"])
+                self.assertLessEqual(stats["recorded_seconds"], budget["seconds"])
+                self.log_result(f"Budget {step}", step, budget, stats)
+
+    def test_provision_repo_overlaps_requests(self):
+        test_name = "Provision Repo Simulated Latency"
+        started = time.monotonic()
+        outputs, stats = self.replay("provision_repo", latency_scale=1)
+        elapsed = time.monotonic() - started
+
+        self.assertTrue(outputs["git_url"].endswith(f"/{record_cassettes.PIPELINE_REPO_NAME}.git"))
+        # Independent steps run side by side, so the run is shorter than its requests back to back
+        self.assertLess(elapsed, stats["recorded_seconds"])
+        self.log_result(test_name, "latency_scale=1", f"< {stats['recorded_seconds']}s", round(elapsed, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,13 +23,13 @@ class TestDatabricksHandler(unittest.TestCase):
         logger.info(f"📤 Actual: {result}")
         logger.info("")
 
-    @patch("cli.handlers.databricks_handler.requests.post")
-    def test_import_repo_to_databricks_success(self, mock_post):
+    @patch("cli.handlers.databricks_handler.get_session")
+    def test_import_repo_to_databricks_success(self, mock_session):
         test_name = "Import Repo to Databricks"
         inputs = ("https://github.com/user/myrepo.git", VALID_REPO_NAME)
 
-        mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = {"status": "ok"}
+        mock_session.return_value.post.return_value.status_code = 200
+        mock_session.return_value.post.return_value.json.return_value = {"status": "ok"}
 
         try:
             databricks_handler.import_repo_to_databricks(*inputs)
@@ -38,13 +38,13 @@ class TestDatabricksHandler(unittest.TestCase):
             self.log_result(test_name, inputs, "Import successful", str(e), passed=False)
             self.fail("Unexpected Exception")
 
-    @patch("cli.handlers.databricks_handler.requests.post")
-    def test_create_jobs_success(self, mock_post):
+    @patch("cli.handlers.databricks_handler.get_session")
+    def test_create_jobs_success(self, mock_session):
         test_name = "Create Databricks Jobs"
         inputs = (VALID_REPO_NAME, "https://github.com/user/myrepo.git")
 
         # Mock responses for two job creation calls
-        mock_post.side_effect = [
+        mock_session.return_value.post.side_effect = [
             MagicMock(status_code=200, json=lambda: {"job_id": 1234}),
             MagicMock(status_code=200, json=lambda: {"job_id": 5678})
         ]
@@ -58,19 +58,55 @@ class TestDatabricksHandler(unittest.TestCase):
             self.log_result(test_name, inputs, "Job IDs returned", str(e), passed=False)
             self.fail("Unexpected Exception")
 
-    @patch("cli.handlers.databricks_handler.requests.post")
-    def test_create_jobs_failure(self, mock_post):
+    @patch("cli.handlers.databricks_handler.get_session")
+    def test_create_jobs_failure(self, mock_session):
         test_name = "Create Jobs Failure"
         inputs = (VALID_REPO_NAME, "https://github.com/user/myrepo.git")
 
-        mock_post.return_value.status_code = 400
-        mock_post.return_value.text = "Bad Request"
+        mock_session.return_value.post.return_value.status_code = 400
+        mock_session.return_value.post.return_value.text = "Bad Request"
 
         with self.assertRaises(Exception) as context:
             databricks_handler.create_jobs(*inputs)
 
         self.log_result(test_name, inputs, "Raise Exception", str(context.exception))
 
+    @patch("cli.handlers.databricks_handler.get_session")
+    def test_iter_jobs_follows_page_tokens(self, mock_session):
+        test_name = "List Jobs Pagination"
+        mock_session.return_value.get.side_effect = [
+            MagicMock(status_code=200, json=lambda: {"jobs": [{"settings": {"name": "a"}}], "has_more": True, "next_page_token": "p2"}),
+            MagicMock(status_code=200, json=lambda: {"jobs": [{"settings": {"name": "b"}}], "has_more": False})
+        ]
+
+        index = databricks_handler.build_job_name_index()
+
+        self.assertEqual(index, {"a", "b"})
+        second_call_params = mock_session.return_value.get.call_args_list[1].kwargs["params"]
+        self.assertEqual(second_call_params["page_token"], "p2")
+        self.log_result(test_name, (), "Both pages scanned", index)
+
+    @patch("cli.handlers.databricks_handler.get_session")
+    def test_validate_job_availability_uses_name_filter(self, mock_session):
+        test_name = "Validate Job Availability"
+        inputs = (VALID_REPO_NAME,)
+        existing = f"mlops_{VALID_REPO_NAME}_infer_dev"
+
+        def list_jobs(url, headers, params):
+            jobs = [{"settings": {"name": existing}}] if params.get("name") == existing else []
+            return MagicMock(status_code=200, json=lambda: {"jobs": jobs, "has_more": False})
+
+        mock_session.return_value.get.side_effect = list_jobs
+
+        with self.assertRaises(ValueError) as context:
+            databricks_handler.validate_databricks_job_availability(*inputs)
+
+        self.assertIn(existing, str(context.exception))
+        self.assertNotIn("_train_", str(context.exception))
+        requested = [call.kwargs["params"]["name"] for call in mock_session.return_value.get.call_args_list]
+        self.assertEqual(requested, [f"mlops_{VALID_REPO_NAME}_train_dev", existing])
+        self.log_result(test_name, inputs, "Raise ValueError for the infer job", str(context.exception))
+
 
 if __name__ == "__main__":
     print(f"📜 Running databricks_handler tests... Logs saved to {log_file_path}")
@@ -0,0 +1,131 @@
+import json
+import time
+import unittest
+from base64 import b64encode
+from unittest.mock import patch, MagicMock
+from e2e import e2e_validator
+import logging
+
+log_file_path = "test/test_e2e_validator_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+REPO_URL = "https://api.github.com/repos/user/demo"
+CONFIG = {"train_job_id": 11, "infer_job_id": 22}
+
+
+def fake_get(url, headers=None, params=None):
+    """Every call takes 0.1s so sequential checks would take ~0.7s."""
+    time.sleep(0.1)
+    routes = {
+        REPO_URL: (200, {"html_url": "https://github.com/user/demo"}),
+        f"{REPO_URL}/branches/dev": (200, {}),
+        f"{REPO_URL}/contents/.github/workflows": (200, [{"name": "train_pipeline.yml"}]),
+        f"{REPO_URL}/actions/secrets": (200, {"secrets": [{"name": name} for name in e2e_validator.EXPECTED_SECRETS]}),
+        f"{REPO_URL}/contents/{e2e_validator.CONFIG_FILE_PATH}": (200, {"content": b64encode(json.dumps(CONFIG).encode()).decode()})
+    }
+    if "jobs/get" in url:
+        job_id = int(url.rsplit("=", 1)[1])
+        status, payload = 200, {"job_id": job_id, "settings": {"name": f"job_{job_id}"}}
+    else:
+        status, payload = routes.get(url, (404, {}))
+    return MagicMock(status_code=status, json=lambda: payload)
+
+
+class TestE2EValidator(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    @patch("e2e.e2e_validator.E2E_GITHUB_API", "rest")
+    @patch("e2e.e2e_validator.repo_api_url", return_value=REPO_URL)
+    @patch("e2e.e2e_validator.get_session")
+    def test_checks_run_concurrently(self, mock_session, mock_repo_url):
+        test_name = "E2E Checks Run Concurrently"
+        mock_session.return_value.get.side_effect = fake_get
+
+        started = time.perf_counter()
+        results = e2e_validator.collect_e2e_results("demo")
+        elapsed = time.perf_counter() - started
+
+        self.assertTrue(all(results["checks"].values()), results["checks"])
+        self.assertEqual(results["train_job"]["job_id"], 11)
+        self.assertEqual(mock_session.return_value.get.call_count, 7)
+        # Longest chain is config -> job lookup
+        self.assertLess(elapsed, 0.5)
+        self.log_result(test_name, ("demo",), "All checks pass in ~2 round-trips", round(elapsed, 2))
+
+    @patch("e2e.e2e_validator.E2E_GITHUB_API", "rest")
+    @patch("e2e.e2e_validator.repo_api_url", return_value="https://api.github.com/repos/user/missing")
+    @patch("e2e.e2e_validator.get_session")
+    def test_missing_repo_fails_every_check(self, mock_session, mock_repo_url):
+        test_name = "E2E Missing Repo"
+        mock_session.return_value.get.side_effect = fake_get
+
+        results = e2e_validator.collect_e2e_results("missing")
+
+        self.assertFalse(any(results["checks"].values()))
+        self.assertEqual(results["repo_url"], "")
+        self.log_result(test_name, ("missing",), "All checks fail", results["checks"])
+
+    @patch("e2e.e2e_validator.github_graphql")
+    def test_graphql_checks_batch_repos(self, mock_graphql):
+        test_name = "GraphQL Checks Batch Repos"
+        mock_graphql.return_value = ({
+            "r0": {
+                "url": "https://github.com/user/demo",
+                "devRef": {"name": "dev"},
+                "workflows": {"entries": [{"name": "train_pipeline.yml"}]},
+                "config": {"text": json.dumps(CONFIG)}
+            },
+            "r1": None
+        }, [{"type": "NOT_FOUND", "path": ["r1"]}])
+
+        results = e2e_validator.fetch_github_checks(["demo", "missing", "other"], owner="user", batch_size=2)
+
+        self.assertEqual(mock_graphql.call_count, 2)
+        query, variables = mock_graphql.call_args_list[0].args
+        self.assertIn("r1: repository(owner: $owner, name: $name1)", query)
+        self.assertEqual(variables, {"owner": "user", "name0": "demo", "name1": "missing"})
+        self.assertEqual(results["demo"], {
+            "repo": (True, {"html_url": "https://github.com/user/demo"}),
+            "dev_branch": True,
+            "workflow": True,
+            "config": (True, CONFIG)
+        })
+        self.assertEqual(results["missing"]["repo"], (False, None))
+        self.log_result(test_name, ["demo", "missing", "other"], "2 queries for 3 repos", results)
+
+    @patch("e2e.e2e_validator.repo_api_url", return_value=REPO_URL)
+    @patch("e2e.e2e_validator.get_session")
+    def test_prefetched_github_checks(self, mock_session, mock_repo_url):
+        test_name = "E2E With Prefetched GitHub Checks"
+        mock_session.return_value.get.side_effect = fake_get
+        github_checks = {
+            "repo": (True, {"html_url": "https://github.com/user/demo"}),
+            "dev_branch": True,
+            "workflow": True,
+            "config": (True, CONFIG)
+        }
+
+        results = e2e_validator.collect_e2e_results("demo", github_checks=github_checks)
+
+        self.assertTrue(all(results["checks"].values()), results["checks"])
+        # Only the secrets listing and the two job lookups go over REST
+        self.assertEqual(mock_session.return_value.get.call_count, 3)
+        self.log_result(test_name, ("demo",), "3 REST calls", results["checks"])
+
+
+if __name__ == "__main__":
+    print(f"📜 Running e2e validator tests... Logs saved to {log_file_path}")
+    unittest.main()
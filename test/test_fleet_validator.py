@@ -0,0 +1,99 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+from e2e import fleet_validator
+import logging
+
+log_file_path = "test/test_fleet_validator_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+ALL_PASS = {check: True for check in fleet_validator.CHECK_LABELS}
+
+
+def fake_collect(repo_name, github_checks=None, max_workers=None, github_api=None):
+    if repo_name == "broken":
+        raise Exception("Databricks unavailable")
+    checks = dict(ALL_PASS, secrets=repo_name != "no_secrets")
+    return {
+        "repo_name": repo_name,
+        "repo_url": f"https://github.com/user/{repo_name}",
+        "config": {"train_job_id": 1, "infer_job_id": 2},
+        "train_job": {},
+        "infer_job": {},
+        "checks": checks
+    }
+
+
+class TestFleetValidator(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    @patch("e2e.e2e_validator.E2E_GITHUB_API", "graphql")
+    @patch("e2e.fleet_validator.collect_e2e_results", side_effect=fake_collect)
+    @patch("e2e.fleet_validator.fetch_github_checks", side_effect=lambda batch: {name: {"batch": tuple(batch)} for name in batch})
+    def test_validate_fleet_writes_summary_and_pages(self, mock_fetch, mock_collect):
+        test_name = "Fleet Validation Reports"
+        repo_names = ["alpha", "no_secrets", "broken"]
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            results, summary_path = fleet_validator.validate_fleet(repo_names, workers=2, output_dir=output_dir)
+
+            statuses = [result["status"] for result in results]
+            self.assertEqual(statuses, ["pass", "fail", "error"])
+            self.assertTrue(os.path.exists(os.path.join(output_dir, "repos", "alpha.html")))
+            with open(summary_path, encoding="utf-8") as f:
+                summary = f.read()
+            self.assertIn('href="repos/alpha.html"', summary)
+            self.assertIn("1/3 passed", summary)
+            with open(os.path.join(output_dir, "summary.json"), encoding="utf-8") as f:
+                self.assertEqual(len(json.load(f)["results"]), 3)
+
+        # One GraphQL query covers the three repos
+        mock_fetch.assert_called_once_with(repo_names)
+        self.assertEqual(mock_collect.call_args_list[0].kwargs["github_checks"], {"batch": tuple(repo_names)})
+        self.log_result(test_name, repo_names, ["pass", "fail", "error"], statuses)
+
+    @patch("e2e.e2e_validator.E2E_GITHUB_API", "graphql")
+    @patch("e2e.fleet_validator.collect_e2e_results", side_effect=fake_collect)
+    @patch("e2e.fleet_validator.fetch_github_checks")
+    def test_failed_batch_falls_back_to_rest(self, mock_fetch, mock_collect):
+        test_name = "Failed GraphQL Batch Falls Back"
+        repo_names = ["alpha", "beta", "gamma"]
+
+        def fetch(batch):
+            if "alpha" in batch:
+                raise Exception("GitHub GraphQL error: 502")
+            return {name: {"batch": tuple(batch)} for name in batch}
+        mock_fetch.side_effect = fetch
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            results, _ = fleet_validator.validate_fleet(repo_names, workers=2, output_dir=output_dir, batch_size=2)
+            self.assertTrue(os.path.exists(os.path.join(output_dir, "summary.json")))
+
+        calls = {call.args[0]: call.kwargs for call in mock_collect.call_args_list}
+        self.assertEqual([result["status"] for result in results], ["pass", "pass", "pass"])
+        self.assertEqual((calls["alpha"]["github_checks"], calls["alpha"]["github_api"]), (None, "rest"))
+        self.assertEqual((calls["beta"]["github_checks"], calls["beta"]["github_api"]), (None, "rest"))
+        self.assertEqual(calls["gamma"]["github_checks"], {"batch": ("gamma",)})
+        self.assertIn("502", results[0]["github_checks_error"])
+        self.assertNotIn("github_checks_error", results[2])
+        self.log_result(test_name, repo_names, "alpha/beta via REST, gamma via GraphQL", calls)
+
+
+if __name__ == "__main__":
+    print(f"📜 Running fleet validator tests... Logs saved to {log_file_path}")
+    unittest.main()
@@ -3,7 +3,14 @@ from unittest.mock import patch, MagicMock
 from cli.handlers import git_handler
 from test.test_data import VALID_REPO_NAME
 import logging
+import os
+import io
+import json
+import tarfile
+import tempfile
+import git
 from github.GithubException import GithubException
+from nacl import encoding, public
 
 # Set up test logger
 log_file_path = "test/test_git_handler_output.log"
@@ -17,6 +24,12 @@ logger = logging.getLogger(__name__)
 
 class TestGitHandler(unittest.TestCase):
 
+    def setUp(self):
+        # Clients are cached per run; drop them so each test sees its own mock
+        git_handler.get_github_client.cache_clear()
+        git_handler.get_github_user.cache_clear()
+        git_handler.get_repo_public_key.cache_clear()
+
     def log_result(self, test_name, inputs, expected, result, passed=True):
         status = "✅ PASSED" if passed else "❌ FAILED"
         logger.info(f"--- {status}: {test_name} ---")
@@ -56,27 +69,17 @@ class TestGitHandler(unittest.TestCase):
             self.log_result(test_name, inputs, "Repo object", str(e), passed=False)
             self.fail(f"Unexpected exception: {e}")
 
-    @patch("cli.handlers.git_handler.requests.get")
-    @patch("cli.handlers.git_handler.zipfile.ZipFile")
-    def test_download_and_extract_template(self, mock_zipfile, mock_requests):
+    @patch("cli.handlers.git_handler.get_template_cache")
+    def test_download_and_extract_template(self, mock_get_cache):
         test_name = "Download and Extract Template"
         inputs = ()
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = b'dummy zip'
-        mock_requests.return_value = mock_response
-
-        mock_zip_context = MagicMock()
-        mock_zipfile.return_value.__enter__.return_value = mock_zip_context
+        mock_get_cache.return_value.fetch.return_value = "/cache/abc123/model_train_infer-main"
 
-        # simulate directory creation
-        with patch("cli.handlers.git_handler.os.listdir") as mock_listdir:
-            mock_listdir.return_value = ["model_train_infer-main"]
-            with patch("cli.handlers.git_handler.os.path.isdir", return_value=True):
-                result = git_handler.download_and_extract_template()
-                self.assertTrue(result.endswith("model_train_infer-main"))
-                self.log_result(test_name, inputs, "Extracted folder path", result)
+        result = git_handler.download_and_extract_template()
+        mock_get_cache.return_value.fetch.assert_called_once_with(git_handler.TEMPLATE_REPO_ZIP_URL)
+        self.assertTrue(result.endswith("model_train_infer-main"))
+        self.log_result(test_name, inputs, "Extracted folder path", result)
 
     @patch("cli.handlers.git_handler.Github")
     def test_create_dev_branch(self, mock_github):
@@ -95,6 +98,124 @@ class TestGitHandler(unittest.TestCase):
             self.log_result(test_name, inputs, "Dev branch created", str(e), passed=False)
             self.fail(f"Failed to create branch: {e}")
 
+    @patch("cli.handlers.git_handler.get_session")
+    def test_push_files_to_repo_bulk(self, mock_session):
+        test_name = "Push Files to Repo (Bulk)"
+        mock_repo = MagicMock()
+        mock_repo.get_git_tree.return_value.tree = [MagicMock(path="README.md")]
+        mock_session.return_value.post.return_value = MagicMock(status_code=201, json=lambda: {"sha": "blob_sha"})
+
+        with tempfile.TemporaryDirectory() as local_folder:
+            os.makedirs(os.path.join(local_folder, "notebooks"))
+            with open(os.path.join(local_folder, "README.md"), "w") as f:
+                f.write("template readme")
+            with open(os.path.join(local_folder, "notebooks", "train.py"), "w") as f:
+                f.write("print('train')")
+            with open(os.path.join(local_folder, "model.bin"), "wb") as f:
+                f.write(b"\xff\xfe\x00")
+
+            git_handler.push_files_to_repo_bulk(mock_repo, git_handler.iter_template_files(local_folder))
+
+        elements = mock_repo.create_git_tree.call_args[0][0]
+        paths = sorted(element._identity["path"] for element in elements)
+        self.assertEqual(paths, ["model.bin", "notebooks/train.py"])
+        self.assertEqual(mock_session.return_value.post.call_count, 1)
+        mock_repo.create_git_commit.assert_called_once()
+        mock_repo.get_git_ref.return_value.edit.assert_called_once_with(mock_repo.create_git_commit.return_value.sha)
+        mock_repo.create_file.assert_not_called()
+        self.log_result(test_name, (), "Single commit with 2 files", paths)
+
+    def test_push_template_via_git(self):
+        test_name = "Push Template via Git"
+        mock_repo = MagicMock(full_name="user/myrepo123")
+
+        with tempfile.TemporaryDirectory() as local_folder, tempfile.TemporaryDirectory() as remote_dir:
+            os.makedirs(os.path.join(local_folder, "mlops_config"))
+            with open(os.path.join(local_folder, "mlops_config", "mlops_config_dev.json"), "w") as f:
+                f.write("{}")
+            with open(os.path.join(local_folder, "README.md"), "w") as f:
+                f.write("template readme")
+            remote = git.Repo.init(remote_dir, bare=True)
+
+            git_handler.push_template_via_git(mock_repo, git_handler.iter_template_files(local_folder), remote_url=remote_dir)
+
+            self.assertEqual(sorted(head.name for head in remote.heads), ["dev", "main"])
+            self.assertEqual(remote.heads.main.commit, remote.heads.dev.commit)
+            paths = sorted(blob.path for blob in remote.heads.main.commit.tree.traverse() if blob.type == "blob")
+            self.assertEqual(paths, ["README.md", "mlops_config/mlops_config_dev.json"])
+            self.log_result(test_name, (), "main and dev pushed with template files", paths)
+
+    @patch("cli.handlers.git_handler.get_session")
+    def test_stream_template_files(self, mock_session):
+        mock_get = mock_session.return_value.get
+        test_name = "Stream Template Files"
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode="w:gz") as tar:
+            for name, content, mode in [("template-main/README.md", b"readme", 0o644), ("template-main/run.sh", b"#!/bin/sh", 0o755)]:
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                info.mode = mode
+                tar.addfile(info, io.BytesIO(content))
+        archive.seek(0)
+        mock_get.return_value.raw = archive
+        mock_get.return_value.__enter__.return_value = mock_get.return_value
+
+        result = list(git_handler.stream_template_files())
+        self.assertEqual(result, [("README.md", b"readme", "100644"), ("run.sh", b"#!/bin/sh", "100755")])
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        self.log_result(test_name, (), "Files yielded from tarball stream", result)
+
+    def test_with_job_ids_in_config(self):
+        test_name = "Job IDs in Initial Commit"
+        files = [
+            ("README.md", b"readme", "100644"),
+            (git_handler.CONFIG_FILE_PATH, b'{"model_name": "demo"}', "100644")
+        ]
+
+        result = dict((path, content) for path, content, _ in git_handler.with_job_ids_in_config(iter(files), VALID_REPO_NAME, 11, 22))
+
+        config = json.loads(result[git_handler.CONFIG_FILE_PATH])
+        self.assertEqual(config, {"model_name": "demo", "train_job_id": 11, "infer_job_id": 22, "repo_name": VALID_REPO_NAME})
+        self.assertEqual(result["README.md"], b"readme")
+        with self.assertRaises(Exception):
+            list(git_handler.with_job_ids_in_config(iter(files[:1]), VALID_REPO_NAME, 11, 22))
+        self.log_result(test_name, (VALID_REPO_NAME, 11, 22), "Config rewritten in-stream", config)
+
+    @patch("cli.handlers.git_handler.get_github_user")
+    def test_expected_clone_url_follows_github_host(self, mock_user):
+        test_name = "Expected Clone URL Host"
+        mock_user.return_value = MagicMock(login="octocat", html_url="https://ghe.example.com/octocat")
+        from_profile = git_handler.expected_clone_url(VALID_REPO_NAME)
+
+        mock_user.return_value.html_url = None
+        with patch("cli.handlers.git_handler.GITHUB_API_URL", "https://ghe.example.com/api/v3"):
+            from_api_url = git_handler.expected_clone_url(VALID_REPO_NAME)
+        with patch("cli.handlers.git_handler.GITHUB_API_URL", "https://api.github.com"):
+            github_com = git_handler.expected_clone_url(VALID_REPO_NAME)
+
+        self.assertEqual(from_profile, f"https://ghe.example.com/octocat/{VALID_REPO_NAME}.git")
+        self.assertEqual(from_api_url, f"https://ghe.example.com/octocat/{VALID_REPO_NAME}.git")
+        self.assertEqual(github_com, f"https://github.com/octocat/{VALID_REPO_NAME}.git")
+        self.log_result(test_name, VALID_REPO_NAME, "Clone URL on the user's GitHub host", [from_profile, from_api_url, github_com])
+
+    @patch("cli.handlers.git_handler.get_session")
+    def test_add_github_repo_secrets(self, mock_session):
+        test_name = "Add Repo Secrets Concurrently"
+        public_key = public.PrivateKey.generate().public_key.encode(encoding.Base64Encoder()).decode("utf-8")
+        mock_session.return_value.get.return_value = MagicMock(status_code=200, json=lambda: {"key_id": "kid", "key": public_key})
+        mock_session.return_value.put.return_value = MagicMock(status_code=201)
+        mock_repo = MagicMock(url="https://api.github.com/repos/user/demo")
+        secrets = {"DATABRICKS_HOST": "https://example", "DATABRICKS_TOKEN": "token", "GH_TOKEN": "gh"}
+
+        git_handler.add_github_repo_secrets(VALID_REPO_NAME, secrets, repo=mock_repo)
+        git_handler.add_github_repo_secrets(VALID_REPO_NAME, secrets, repo=mock_repo)
+
+        put_urls = sorted(call.args[0] for call in mock_session.return_value.put.call_args_list)
+        self.assertEqual(mock_session.return_value.get.call_count, 1)
+        self.assertEqual(len(put_urls), 6)
+        self.assertEqual(put_urls[0], f"{mock_repo.url}/actions/secrets/DATABRICKS_HOST")
+        self.log_result(test_name, list(secrets), "One key lookup, one PUT per secret", put_urls)
+
 if __name__ == "__main__":
     print(f"📜 Running git_handler tests... Logs will be saved to {log_file_path}")
     unittest.main()
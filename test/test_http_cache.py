@@ -0,0 +1,132 @@
+import os
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from cli.http_cache import HttpCache
+from cli.http_client import SharedSession
+from cli.rate_limiter import RateLimiter
+import logging
+
+log_file_path = "test/test_http_cache_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Serves a JSON body with an ETag derived from the current version."""
+    version = 1
+    calls = []
+
+    def do_GET(self):
+        etag = f'"v{self.version}"'
+        self.calls.append((self.path, self.headers.get("If-None-Match"), self.headers.get("Authorization")))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        payload = json.dumps({"path": self.path, "version": self.version}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpCache(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self):
+        ETagHandler.version = 1
+        ETagHandler.calls.clear()
+        self.cache_dir = tempfile.mkdtemp()
+        limiter = RateLimiter()
+        limiter.register_host("127.0.0.1", "github")
+        patcher = patch("cli.http_client.get_rate_limiter", return_value=limiter)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_revalidates_and_replays_on_304(self):
+        test_name = "Conditional GET Replay"
+        session = SharedSession(cache=HttpCache(self.cache_dir))
+        url = f"{self.base_url}/repos/user/demo"
+        headers = {"Authorization": "Bearer token-a"}
+
+        first = session.get(url, headers=headers, params={"ref": "dev"})
+        second = session.get(url, headers=headers, params={"ref": "dev"})
+        ETagHandler.version = 2
+        third = session.get(url, headers=headers, params={"ref": "dev"})
+
+        self.assertEqual(first.json(), second.json())
+        self.assertTrue(getattr(second, "from_cache", False))
+        self.assertEqual(third.json()["version"], 2)
+        self.assertEqual([call[1] for call in ETagHandler.calls], [None, '"v1"', '"v1"'])
+        self.assertEqual(session.cache.stats(), {"hits": 1, "misses": 2})
+        self.log_result(test_name, (url,), "Second request answered from cache", ETagHandler.calls)
+
+    def test_auth_scope_is_part_of_the_key(self):
+        test_name = "Cache Keyed By Auth Scope"
+        session = SharedSession(cache=HttpCache(self.cache_dir))
+        url = f"{self.base_url}/repos/user/demo"
+
+        session.get(url, headers={"Authorization": "Bearer token-a"})
+        session.get(url, headers={"Authorization": "Bearer token-b"})
+
+        self.assertEqual([call[1] for call in ETagHandler.calls], [None, None])
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                with open(os.path.join(root, name), "rb") as f:
+                    self.assertNotIn(b"token-a", f.read())
+        self.log_result(test_name, (url,), "No sharing across tokens", ETagHandler.calls)
+
+    def test_evicts_least_recently_used(self):
+        test_name = "Cache LRU Eviction"
+        cache = HttpCache(self.cache_dir, max_bytes=2000)
+        session = SharedSession(cache=cache)
+
+        for i in range(10):
+            session.get(f"{self.base_url}/item/{i}")
+
+        total = sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(self.cache_dir) for name in files)
+        self.assertLessEqual(total, 2000)
+        # The newest entry survives
+        self.assertIsNotNone(cache.load(cache.key(f"{self.base_url}/item/9", {})))
+        self.log_result(test_name, (2000,), "Cache stays under its size bound", total)
+
+
+if __name__ == "__main__":
+    print(f"📜 Running http_cache tests... Logs saved to {log_file_path}")
+    unittest.main()
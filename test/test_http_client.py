@@ -0,0 +1,125 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from github import Github
+from cli import http_client
+import logging
+
+log_file_path = "test/test_http_client_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Replies with the next queued (status, body) for the request path."""
+    responses = {}
+    calls = []
+
+    def _reply(self):
+        self.calls.append((self.command, self.path))
+        queue = self.responses.get(self.path, [])
+        status, body = queue.pop(0) if len(queue) > 1 else queue[0]
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpClient(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubHandler.responses = {}
+        StubHandler.calls = []
+
+    def test_retry_policy_only_retries_post_when_rejected(self):
+        test_name = "Retry Policy Methods"
+        policy = http_client.build_retry_policy()
+        result = {
+            "GET 503": policy.is_retry("GET", 503),
+            "POST 500": policy.is_retry("POST", 500),
+            "POST 429": policy.is_retry("POST", 429),
+            "POST 403 + Retry-After": policy.is_retry("POST", 403, has_retry_after=True),
+            "GET 404": policy.is_retry("GET", 404)
+        }
+        self.assertEqual(result, {
+            "GET 503": True,
+            "POST 500": False,
+            "POST 429": True,
+            "POST 403 + Retry-After": True,
+            "GET 404": False
+        })
+        self.log_result(test_name, (), "POST retried on 429/403 only", result)
+
+    def test_session_retries_429_honouring_retry_after(self):
+        test_name = "Shared Session Retry"
+        StubHandler.responses["/api/2.1/jobs/create"] = [(429, {}), (200, {"job_id": 1})]
+
+        response = http_client.get_session().post(f"{self.base_url}/api/2.1/jobs/create", json={})
+
+        self.assertEqual(response.json(), {"job_id": 1})
+        self.assertEqual(len(StubHandler.calls), 2)
+        self.log_result(test_name, (), "Retried once then 200", StubHandler.calls)
+
+    def test_read_only_post_retried_on_gateway_errors(self):
+        test_name = "Read-Only POST Retry"
+        StubHandler.responses["/graphql"] = [(502, {}), (200, {"data": {}})]
+        StubHandler.responses["/api/2.1/jobs/create"] = [(502, {}), (200, {"job_id": 1})]
+
+        query = http_client.get_session().post(f"{self.base_url}/graphql", json={}, read_only=True)
+        mutation = http_client.get_session().post(f"{self.base_url}/api/2.1/jobs/create", json={})
+
+        self.assertEqual(query.status_code, 200)
+        self.assertEqual(mutation.status_code, 502)
+        self.assertEqual(StubHandler.calls, [("POST", "/graphql")] * 2 + [("POST", "/api/2.1/jobs/create")])
+        self.log_result(test_name, (), "Query retried, plain POST not", StubHandler.calls)
+
+    def test_github_client_uses_shared_session(self):
+        test_name = "PyGithub via Shared Session"
+        StubHandler.responses["/users/octocat"] = [(200, {"login": "octocat", "url": f"{self.base_url}/users/octocat"})]
+        http_client.route_github_through_session()
+
+        user = Github(base_url=self.base_url).get_user("octocat")
+
+        self.assertEqual(user.login, "octocat")
+        self.assertEqual(StubHandler.calls, [("GET", "/users/octocat")])
+        self.log_result(test_name, (), "Request served through the shared session", StubHandler.calls)
+
+
+if __name__ == "__main__":
+    print(f"📜 Running http_client tests... Logs saved to {log_file_path}")
+    unittest.main()
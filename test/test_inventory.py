@@ -0,0 +1,106 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+from cli.inventory import Inventory, GITHUB_REPOS, DATABRICKS_JOBS
+from cli.handlers import git_handler, databricks_handler
+import logging
+
+log_file_path = "test/test_inventory_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+
+def fake_response(status_code, payload=None, headers=None, links=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.headers = headers or {}
+    response.links = links or {}
+    return response
+
+
+class TestInventory(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.inventory = Inventory(os.path.join(self.tmp_dir, "inventory.sqlite3"))
+
+    def tearDown(self):
+        self.inventory.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    def test_refresh_only_when_stale(self):
+        test_name = "Refresh Only When Stale"
+        refresh = MagicMock(side_effect=lambda inv: inv.mark_synced(GITHUB_REPOS, full=True))
+
+        self.inventory.ensure_fresh(GITHUB_REPOS, refresh)
+        self.inventory.ensure_fresh(GITHUB_REPOS, refresh)
+        self.inventory.max_age = 0
+        self.inventory.ensure_fresh(GITHUB_REPOS, refresh)
+
+        self.assertEqual(refresh.call_count, 2)
+        self.assertFalse(self.inventory.needs_full_refresh(GITHUB_REPOS))
+        self.log_result(test_name, (GITHUB_REPOS,), "Refreshed on first use and after expiry", refresh.call_count)
+
+    def test_incremental_repo_refresh_uses_etag_and_since(self):
+        test_name = "Incremental Repo Refresh"
+        session = MagicMock()
+        session.get.side_effect = [
+            fake_response(200, [
+                {"name": "repo_a", "full_name": "user/repo_a", "updated_at": "2024-01-02T00:00:00Z"},
+                {"name": "repo_b", "full_name": "user/repo_b", "updated_at": "2024-01-01T00:00:00Z"}
+            ], headers={"ETag": '"v1"'}),
+            fake_response(304)
+        ]
+
+        with patch.object(git_handler, "get_session", return_value=session):
+            git_handler.refresh_repo_inventory(self.inventory)
+            git_handler.refresh_repo_inventory(self.inventory)
+
+        second_call = session.get.call_args_list[1]
+        self.assertEqual(second_call.kwargs["params"]["since"], "2024-01-02T00:00:00Z")
+        self.assertEqual(second_call.kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(self.inventory.repo_names(), ["repo_a", "repo_b"])
+        self.log_result(test_name, ("/user/repos",), "Second refresh is a conditional 304", second_call.kwargs)
+
+    def test_availability_and_write_through(self):
+        test_name = "Inventory Availability And Write-Through"
+        self.inventory.upsert_repos([{"name": "taken_repo"}])
+        self.inventory.mark_synced(GITHUB_REPOS, full=True)
+        self.inventory.replace_jobs([(1, "mlops_taken_repo_train_dev")])
+        self.inventory.mark_synced(DATABRICKS_JOBS, full=True)
+        session = MagicMock()
+        session.post.return_value = fake_response(200, {"job_id": 42})
+
+        with patch.object(git_handler, "get_inventory", return_value=self.inventory), \
+                patch.object(databricks_handler, "get_inventory", return_value=self.inventory), \
+                patch.object(databricks_handler, "get_session", return_value=session):
+            with self.assertRaises(Exception):
+                git_handler.validate_repo_availability("taken_repo")
+            git_handler.validate_repo_availability("new_repo")
+            self.assertTrue(databricks_handler.job_exists("mlops_taken_repo_train_dev"))
+            databricks_handler.create_job({"name": "mlops_new_repo_train_dev"})
+
+        self.assertEqual(self.inventory.job_ids("mlops_new_repo_train_dev"), [42])
+        session.get.assert_not_called()
+        self.log_result(test_name, ("taken_repo", "new_repo"), "Answered locally, new job recorded", self.inventory.job_ids("mlops_new_repo_train_dev"))
+
+
+if __name__ == "__main__":
+    print(f"📜 Running inventory tests... Logs saved to {log_file_path}")
+    unittest.main()
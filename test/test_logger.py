@@ -0,0 +1,115 @@
+import os
+import json
+import shutil
+import logging
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+from cli import logger as cli_logger
+from cli.logger import setup_logger, log_context, stop_logging
+from cli.tracing import bind
+from cli.handlers import git_handler
+
+log_file_path = "test/test_logger_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+
+class TestLogger(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+
+    def queue_logger(self, name, **settings):
+        options = {"LOG_DIR": self.log_dir, "LOG_MODE": "queue", "LOG_FORMAT": "json", "LOG_MAX_BYTES": 0}
+        options.update(settings)
+        with patch.multiple(cli_logger, **options):
+            test_logger = setup_logger(name)
+        self.addCleanup(lambda: [test_logger.removeHandler(handler) for handler in list(test_logger.handlers)])
+        return test_logger
+
+    def read_entries(self, filename="cli.log"):
+        with open(os.path.join(self.log_dir, filename), "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_queue_mode_writes_json_lines_with_context(self):
+        test_name = "Queue Mode JSON Lines"
+        test_logger = self.queue_logger("test_queue_json")
+        self.assertIsInstance(test_logger.handlers[0], logging.handlers.QueueHandler)
+
+        with log_context(repo="demo_repo", correlation_id="abc123"):
+            test_logger.info("✅ Provisioning started")
+            with log_context(step="create_repo"), ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(bind(lambda: test_logger.info("✅ Created in a worker"))).result()
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                test_logger.error("❌ Step failed", exc_info=True)
+        test_logger.info("Outside any repo")
+        stop_logging()
+
+        entries = self.read_entries()
+        self.assertEqual([entry["message"] for entry in entries],
+                         ["✅ Provisioning started", "✅ Created in a worker", "❌ Step failed", "Outside any repo"])
+        self.assertEqual(entries[0]["repo"], "demo_repo")
+        self.assertEqual(entries[0]["correlation_id"], "abc123")
+        self.assertNotIn("step", entries[0])
+        self.assertEqual(entries[1]["step"], "create_repo")
+        self.assertEqual(entries[1]["repo"], "demo_repo")
+        self.assertIn("ValueError: boom", entries[2]["exception"])
+        self.assertNotIn("repo", entries[3])
+        self.log_result(test_name, "4 records", "JSON lines with repo/step/correlation_id", entries)
+
+    def test_size_based_rotation(self):
+        test_name = "Size Based Rotation"
+        test_logger = self.queue_logger("test_queue_rotation", LOG_MAX_BYTES=500, LOG_BACKUP_COUNT=2)
+        for index in range(50):
+            test_logger.info(f"Line {index} " + "x" * 40)
+        stop_logging()
+
+        files = sorted(os.listdir(self.log_dir))
+        self.assertEqual(files, ["cli.log", "cli.log.1", "cli.log.2"])
+        self.assertTrue(all(os.path.getsize(os.path.join(self.log_dir, name)) <= 500 for name in files))
+        self.assertEqual(self.read_entries()[-1]["message"], "Line 49 " + "x" * 40)
+        self.log_result(test_name, "50 lines, 500 bytes", "cli.log plus 2 backups", files)
+
+    @patch("cli.handlers.git_handler.get_github_user")
+    def test_config_payload_only_logged_at_debug(self, mock_user):
+        test_name = "Config Payload Only At Debug"
+        contents = MagicMock(sha="abc", decoded_content=json.dumps({"train_job_id": 0}).encode("utf-8"))
+        mock_user.return_value.get_repo.return_value.get_contents.return_value = contents
+
+        # assertLogs sets the logger to the captured level
+        with self.assertLogs("cli_logger", level="INFO") as captured:
+            git_handler.update_config_json("demo_repo", 1, 2)
+        info_logs = [line for line in captured.output if "Contents of the file" in line]
+
+        with self.assertLogs("cli_logger", level="DEBUG") as captured_debug:
+            git_handler.update_config_json("demo_repo", 1, 2)
+        debug_logs = [line for line in captured_debug.output if "Contents of the file" in line]
+
+        self.assertEqual(info_logs, [])
+        self.assertEqual(len(debug_logs), 1)
+        self.assertTrue(debug_logs[0].startswith("DEBUG"))
+        self.log_result(test_name, "update_config_json", "payload only at DEBUG", debug_logs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from bench.stub_server import StubConfig
+from bench.github_stub import GitHubStub, build_template
+from cli.metrics import get_metrics, endpoint_template, host_of
+from cli.http_client import SharedSession, build_adapter
+from cli.pipeline import Pipeline, Step
+import logging
+
+log_file_path = "test/test_metrics_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+
+class TestMetrics(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    def setUp(self):
+        # Metrics are collected per run; start every test with an empty collector
+        get_metrics.cache_clear()
+        self.metrics = get_metrics()
+        self.work_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        get_metrics.cache_clear()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def session(self):
+        session = SharedSession(cache=None)
+        session.mount("http://", build_adapter())
+        return session
+
+    def test_endpoint_template(self):
+        test_name = "Endpoint Template"
+        cases = {
+            "https://api.github.com/repos/alice/my_repo/contents/config/config.json?ref=dev": "/repos/{owner}/{repo}/contents/{path}",
+            "https://api.github.com/repos/alice/my_repo/git/ref/heads/main": "/repos/{owner}/{repo}/git/ref/{ref}",
+            "https://api.github.com/repos/alice/my_repo/git/commits/" + "a" * 40: "/repos/{owner}/{repo}/git/commits/{sha}",
+            "https://api.github.com/repos/alice/my_repo/actions/secrets/DATABRICKS_TOKEN": "/repos/{owner}/{repo}/actions/secrets/{name}",
+            "https://api.github.com/repos/alice/my_repo/actions/secrets/public-key": "/repos/{owner}/{repo}/actions/secrets/public-key",
+            "https://adb-1.azuredatabricks.net/api/2.1/jobs/get?job_id=42": "/api/2.1/jobs/get",
+            "https://adb-1.azuredatabricks.net/api/2.0/repos/17": "/api/2.0/repos/{id}"
+        }
+        for url, expected in cases.items():
+            self.assertEqual(endpoint_template(url), expected)
+        self.assertEqual(host_of("https://api.github.com:443/user"), "api.github.com")
+        self.assertEqual(host_of("http://127.0.0.1:8080/user"), "127.0.0.1:8080")
+        self.log_result(test_name, list(cases), "Placeholders for names, SHAs and IDs", "OK")
+
+    def test_session_records_calls(self):
+        test_name = "Session Records Calls"
+        with GitHubStub() as github:
+            github.set_template(build_template(file_count=5, file_bytes=256))
+            session = self.session()
+            session.get(f"{github.url}/user")
+            session.post(f"{github.url}/user/repos", json={"name": "metrics_repo"})
+            with session.get(f"{github.url}/archive/template.tar.gz", stream=True) as response:
+                downloaded = len(response.content)
+            archive_bytes = len(github.tarball)
+
+        summary = self.metrics.summary()
+        rows = {(row["method"], row["endpoint"]): row for row in summary["requests"]}
+        host = host_of(github.url)
+
+        self.assertEqual(rows[("GET", "/user")]["count"], 1)
+        self.assertEqual(rows[("GET", "/user")]["host"], host)
+        self.assertEqual(rows[("POST", "/user/repos")]["status"], "201")
+        self.assertGreater(rows[("POST", "/user/repos")]["bytes_sent"], 0)
+        # The streamed download is recorded once its body has been read
+        self.assertEqual(downloaded, archive_bytes)
+        self.assertEqual(rows[("GET", "/archive/template.tar.gz")]["bytes_received"], archive_bytes)
+        self.log_result(test_name, github.url, "3 calls with bytes", summary["requests"])
+
+    def test_retries_are_counted(self):
+        test_name = "Retries Are Counted"
+        with GitHubStub(StubConfig(rate_limit=1, rate_window=1)) as github:
+            session = self.session()
+            session.get(f"{github.url}/user")
+            response = session.get(f"{github.url}/user")
+
+        self.assertEqual(response.status_code, 200)
+        row = next(row for row in self.metrics.summary()["requests"] if row["endpoint"] == "/user")
+        self.assertEqual(row["count"], 2)
+        self.assertGreaterEqual(row["retries"], 1)
+        self.log_result(test_name, "rate_limit=1/s", ">= 1 retry", row)
+
+    def test_pipeline_step_spans(self):
+        test_name = "Pipeline Step Spans"
+
+        def fail(results):
+            raise ValueError("boom")
+
+        pipeline = Pipeline([Step("first", lambda results: 1), Step("second", fail, ["first"])], run_key="provision:demo")
+        with self.assertRaises(ValueError):
+            pipeline.run()
+
+        spans = {span["step"]: span for span in self.metrics.summary()["spans"]}
+        self.assertEqual(spans["first"]["status"], "ok")
+        self.assertEqual(spans["second"]["status"], "error")
+        self.assertEqual(spans["second"]["run"], "provision:demo")
+        self.log_result(test_name, "first ok, second raises", "ok/error spans", spans)
+
+    def test_exports(self):
+        test_name = "JSON And Prometheus Exports"
+        self.metrics.record_step("provision:demo", "create_repo", 0.5)
+        self.metrics.record_request("POST", "https://api.github.com/user/repos", 201, 0.25, bytes_sent=40, bytes_received=900)
+        json_path = os.path.join(self.work_dir, "metrics.json")
+        prom_path = os.path.join(self.work_dir, "textfile", "cli_gh.prom")
+
+        self.metrics.export(json_path, prom_path, command="provision")
+
+        with open(json_path, "r", encoding="utf-8") as f:
+            exported = json.load(f)
+        with open(prom_path, "r", encoding="utf-8") as f:
+            text = f.read()
+        self.assertEqual(exported["requests"][0]["bytes_received"], 900)
+        self.assertEqual(exported["steps"][0]["step"], "create_repo")
+        self.assertIn('cli_gh_step_duration_seconds_sum{step="create_repo"} 0.5', text)
+        self.assertIn('cli_gh_http_requests_total{method="POST",host="api.github.com",endpoint="/user/repos",status="201"} 1', text)
+        self.assertIn("# TYPE cli_gh_http_retries_total counter", text)
+        self.assertEqual(os.listdir(os.path.dirname(prom_path)), ["cli_gh.prom"])
+        self.log_result(test_name, json_path, "JSON and textfile written", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,279 @@
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+from cli.pipeline import Pipeline, Step
+from cli.journal import Journal
+from cli import main as cli_main
+from test.test_data import VALID_REPO_NAME, VALID_TRAIN_ACC, VALID_INFER_ACC
+import logging
+
+log_file_path = "test/test_pipeline_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+
+class TestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.journal_path = os.path.join(self.tmp_dir, "journal.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    def test_independent_steps_overlap(self):
+        test_name = "Independent Steps Overlap"
+
+        def slow(value):
+            def run(results):
+                time.sleep(0.2)
+                return value
+            return run
+
+        pipeline = Pipeline([
+            Step("a", slow(1)),
+            Step("b", slow(2)),
+            Step("sum", lambda results: results["a"] + results["b"], ["a", "b"])
+        ])
+        results = pipeline.run()
+
+        self.assertEqual(results["sum"], 3)
+        self.assertLess(pipeline.wall_clock, 0.35)
+        self.assertEqual(set(pipeline.timings), {"a", "b", "sum"})
+        self.log_result(test_name, (), "a and b run concurrently", pipeline.format_timings())
+
+    def test_failure_skips_dependents(self):
+        test_name = "Failure Skips Dependents"
+        dependent = MagicMock()
+
+        def fail(results):
+            raise ValueError("boom")
+
+        pipeline = Pipeline([Step("fail", fail), Step("after", dependent, ["fail"])])
+        with self.assertRaises(ValueError):
+            pipeline.run()
+
+        dependent.assert_not_called()
+        self.log_result(test_name, (), "ValueError and dependent not run", "ValueError")
+
+    def test_rejects_unknown_dependency(self):
+        with self.assertRaises(ValueError):
+            Pipeline([Step("a", lambda results: None, ["missing"])])
+
+    def test_resume_restores_done_steps(self):
+        test_name = "Resume Restores Done Steps"
+        journal = Journal(self.journal_path)
+        expensive = MagicMock(return_value="uploaded")
+        flaky = MagicMock(side_effect=[Exception("500 Internal Server Error"), 42])
+
+        def build(resume):
+            return Pipeline([
+                Step("fetch", lambda results: "files", ephemeral=True),
+                Step("upload", expensive, ["fetch"]),
+                Step("create_job", flaky, ["upload"])
+            ], journal=journal, run_key="provision:demo", resume=resume)
+
+        with self.assertRaises(Exception):
+            build(resume=False).run()
+        pipeline = build(resume=True)
+        results = pipeline.run()
+
+        self.assertEqual(results, {"upload": "uploaded", "create_job": 42})
+        self.assertEqual(expensive.call_count, 1)
+        self.assertEqual(pipeline.resumed, ["upload"])
+        self.assertTrue(Journal(self.journal_path).is_done("provision:demo:create_job"))
+        self.log_result(test_name, (), "Only the failed step reruns", results)
+
+    def test_resume_recovers_interrupted_step(self):
+        test_name = "Resume Recovers Interrupted Step"
+        journal = Journal(self.journal_path)
+        journal.append("provision:demo:create_job", "started")
+        create = MagicMock(return_value=1)
+
+        results = Pipeline([
+            Step("create_job", create, recover=lambda results: 7)
+        ], journal=journal, run_key="provision:demo", resume=True).run()
+
+        self.assertEqual(results["create_job"], 7)
+        create.assert_not_called()
+        self.log_result(test_name, (), "Existing job reused", results)
+
+    @patch.multiple(
+        "cli.main",
+        validate_repo_availability=MagicMock(),
+        validate_databricks_job_availability=MagicMock(),
+        template_files=MagicMock(return_value=iter([])),
+        create_repo_for_upload=MagicMock(),
+        push_template=MagicMock(),
+        add_github_repo_secrets=MagicMock(),
+        repo_secrets_from_env=MagicMock(return_value={}),
+        import_repo_to_databricks=MagicMock(),
+        create_job=MagicMock(side_effect=lambda job_json: 1 if "_train_" in job_json["name"] else 2),
+        create_dev_branch=MagicMock(),
+        update_config_json=MagicMock()
+    )
+    def test_provision_repo_pipeline(self):
+        test_name = "Provision Repo Pipeline"
+        inputs = (VALID_REPO_NAME, VALID_TRAIN_ACC, VALID_INFER_ACC)
+        cli_main.create_repo_for_upload.return_value.clone_url = "https://github.com/user/myrepo123.git"
+
+        outputs = cli_main.provision_repo(*inputs, journal_path=self.journal_path)
+
+        self.assertEqual(outputs, {"git_url": "https://github.com/user/myrepo123.git", "train_job_id": 1, "infer_job_id": 2})
+        cli_main.create_dev_branch.assert_called_once_with(VALID_REPO_NAME)
+        cli_main.update_config_json.assert_called_once_with(VALID_REPO_NAME, 1, 2)
+        cli_main.import_repo_to_databricks.assert_called_once_with("https://github.com/user/myrepo123.git", VALID_REPO_NAME)
+        self.log_result(test_name, inputs, "Job IDs returned", outputs)
+
+    @patch.multiple(
+        "cli.main",
+        validate_repo_availability=MagicMock(),
+        validate_databricks_job_availability=MagicMock(),
+        template_files=MagicMock(return_value=iter([])),
+        create_repo_for_upload=MagicMock(),
+        expected_clone_url=MagicMock(return_value="https://github.com/user/myrepo123.git"),
+        with_job_ids_in_config=MagicMock(),
+        push_template=MagicMock(),
+        add_github_repo_secrets=MagicMock(),
+        repo_secrets_from_env=MagicMock(return_value={}),
+        import_repo_to_databricks=MagicMock(),
+        create_job=MagicMock(side_effect=lambda job_json: 1 if "_train_" in job_json["name"] else 2),
+        create_dev_branch=MagicMock(),
+        update_config_json=MagicMock()
+    )
+    def test_provision_repo_inline_config(self):
+        test_name = "Provision Repo Inline Config"
+        inputs = (VALID_REPO_NAME, VALID_TRAIN_ACC, VALID_INFER_ACC)
+
+        outputs = cli_main.provision_repo(*inputs, inline_config=True, journal_path=self.journal_path)
+
+        self.assertEqual((outputs["train_job_id"], outputs["infer_job_id"]), (1, 2))
+        cli_main.with_job_ids_in_config.assert_called_once_with(cli_main.template_files.return_value, VALID_REPO_NAME, 1, 2)
+        cli_main.push_template.assert_called_once_with(
+            cli_main.create_repo_for_upload.return_value, cli_main.with_job_ids_in_config.return_value, "bulk"
+        )
+        cli_main.update_config_json.assert_not_called()
+        self.log_result(test_name, inputs, "No follow-up config commit", outputs)
+
+
+    @patch.multiple(
+        "cli.main",
+        validate_repo_availability=MagicMock(),
+        validate_databricks_job_availability=MagicMock(),
+        template_files=MagicMock(return_value=iter([])),
+        create_repo_for_upload=MagicMock(),
+        get_existing_repo=MagicMock(),
+        push_template=MagicMock(),
+        add_github_repo_secrets=MagicMock(),
+        repo_secrets_from_env=MagicMock(return_value={}),
+        import_repo_to_databricks=MagicMock(return_value=5),
+        find_jobs_by_name=MagicMock(return_value=[]),
+        create_job=MagicMock(),
+        create_dev_branch=MagicMock(),
+        update_config_json=MagicMock()
+    )
+    def test_provision_repo_resume(self):
+        test_name = "Provision Repo Resume"
+        inputs = (VALID_REPO_NAME, VALID_TRAIN_ACC, VALID_INFER_ACC)
+        failures = [Exception("Databricks Job Creation Failed: 500")]
+
+        def create_job(job_json):
+            if "_train_" in job_json["name"]:
+                if failures:
+                    raise failures.pop()
+                return 1
+            return 2
+
+        cli_main.create_job.side_effect = create_job
+
+        with self.assertRaises(Exception):
+            cli_main.provision_repo(*inputs, journal_path=self.journal_path)
+        cli_main.get_journal.cache_clear()
+        outputs = cli_main.provision_repo(*inputs, resume=True, journal_path=self.journal_path)
+
+        self.assertEqual(cli_main.validate_repo_availability.call_count, 1)
+        cli_main.create_repo_for_upload.assert_called_once()
+        cli_main.push_template.assert_called_once()
+        self.assertEqual(cli_main.create_job.call_count, 3)
+        self.assertEqual((outputs["train_job_id"], outputs["infer_job_id"]), (1, 2))
+        self.assertEqual(outputs["git_url"], cli_main.get_existing_repo.return_value.clone_url)
+        self.log_result(test_name, inputs, "Repo and template reused after a job failure", outputs)
+
+    @patch.multiple(
+        "cli.main",
+        validate_repo_availability=MagicMock(),
+        validate_databricks_job_availability=MagicMock(),
+        template_files=MagicMock(return_value=iter([])),
+        create_repo_for_upload=MagicMock(),
+        get_existing_repo=MagicMock(),
+        push_template=MagicMock(),
+        add_github_repo_secrets=MagicMock(),
+        repo_secrets_from_env=MagicMock(return_value={}),
+        import_repo_to_databricks=MagicMock(return_value=5),
+        create_job=MagicMock(side_effect=lambda job_json: 1 if "_train_" in job_json["name"] else 2),
+        create_dev_branch=MagicMock(),
+        update_config_json=MagicMock(side_effect=[Exception("Connection reset"), None]),
+        config_has_job_ids=MagicMock(return_value=True)
+    )
+    def test_provision_repo_resume_skips_landed_config_commit(self):
+        test_name = "Provision Repo Resume Config Commit"
+        inputs = (VALID_REPO_NAME, VALID_TRAIN_ACC, VALID_INFER_ACC)
+
+        with self.assertRaises(Exception):
+            cli_main.provision_repo(*inputs, journal_path=self.journal_path)
+        cli_main.get_journal.cache_clear()
+        outputs = cli_main.provision_repo(*inputs, resume=True, journal_path=self.journal_path)
+
+        # The commit landed before the connection dropped, so resuming doesn't make a second one
+        cli_main.config_has_job_ids.assert_called_once_with(VALID_REPO_NAME, 1, 2)
+        cli_main.update_config_json.assert_called_once()
+        self.assertEqual((outputs["train_job_id"], outputs["infer_job_id"]), (1, 2))
+        self.log_result(test_name, inputs, "No second config commit", outputs)
+    @patch.multiple(
+        "cli.main",
+        validate_repo_availability=MagicMock(),
+        validate_databricks_job_availability=MagicMock(),
+        template_files=MagicMock(return_value=iter([])),
+        create_repo_for_upload=MagicMock(),
+        push_template=MagicMock(),
+        add_github_repo_secrets=MagicMock(),
+        repo_secrets_from_env=MagicMock(return_value={}),
+        import_repo_to_databricks=MagicMock(),
+        create_job=MagicMock(side_effect=lambda job_json: 1 if "_train_" in job_json["name"] else 2),
+        create_dev_branch=MagicMock(),
+        update_config_json=MagicMock(),
+        trigger_jobs_and_wait=MagicMock()
+    )
+    def test_provision_repo_trigger_and_wait(self):
+        test_name = "Provision Repo Trigger And Wait"
+        inputs = (VALID_REPO_NAME, VALID_TRAIN_ACC, VALID_INFER_ACC)
+        run = {"job_id": 1, "run_id": 10, "life_cycle_state": "TERMINATED", "result_state": "SUCCESS", "run_page_url": None, "seconds_to_result": 42.0}
+        cli_main.trigger_jobs_and_wait.return_value = {"train": run, "infer": dict(run, job_id=2, result_state="FAILED")}
+
+        with self.assertRaises(Exception) as context:
+            cli_main.provision_repo(*inputs, journal_path=self.journal_path, trigger_and_wait=True)
+
+        self.assertIn("infer", str(context.exception))
+        self.assertEqual(cli_main.trigger_jobs_and_wait.call_args.args[0], {"train": 1, "infer": 2})
+        cli_main.update_config_json.assert_called_once()
+        self.log_result(test_name, inputs, "Failed first run fails provisioning", str(context.exception))
+
+if __name__ == "__main__":
+    print(f"📜 Running pipeline tests... Logs saved to {log_file_path}")
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+from unittest.mock import patch, MagicMock
+from e2e import pipeline_waiter
+import logging
+
+log_file_path = "test/test_pipeline_waiter_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 1))
+        self.now += seconds
+
+
+def runs_response(status, conclusion=None, etag='"a"'):
+    payload = {"workflow_runs": [{"id": 1, "status": status, "conclusion": conclusion, "html_url": "https://run"}]}
+    return MagicMock(status_code=200, headers={"ETag": etag}, json=lambda: payload)
+
+
+class TestPipelineWaiter(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    def test_run_filters(self):
+        params = pipeline_waiter.run_filters(branch="dev", event="push")
+        self.assertEqual(params, {"per_page": 1, "branch": "dev", "event": "push"})
+
+    @patch("e2e.pipeline_waiter.repo_api_url", side_effect=lambda name: f"https://api.github.com/repos/user/{name}")
+    @patch("e2e.pipeline_waiter.get_session")
+    def test_waits_on_many_repos_with_conditional_polls(self, mock_session, mock_repo_url):
+        test_name = "Wait On Many Repos"
+        clock = FakeClock()
+        not_modified = MagicMock(status_code=304, headers={})
+        responses = {
+            "fast": [runs_response("in_progress"), runs_response("completed", "success", '"b"')],
+            "slow": [runs_response("in_progress")] + [not_modified] * 3 + [runs_response("completed", "failure", '"c"')]
+        }
+        sent_etags = []
+
+        def fake_get(url, headers=None, params=None):
+            repo_name = url.split("/")[-3]
+            sent_etags.append((repo_name, headers.get("If-None-Match")))
+            queue = responses[repo_name]
+            return queue.pop(0) if len(queue) > 1 else queue[0]
+
+        mock_session.return_value.get.side_effect = fake_get
+
+        results = pipeline_waiter.wait_for_runs(
+            ["fast", "slow"], timeout_seconds=600, branch="dev", expected_seconds=20,
+            sleep=clock.sleep, clock=clock
+        )
+
+        self.assertEqual(results["fast"]["conclusion"], "success")
+        self.assertEqual(results["slow"]["conclusion"], "failure")
+        self.assertEqual(results["slow"]["not_modified"], 3)
+        self.assertIn(("slow", '"a"'), sent_etags)
+        params = mock_session.return_value.get.call_args.kwargs["params"]
+        self.assertEqual((params["per_page"], params["branch"]), (1, "dev"))
+        self.assertTrue(params["created"].startswith(">="))
+        # Both repos finished well before the old fixed 60s cadence would have noticed
+        self.assertLess(clock.now, 120)
+        self.log_result(test_name, ["fast", "slow"], "Both complete with adaptive polling", (results, clock.sleeps))
+
+    @patch("e2e.pipeline_waiter.repo_api_url", return_value="https://api.github.com/repos/user/demo")
+    @patch("e2e.pipeline_waiter.get_session")
+    def test_times_out(self, mock_session, mock_repo_url):
+        test_name = "Wait Timeout"
+        clock = FakeClock()
+        mock_session.return_value.get.return_value = runs_response("queued")
+
+        results = pipeline_waiter.wait_for_runs(["demo"], timeout_seconds=60, expected_seconds=30, sleep=clock.sleep, clock=clock)
+
+        self.assertEqual(results["demo"]["status"], "timeout")
+        self.assertLessEqual(clock.now, 60)
+        self.log_result(test_name, ("demo", 60), "timeout", results["demo"])
+
+    @patch("e2e.pipeline_waiter.repo_api_url", return_value="https://api.github.com/repos/user/demo")
+    @patch("e2e.pipeline_waiter.get_session")
+    def test_falls_back_to_older_run(self, mock_session, mock_repo_url):
+        test_name = "Wait Falls Back To Older Run"
+        clock = FakeClock()
+        empty = MagicMock(status_code=200, headers={"ETag": '"empty"'}, json=lambda: {"workflow_runs": []})
+        sent_params = []
+
+        def fake_get(url, headers=None, params=None):
+            sent_params.append(dict(params))
+            return empty if "created" in params else runs_response("completed", "success")
+
+        mock_session.return_value.get.side_effect = fake_get
+
+        results = pipeline_waiter.wait_for_runs(["demo"], timeout_seconds=600, expected_seconds=30, sleep=clock.sleep, clock=clock)
+
+        self.assertEqual(results["demo"]["conclusion"], "success")
+        self.assertEqual(clock.now, 0)
+        self.assertIn("created", sent_params[0])
+        self.assertNotIn("created", sent_params[1])
+        self.log_result(test_name, "no run in the window", "latest older run, no waiting", results["demo"])
+
+
+if __name__ == "__main__":
+    print(f"📜 Running pipeline waiter tests... Logs saved to {log_file_path}")
+    unittest.main()
@@ -0,0 +1,119 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from cli.rate_limiter import RateLimiter, TokenBucket
+import logging
+
+log_file_path = "test/test_rate_limiter_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+GITHUB_URL = "https://api.github.com:443/repos/user/myrepo123"
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    @patch("cli.rate_limiter.time.sleep")
+    def test_token_bucket_paces_after_burst(self, mock_sleep):
+        test_name = "Token Bucket Pacing"
+        bucket = TokenBucket(rate=2, capacity=2)
+
+        waits = [bucket.acquire() for _ in range(4)]
+
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertAlmostEqual(waits[2], 0.5, places=1)
+        self.assertAlmostEqual(waits[3], 1.0, places=1)
+        self.log_result(test_name, (2, 2), "Burst of 2 then 0.5s spacing", waits)
+
+    @patch("cli.rate_limiter.time.sleep")
+    def test_pauses_until_reset_when_quota_is_low(self, mock_sleep):
+        test_name = "Quota Reset Pause"
+        limiter = RateLimiter()
+        reset_at = time.time() + 30
+        limiter.observe(GITHUB_URL, 200, {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "3",
+            "X-RateLimit-Reset": str(reset_at)
+        })
+
+        waited = limiter.acquire(GITHUB_URL)
+
+        self.assertGreater(waited, 29)
+        self.assertEqual(limiter.budget()["github"]["limit"], 5000)
+        self.log_result(test_name, (GITHUB_URL,), "Wait until reset", waited)
+
+    @patch("cli.rate_limiter.time.sleep")
+    def test_concurrent_callers_all_wait_for_reset(self, mock_sleep):
+        test_name = "Concurrent Quota Reset Pause"
+        limiter = RateLimiter()
+        reset_at = time.time() + 2
+        limiter.observe(GITHUB_URL, 200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset_at)})
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            waits = list(executor.map(lambda _: limiter.acquire(GITHUB_URL), range(6)))
+
+        self.assertTrue(all(wait > 1.5 for wait in waits))
+        self.log_result(test_name, "6 threads, remaining=0", "All wait ~2s", waits)
+
+    @patch("cli.rate_limiter.time.sleep")
+    def test_graphql_quota_does_not_replace_core(self, mock_sleep):
+        test_name = "GraphQL Quota Ignored"
+        limiter = RateLimiter()
+        limiter.observe(GITHUB_URL, 200, {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4000", "X-RateLimit-Resource": "core"})
+        limiter.observe("https://api.github.com:443/graphql", 200, {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(time.time() + 30),
+            "X-RateLimit-Resource": "graphql"
+        })
+
+        waited = limiter.acquire(GITHUB_URL)
+
+        self.assertEqual(waited, 0.0)
+        self.assertEqual(limiter.budget()["github"]["remaining"], 3999)
+        self.log_result(test_name, "graphql remaining=0", "Core quota untouched", limiter.budget()["github"])
+
+    @patch("cli.rate_limiter.time.sleep")
+    def test_honours_databricks_429(self, mock_sleep):
+        test_name = "Databricks 429 Backoff"
+        limiter = RateLimiter()
+        limiter.register_host("adb-123.azuredatabricks.net", "databricks")
+        url = "https://adb-123.azuredatabricks.net/api/2.1/jobs/list"
+
+        limiter.observe(url, 429, {"Retry-After": "5"})
+        waited = limiter.acquire(url)
+
+        self.assertGreater(waited, 4)
+        self.assertEqual(limiter.acquire("https://example.com/other"), 0.0)
+        self.log_result(test_name, (url,), "Wait Retry-After seconds", waited)
+
+    @patch.dict("os.environ", {"GITHUB_API_URL": "http://127.0.0.1:8001", "DATABRICKS_HOST": "http://127.0.0.1:8002"})
+    def test_hosts_with_ports(self):
+        test_name = "Hosts With Ports"
+        limiter = RateLimiter()
+
+        services = [limiter.service_for_url(url) for url in (
+            "http://127.0.0.1:8001/user", "http://127.0.0.1:8002/api/2.1/jobs/list", "http://127.0.0.1:8003/"
+        )]
+
+        self.assertEqual(services, ["github", "databricks", None])
+        self.log_result(test_name, "127.0.0.1:8001/8002/8003", "github, databricks, None", services)
+
+
+if __name__ == "__main__":
+    print(f"📜 Running rate_limiter tests... Logs saved to {log_file_path}")
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from cli import rotation
+from cli.journal import Journal
+import logging
+
+log_file_path = "test/test_rotation_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+
+class TestRotation(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    def test_repos_from_job_names(self):
+        test_name = "Repos From Job Names"
+        job_names = ["mlops_team_alpha_train_dev", "mlops_team_alpha_infer_dev", "mlops_beta_infer_main", "other_job"]
+
+        result = rotation.repos_from_job_names(job_names)
+
+        self.assertEqual(result, {"team_alpha", "beta"})
+        self.log_result(test_name, job_names, {"team_alpha", "beta"}, result)
+
+    @patch("cli.rotation.build_job_name_index", return_value={"mlops_beta_train_dev"})
+    @patch("cli.rotation.repo_has_file", side_effect=lambda full_name, path: full_name != "user/plain")
+    @patch("cli.rotation.iter_user_repos", return_value=iter([
+        {"name": "alpha", "full_name": "user/alpha"},
+        {"name": "plain", "full_name": "user/plain"}
+    ]))
+    def test_discover_fleet_combines_sources(self, mock_repos, mock_has_file, mock_index):
+        test_name = "Discover Fleet"
+
+        result = rotation.discover_fleet("both", workers=2)
+
+        self.assertEqual(result, ["alpha", "beta"])
+        self.log_result(test_name, ("both",), ["alpha", "beta"], result)
+
+    @patch("cli.rotation.add_github_repo_secrets")
+    def test_rotation_resumes_from_journal(self, mock_add_secrets):
+        test_name = "Rotation Resumes From Journal"
+        def fail_beta(repo_name, secrets_dict):
+            if repo_name == "beta":
+                raise Exception("boom")
+
+        mock_add_secrets.side_effect = fail_beta
+        secrets = {"DATABRICKS_TOKEN": "new-token"}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            journal_path = os.path.join(tmp_dir, "journal.jsonl")
+            results, stats = rotation.rotate_fleet(["alpha", "beta"], secrets, journal_path=journal_path, workers=2)
+            self.assertEqual((stats["succeeded"], stats["failed"]), (1, 1))
+
+            mock_add_secrets.side_effect = None
+            mock_add_secrets.reset_mock()
+            results, stats = rotation.rotate_fleet(["alpha", "beta"], secrets, journal_path=journal_path, workers=2)
+            mock_add_secrets.assert_called_once_with("beta", secrets)
+            self.assertEqual((stats["skipped"], stats["succeeded"]), (1, 1))
+
+            # New secret values are a new rotation
+            _, stats = rotation.rotate_fleet(["alpha", "beta"], {"DATABRICKS_TOKEN": "newer"}, journal_path=journal_path, workers=2)
+            self.assertEqual(stats["skipped"], 0)
+            self.assertEqual(len(Journal(journal_path).records()), 4)
+
+        self.log_result(test_name, secrets, "Only the failed repo is retried", stats)
+
+
+if __name__ == "__main__":
+    print(f"📜 Running rotation tests... Logs saved to {log_file_path}")
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from unittest.mock import patch
+from cli import run_watcher
+import logging
+
+log_file_path = "test/test_run_watcher_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def run_state(run_id, life_cycle_state, result_state=None):
+    return {"run_id": run_id, "state": {"life_cycle_state": life_cycle_state, "result_state": result_state}, "run_page_url": f"https://run/{run_id}"}
+
+
+class TestRunWatcher(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    @patch("cli.run_watcher.iter_active_runs")
+    @patch("cli.run_watcher.get_run")
+    @patch("cli.run_watcher.run_job_now", side_effect=lambda job_id: job_id * 10)
+    def test_trigger_and_wait_with_backoff(self, mock_run_now, mock_get_run, mock_active):
+        test_name = "Trigger And Wait"
+        clock = FakeClock()
+        states = {
+            10: iter([run_state(10, "RUNNING")] * 4 + [run_state(10, "TERMINATED", "SUCCESS")]),
+            20: iter([run_state(20, "RUNNING"), run_state(20, "TERMINATED", "FAILED")])
+        }
+        mock_get_run.side_effect = lambda run_id: next(states[run_id])
+
+        runs = run_watcher.trigger_jobs_and_wait({"train": 1, "infer": 2}, timeout_seconds=600, sleep=clock.sleep, clock=clock)
+
+        self.assertEqual(runs["train"]["result_state"], "SUCCESS")
+        self.assertEqual(runs["infer"]["result_state"], "FAILED")
+        self.assertIsNotNone(runs["train"]["seconds_to_result"])
+        # Backs off while nothing changes
+        self.assertGreater(clock.sleeps[-1], clock.sleeps[1])
+        mock_active.assert_not_called()
+        self.log_result(test_name, {"train": 1, "infer": 2}, "SUCCESS / FAILED", run_watcher.format_run_report(runs))
+
+    @patch("cli.run_watcher.RUNS_LIST_THRESHOLD", 1)
+    @patch("cli.run_watcher.iter_active_runs")
+    @patch("cli.run_watcher.get_run", side_effect=lambda run_id: run_state(run_id, "TERMINATED", "SUCCESS"))
+    @patch("cli.run_watcher.run_job_now", side_effect=lambda job_id: job_id * 10)
+    def test_batches_with_runs_list(self, mock_run_now, mock_get_run, mock_active):
+        test_name = "Active Runs Batching"
+        clock = FakeClock()
+        mock_active.side_effect = [
+            iter([run_state(10, "RUNNING"), run_state(20, "RUNNING"), run_state(30, "RUNNING")]),
+            iter([run_state(30, "RUNNING")])
+        ]
+
+        runs = run_watcher.trigger_jobs_and_wait({"a": 1, "b": 2, "c": 3}, timeout_seconds=600, sleep=clock.sleep, clock=clock)
+
+        self.assertTrue(all(run["result_state"] == "SUCCESS" for run in runs.values()))
+        # Runs that left the active list are fetched individually; the last open run falls back to runs/get
+        self.assertEqual(mock_active.call_count, 2)
+        self.assertEqual(mock_get_run.call_count, 3)
+        self.log_result(test_name, ["a", "b", "c"], "2 runs/list + 3 runs/get", mock_get_run.call_count)
+
+
+if __name__ == "__main__":
+    print(f"📜 Running run_watcher tests... Logs saved to {log_file_path}")
+    unittest.main()
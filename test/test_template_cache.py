@@ -0,0 +1,94 @@
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch, MagicMock
+from cli.template_cache import TemplateCache
+import logging
+
+log_file_path = "test/test_template_cache_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+TEMPLATE_URL = "https://github.com/user/template/archive/refs/heads/main.zip"
+COMMIT_SHA = "a" * 40
+
+
+def make_zip(files, comment=b""):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_ref:
+        for path, content in files.items():
+            zip_ref.writestr(path, content)
+        zip_ref.comment = comment
+    return buffer.getvalue()
+
+
+def make_response(status_code, body=b"", etag=None):
+    response = MagicMock(status_code=status_code)
+    response.headers = {"ETag": etag} if etag else {}
+    response.iter_content.return_value = [body[i:i + 7] for i in range(0, len(body), 7)]
+    response.__enter__.return_value = response
+    return response
+
+
+class TestTemplateCache(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = TemplateCache(cache_dir=self.tmp_dir.name, max_bytes=1024 * 1024, fresh_seconds=0)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    @patch("cli.template_cache.get_session")
+    def test_revalidates_with_etag_and_reuses_tree(self, mock_session):
+        mock_get = mock_session.return_value.get
+        test_name = "Template Cache Reuse on 304"
+        archive = make_zip({"template-main/README.md": "hello"}, comment=COMMIT_SHA.encode())
+        mock_get.side_effect = [make_response(200, archive, etag='"v1"'), make_response(304)]
+
+        first = self.cache.fetch(TEMPLATE_URL)
+        second = self.cache.fetch(TEMPLATE_URL)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, os.path.join(self.tmp_dir.name, COMMIT_SHA, "template-main"))
+        self.assertEqual(mock_get.call_args_list[1].kwargs["headers"], {"If-None-Match": '"v1"'})
+        leftovers = [name for name in os.listdir(self.tmp_dir.name) if name.endswith(".zip") or name.startswith(".extract-")]
+        self.assertEqual(leftovers, [])
+        self.log_result(test_name, (TEMPLATE_URL,), "Same folder, conditional GET", second)
+
+    @patch("cli.template_cache.get_session")
+    def test_evicts_least_recently_used(self, mock_session):
+        mock_get = mock_session.return_value.get
+        test_name = "Template Cache Eviction"
+        self.cache.max_bytes = 10
+        mock_get.side_effect = [
+            make_response(200, make_zip({"old-main/a.txt": "x" * 8}), etag='"v1"'),
+            make_response(200, make_zip({"new-main/a.txt": "y" * 8}), etag='"v2"')
+        ]
+
+        old = self.cache.fetch(TEMPLATE_URL)
+        new = self.cache.fetch(TEMPLATE_URL)
+
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(new))
+        self.log_result(test_name, (TEMPLATE_URL,), "Old tree evicted", new)
+
+
+if __name__ == "__main__":
+    print(f"📜 Running template_cache tests... Logs saved to {log_file_path}")
+    unittest.main()
@@ -0,0 +1,128 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from bench import record_cassettes
+from cli import tracing
+from cli.cassette import Cassette
+from cli.http_client import use_cassette
+from cli.tracing import traced, span, bind, enable_tracing, get_tracer, SPAN_KIND_CLIENT
+import logging
+
+log_file_path = "test/test_tracing_output.log"
+logging.basicConfig(
+    filename=log_file_path,
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filemode="w"
+)
+logger = logging.getLogger(__name__)
+
+
+@traced
+def check_repo(repo_name, fail=False):
+    if fail:
+        raise ValueError(f"'{repo_name}' is broken")
+    return repo_name.upper()
+
+
+class TestTracing(unittest.TestCase):
+
+    def log_result(self, test_name, inputs, expected, result, passed=True):
+        status = "✅ PASSED" if passed else "❌ FAILED"
+        logger.info(f"--- {status}: {test_name} ---")
+        logger.info(f"📥 Inputs: {inputs}")
+        logger.info(f"🎯 Expected: {expected}")
+        logger.info(f"📤 Actual: {result}")
+        logger.info("")
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.trace_file = os.path.join(self.work_dir, "traces.jsonl")
+        enable_tracing(self.trace_file)
+
+    def tearDown(self):
+        enable_tracing(tracing.TRACE_FILE)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def exported_spans(self):
+        get_tracer().flush()
+        spans = []
+        with open(self.trace_file, "r", encoding="utf-8") as f:
+            for line in f:
+                for resource_spans in json.loads(line)["resourceSpans"]:
+                    for scope_spans in resource_spans["scopeSpans"]:
+                        spans += scope_spans["spans"]
+        return spans
+
+    def attributes(self, span):
+        return {attribute["key"]: list(attribute["value"].values())[0] for attribute in span["attributes"]}
+
+    def test_disabled_tracing_is_a_no_op(self):
+        enable_tracing(None)
+        with span("anything") as current:
+            result = check_repo("demo")
+
+        self.assertIsNone(current)
+        self.assertIsNone(get_tracer())
+        self.assertEqual(result, "DEMO")
+        self.assertFalse(os.path.exists(self.trace_file))
+
+    def test_spans_follow_work_into_threads(self):
+        test_name = "Spans Follow Work Into Threads"
+        with span("fleet"):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(bind(check_repo), ["a", "b"]))
+            with self.assertRaises(ValueError):
+                check_repo("c", fail=True)
+
+        spans = self.exported_spans()
+        root = next(span for span in spans if span["name"] == "fleet")
+        children = [span for span in spans if span["name"] == "test_tracing.check_repo"]
+        failed = next(span for span in children if self.attributes(span)["repo.name"] == "c")
+
+        self.assertEqual(len(children), 3)
+        self.assertNotIn("parentSpanId", root)
+        self.assertEqual({span["parentSpanId"] for span in children}, {root["spanId"]})
+        self.assertEqual({span["traceId"] for span in spans}, {root["traceId"]})
+        self.assertEqual(failed["status"]["code"], tracing.STATUS_CODE_ERROR)
+        self.assertIn("is broken", failed["status"]["message"])
+        self.assertEqual(len(root["traceId"]), 32)
+        self.assertEqual(len(root["spanId"]), 16)
+        self.assertLessEqual(int(root["startTimeUnixNano"]), int(root["endTimeUnixNano"]))
+        self.log_result(test_name, "3 calls, 2 in a thread pool", "children of 'fleet'", [span["name"] for span in spans])
+
+    def test_provision_trace(self):
+        test_name = "Provision Trace"
+        patches = record_cassettes.replay_patches()
+        for patcher in patches:
+            patcher.start()
+        record_cassettes.reset_clients()
+        try:
+            with use_cassette(Cassette(record_cassettes.cassette_path("provision_repo"))):
+                record_cassettes.step_provision_repo(self.work_dir)
+        finally:
+            for patcher in reversed(patches):
+                patcher.stop()
+            record_cassettes.reset_clients()
+
+        spans = self.exported_spans()
+        by_id = {span["spanId"]: span for span in spans}
+        roots = [span for span in spans if "parentSpanId" not in span]
+        http_spans = [span for span in spans if span["kind"] == SPAN_KIND_CLIENT]
+        create_repo = next(span for span in spans if span["name"] == "git_handler.create_repo_for_upload")
+
+        self.assertEqual([root["name"] for root in roots], ["main.provision_repo"])
+        self.assertEqual(self.attributes(roots[0])["repo.name"], record_cassettes.PIPELINE_REPO_NAME)
+        self.assertTrue(all(span["parentSpanId"] in by_id for span in spans if span is not roots[0]))
+        self.assertEqual(by_id[create_repo["parentSpanId"]]["name"], "step create_repo")
+        self.assertEqual(len(http_spans), 28)
+        self.assertIn("POST /repos/{owner}/{repo}/git/trees", {span["name"] for span in http_spans})
+        self.assertTrue(all(self.attributes(span)["server.address"] in ("github.test", "databricks.test") for span in http_spans))
+        self.log_result(test_name, "provision_repo cassette", "one trace, 28 HTTP spans", len(spans))
+
+
+if __name__ == "__main__":
+    unittest.main()